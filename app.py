@@ -1,5 +1,6 @@
 import os
 import time
+import click
 from flask import Flask, request, g, render_template
 from flask_wtf.csrf import CSRFProtect
 from flask_bootstrap import Bootstrap5
@@ -63,8 +64,14 @@ def create_app(config_name=None):
         # Store request start time for performance monitoring
         g.start_time = time.time()
 
+    @app.before_request
+    def sync_skill_catalog():
+        """Pick up skill catalog edits made by other workers"""
+        from services.skill.skill_service import sync_skill_catalog as _sync
+        _sync(app.config.get('SKILL_CATALOG_CHECK_INTERVAL', 2))
+
     # Register blueprints
-    from routes import main_bp, jobs_bp, templates_bp, skill_bp, user_bp, skill_category_bp, analytics_bp
+    from routes import main_bp, jobs_bp, templates_bp, skill_bp, user_bp, skill_category_bp, analytics_bp, health_bp
 
     app.register_blueprint(main_bp)
     app.register_blueprint(jobs_bp, url_prefix='/job')
@@ -73,6 +80,12 @@ def create_app(config_name=None):
     app.register_blueprint(skill_category_bp, url_prefix='/admin/categories')
     app.register_blueprint(user_bp, url_prefix='/user')
     app.register_blueprint(analytics_bp, url_prefix='/analytics')
+    app.register_blueprint(health_bp, url_prefix='/health')
+
+    # Register CLI commands
+    from commands import skills_cli
+
+    app.cli.add_command(skills_cli)
 
     # Add error handlers
     @app.errorhandler(404)
@@ -100,8 +113,25 @@ def create_app(config_name=None):
     with app.app_context():
         db.create_all()
 
+    if _serves_requests():
+        # Worker processes for background skill extraction (SKILL_EXTRACTION_WORKERS > 0)
+        from services.skill.extraction_executor import extraction_executor
+        extraction_executor.init_app(app)
+
+        # Load the NLP models off the request path so the first request doesn't pay for it.
+        # With a worker pool, saved jobs are extracted there: a second copy here would stay unused.
+        if app.config.get('SKILL_MODEL_WARMUP') and not extraction_executor.enabled:
+            from services.skill.skill_service import start_skill_warmup
+            start_skill_warmup(app)
+
     return app
 
+
+def _serves_requests() -> bool:
+    """False when the app is created for a `flask` CLI command other than `flask run`"""
+    ctx = click.get_current_context(silent=True)
+    return ctx is None or ctx.command.name == 'run'
+
 if __name__ == '__main__':
     # Set development environment if not specified
     os.environ.setdefault('FLASK_ENV', 'development')
@@ -0,0 +1,112 @@
+"""
+Benchmark the dashboard as the job table grows
+
+Grows a throwaway SQLite database of synthetic job applications through
+the given sizes and, at each size, times a dashboard request (one page of
+jobs, GROUP BY statistics and the DISTINCT country list) and records its
+peak Python memory. For comparison it also times loading every job twice,
+as the dashboard did before (filter_jobs plus get_all_jobs for the
+statistics).
+
+Usage:
+    python benchmarks/dashboard_benchmark.py [--sizes 1000,10000,100000] [--repeat 10]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Add the project root to the path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Read by config.py at import time: a scratch database, no warm-up thread or worker pool
+_DB_DIR = tempfile.mkdtemp()
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(_DB_DIR, 'dashboard_benchmark.db')}"
+os.environ.setdefault('SKILL_MODEL_WARMUP', 'false')
+os.environ.setdefault('SKILL_EXTRACTION_WORKERS', '0')
+
+from sqlalchemy import insert
+
+from app import create_app
+from models import ApplicationStatus, JobApplication, JobMode, db
+from services import JobService
+
+COUNTRIES = ['France', 'Germany', 'Spain', 'Portugal', 'Netherlands', 'Belgium', 'Italy', 'Ireland']
+WORDS = 'python kubernetes data pipeline team remote benefits platform reliable services design'.split()
+
+
+def add_jobs(count, rng):
+    statuses = [status.value for status in ApplicationStatus]
+    modes = [mode.value for mode in JobMode]
+    for start in range(0, count, 5000):
+        db.session.execute(insert(JobApplication), [
+            {
+                'company': f"Company {rng.randrange(5000)}",
+                'title': 'Engineer',
+                'description': ' '.join(rng.choices(WORDS, k=300)),
+                'status': rng.choice(statuses),
+                'job_mode': rng.choice(modes),
+                'country': rng.choice(COUNTRIES),
+            }
+            for _ in range(start, min(start + 5000, count))
+        ])
+    db.session.commit()
+
+
+def measure(run, repeat):
+    """Median milliseconds of run() and peak traced memory (MB) of one more run"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - started) * 1000)
+        db.session.remove()
+
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    db.session.remove()
+    return statistics.median(timings), peak / 2 ** 20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='1000,10000,100000', help='Comma-separated job table sizes')
+    parser.add_argument('--repeat', type=int, default=10, help='Timed runs per size')
+    args = parser.parse_args()
+    sizes = sorted(int(size) for size in args.sizes.split(','))
+
+    rng = random.Random(42)
+    app = create_app()
+    app.config['WTF_CSRF_ENABLED'] = False
+    client = app.test_client()
+
+    def dashboard():
+        response = client.get('/?status=Applied&page=2')
+        assert response.status_code == 200
+
+    def load_everything():
+        job_service = JobService()
+        job_service.filter_jobs(status_filter='Applied')
+        job_service.get_all_jobs()
+
+    print(f"{'jobs':>8} {'dashboard ms':>13} {'peak MB':>8} {'load-all ms':>12} {'peak MB':>8}")
+    total = 0
+    with app.app_context():
+        for size in sizes:
+            add_jobs(size - total, rng)
+            total = size
+            dashboard_ms, dashboard_mb = measure(dashboard, args.repeat)
+            load_ms, load_mb = measure(load_everything, max(1, args.repeat // 5))
+            print(f"{size:>8} {dashboard_ms:>13.1f} {dashboard_mb:>8.1f} {load_ms:>12.1f} {load_mb:>8.1f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
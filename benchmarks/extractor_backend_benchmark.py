@@ -0,0 +1,98 @@
+"""
+Benchmark the skill extractor backends on the same corpus
+
+Builds each backend, runs it over every document and reports build time,
+throughput and how many skills each found. The corpus is either the job
+descriptions in the application database or a directory of .txt/.md files.
+
+Usage:
+    python benchmarks/extractor_backend_benchmark.py [--corpus DIR] [--limit 200]
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+# Add the project root to the path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Read by config.py at import time: no warm-up thread or worker pool while benchmarking
+os.environ.setdefault('SKILL_MODEL_WARMUP', 'false')
+os.environ.setdefault('SKILL_EXTRACTION_WORKERS', '0')
+
+from app import create_app
+from configurations.skill_config import SkillExtractionConfig
+from exceptions.skill_exceptions import ModelNotLoadedError
+from models import JobApplication
+from services.skill.extractor_backends import BACKENDS
+from services.skill.skill_extractor import SkillExtractor
+
+
+def load_corpus(corpus_dir, limit):
+    """Read documents from a directory, or job descriptions from the database"""
+    if corpus_dir:
+        paths = sorted(glob.glob(os.path.join(corpus_dir, '*.txt')) + glob.glob(os.path.join(corpus_dir, '*.md')))
+        documents = []
+        for path in paths[:limit]:
+            with open(path, 'r', encoding='utf-8') as f:
+                documents.append(f.read())
+        return documents
+
+    rows = (JobApplication.query.with_entities(JobApplication.description)
+            .filter(JobApplication.description.isnot(None))
+            .order_by(JobApplication.id)
+            .limit(limit)
+            .all())
+    return [row.description for row in rows if row.description.strip()]
+
+
+def run_backend(name, documents):
+    """Build one backend and time it over the corpus"""
+    config_class = type(f'{name}Config', (SkillExtractionConfig,), {'EXTRACTOR_BACKEND': name})
+
+    started = time.perf_counter()
+    try:
+        extractor = SkillExtractor(config_class())
+    except ModelNotLoadedError as e:
+        print(f"  {name:<10} unavailable: {e}")
+        return None
+    build_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    results = [extractor.extract_skills_from_text(document) for document in documents]
+    run_seconds = time.perf_counter() - started
+
+    found = sum(len(result.skills) for result in results)
+    print(f"  {name:<10} build {build_seconds:7.2f}s   "
+          f"{run_seconds / len(documents) * 1000:8.2f} ms/doc   "
+          f"{len(documents) / run_seconds:8.1f} docs/s   {found} skills")
+    return run_seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--corpus', help='Directory of .txt/.md documents (default: job descriptions in the database)')
+    parser.add_argument('--limit', type=int, default=200, help='Maximum number of documents')
+    args = parser.parse_args()
+
+    app = create_app()
+
+    with app.app_context():
+        documents = load_corpus(args.corpus, args.limit)
+        if not documents:
+            print("No documents to benchmark")
+            return 1
+
+        print(f"{len(documents)} documents, "
+              f"{sum(len(d) for d in documents) / len(documents):.0f} characters on average")
+        timings = {name: run_backend(name, documents) for name in BACKENDS}
+
+    if all(timings.values()):
+        print(f"  catalog is {timings['skillner'] / timings['catalog']:.1f}x faster than skillner")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
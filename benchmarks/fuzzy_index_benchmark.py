@@ -0,0 +1,133 @@
+"""
+Benchmark the trigram fuzzy-match index on a large synthetic skill catalog
+
+Builds a TrigramIndex over synthetic skill names, then times queries for
+perturbed names (respaced, version suffixes, a dropped letter) and for
+names with no close match. Reports build time and retained memory, query
+latency percentiles, match counts, incremental add/remove latency, and the
+speed-up over scoring every name (checked to agree on which queries match).
+
+Usage:
+    python benchmarks/fuzzy_index_benchmark.py [--skills 50000] [--queries 2000] [--threshold 0.75]
+"""
+import argparse
+import gc
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+# Add the project root to the path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from services.skill.fuzzy_index import TrigramIndex, fuzzy_key, trigrams
+
+SYLLABLES = ('ka', 'zu', 'ter', 'ra', 'form', 'post', 'gres', 'ku', 'ber', 'net', 'es', 'lin', 'ux', 'py',
+             'thon', 'no', 'de', 'ja', 'va', 'script', 'mon', 'go', 'red', 'is', 'flu', 'ent', 'dock', 'er')
+SUFFIXES = ('', '', '', ' db', ' js', ' ml', ' sql', ' cloud', ' studio', ' server')
+
+
+def synthetic_names(count, rng):
+    names = set()
+    while len(names) < count:
+        word = ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+        names.add(word + rng.choice(SUFFIXES))
+    return sorted(names)
+
+
+def perturb(name, rng):
+    """A near-duplicate an extractor might return for name"""
+    choice = rng.randrange(3)
+    if choice == 0:
+        return name.replace(' ', '') if ' ' in name else name[:len(name) // 2] + ' ' + name[len(name) // 2:]
+    if choice == 1:
+        return f"{name} {rng.randint(1, 20)}.{rng.randint(0, 9)}"
+    position = rng.randrange(1, len(name))
+    return name[:position] + name[position + 1:]
+
+
+def brute_force(names, query, threshold):
+    """Score every name: the result the index must reproduce"""
+    grams = trigrams(fuzzy_key(query))
+    best, best_score = None, 0.0
+    for name in names:
+        other = trigrams(fuzzy_key(name))
+        score = len(grams & other) / len(grams | other)
+        if score > best_score:
+            best, best_score = name, score
+    return best if best_score >= threshold else None
+
+
+def percentiles(latencies_ms):
+    ordered = sorted(latencies_ms)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+    return f"p50 {pick(0.5):6.3f} ms, p95 {pick(0.95):6.3f} ms, p99 {pick(0.99):6.3f} ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--skills', type=int, default=50000, help='Number of synthetic skill names')
+    parser.add_argument('--queries', type=int, default=2000, help='Number of queries of each kind')
+    parser.add_argument('--threshold', type=float, default=0.75, help='Similarity threshold')
+    parser.add_argument('--brute-force', type=int, default=200, help='Queries checked against a full scan')
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    names = synthetic_names(args.skills, rng)
+
+    # Timed apart from the memory measurement, which tracemalloc slows down
+    gc.collect()
+    tracemalloc.start()
+    index = TrigramIndex(names, threshold=args.threshold)
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del index
+    started = time.perf_counter()
+    index = TrigramIndex(names, threshold=args.threshold)
+    build_ms = (time.perf_counter() - started) * 1000
+    print(f"{len(names)} skills: build {build_ms:.0f} ms, retained {retained / 1024 / 1024:.1f} MB "
+          f"({retained / len(names):.0f} bytes per skill)")
+
+    near = [perturb(rng.choice(names), rng) for _ in range(args.queries)]
+    misses = [''.join(rng.choice('bcdfghjklmnpqrstvwxz') for _ in range(rng.randint(5, 12)))
+              for _ in range(args.queries)]
+    for label, queries in (('near-duplicates', near), ('no close match', misses)):
+        latencies, matched = [], 0
+        for query in queries:
+            started = time.perf_counter()
+            matched += index.best_match(query) is not None
+            latencies.append((time.perf_counter() - started) * 1000)
+        print(f"  {label:<16} {matched}/{len(queries)} matched, {percentiles(latencies)}, "
+              f"mean {statistics.fmean(latencies):.3f} ms")
+
+    sample = near[:args.brute_force]
+    started = time.perf_counter()
+    expected = [brute_force(names, query, args.threshold) for query in sample]
+    scan_ms = (time.perf_counter() - started) * 1000 / len(sample)
+    started = time.perf_counter()
+    found = [index.best_match(query) for query in sample]
+    index_ms = (time.perf_counter() - started) * 1000 / len(sample)
+    # Ties may resolve to a different name with the same score
+    agree = sum((e is None) == (f is None) for e, f in zip(expected, found))
+    print(f"  full scan {scan_ms:.2f} ms per query vs index {index_ms:.3f} ms ({scan_ms / index_ms:.0f}x), "
+          f"same outcome for {agree}/{len(sample)}")
+
+    added = [f"{name} platform" for name in rng.sample(names, 1000)]
+    started = time.perf_counter()
+    for name in added:
+        index.add(name)
+    add_us = (time.perf_counter() - started) * 1e6 / len(added)
+    started = time.perf_counter()
+    for name in added:
+        index.remove(name)
+    remove_us = (time.perf_counter() - started) * 1e6 / len(added)
+    print(f"  incremental add {add_us:.1f} us, remove {remove_us:.1f} us per name")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""
+Benchmark OFFSET pagination against keyset (cursor) pagination of jobs
+
+Fills a throwaway SQLite database with synthetic job applications, then
+times reading a page at increasing depths, unfiltered and filtered by
+status, through get_jobs_paginated (OFFSET plus a COUNT on every page)
+and get_jobs_page (a cursor taken from the row before that page, without
+a total, with an exact one and with a cached one).
+
+Usage:
+    python benchmarks/job_pagination_benchmark.py [--jobs 100000] [--per-page 24] [--repeat 10]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Add the project root to the path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Read by config.py at import time: a scratch database, no warm-up thread or worker pool
+_DB_DIR = tempfile.mkdtemp()
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(_DB_DIR, 'pagination_benchmark.db')}"
+os.environ.setdefault('SKILL_MODEL_WARMUP', 'false')
+os.environ.setdefault('SKILL_EXTRACTION_WORKERS', '0')
+
+from sqlalchemy import insert
+
+from app import create_app
+from models import ApplicationStatus, JobApplication, db
+from services import JobService
+from utils.pagination import NEXT, encode_cursor
+
+DEPTHS = [1, 10, 100, 500, 4000]
+
+
+def add_jobs(count, rng):
+    statuses = [status.value for status in ApplicationStatus]
+    start = datetime(2020, 1, 1)
+    for offset in range(0, count, 5000):
+        db.session.execute(insert(JobApplication), [
+            {
+                'company': f"Company {i}",
+                'title': 'Engineer',
+                'description': 'A job description ' * 50,
+                'status': rng.choice(statuses),
+                # A few jobs share each timestamp, as after bulk imports
+                'last_update': start + timedelta(minutes=rng.randrange(count)),
+            }
+            for i in range(offset, min(offset + 5000, count))
+        ])
+    db.session.commit()
+
+
+def cursor_before(page, per_page, status_filter):
+    """Cursor of the row just before the given page, as the previous page would have returned (None past the end)"""
+    if page == 1:
+        return None
+    query = JobApplication.query
+    if status_filter:
+        query = query.filter(JobApplication.status == status_filter)
+    job = (query.order_by(JobApplication.last_update.desc(), JobApplication.id.desc())
+           .offset((page - 1) * per_page - 1).first())
+    if job is None:
+        return None
+    return encode_cursor(NEXT, [job.last_update.isoformat(), job.id])
+
+
+def median_ms(run, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - started) * 1000)
+        db.session.remove()
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--jobs', type=int, default=100000, help='Number of synthetic job applications')
+    parser.add_argument('--per-page', type=int, default=24, help='Jobs per page')
+    parser.add_argument('--repeat', type=int, default=10, help='Timed runs per measurement')
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    app = create_app()
+    with app.app_context():
+        add_jobs(args.jobs, rng)
+        job_service = JobService()
+        print(f"{args.jobs} jobs, {args.per_page} per page, median ms over {args.repeat} runs")
+
+        for status_filter in (None, ApplicationStatus.APPLIED.value):
+            print(f"\n{'status=' + status_filter if status_filter else 'unfiltered'}")
+            print(f"  {'page':>6} {'OFFSET+COUNT':>13} {'cursor':>8} {'cursor+exact total':>19} {'cursor+cached total':>19}")
+            for depth in DEPTHS:
+                cursor = cursor_before(depth, args.per_page, status_filter)
+                if cursor is None and depth > 1:
+                    break
+
+                def offset_page():
+                    job_service.get_jobs_paginated(page=depth, per_page=args.per_page, status_filter=status_filter,
+                                                   include_relationships=False)
+
+                def cursor_page(count=None):
+                    job_service.get_jobs_page(cursor=cursor, per_page=args.per_page, status_filter=status_filter,
+                                              include_relationships=False, count=count)
+
+                offset_ms = median_ms(offset_page, args.repeat)
+                cursor_ms = median_ms(cursor_page, args.repeat)
+                exact_ms = median_ms(lambda: cursor_page('exact'), args.repeat)
+                cursor_page('cached')  # fill the cache
+                cached_ms = median_ms(lambda: cursor_page('cached'), args.repeat)
+                print(f"  {depth:>6} {offset_ms:>13.2f} {cursor_ms:>8.2f} {exact_ms:>19.2f} {cached_ms:>19.2f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
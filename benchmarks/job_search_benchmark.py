@@ -0,0 +1,126 @@
+"""
+Benchmark dashboard job search with the FTS5 index against LIKE filters
+
+Fills a throwaway SQLite database with synthetic job applications (and a
+log note for some of them), then times a page of dashboard search results
+for a few queries, through the full-text index and through the LIKE
+fallback used on other engines. Also reports the time to index the
+existing rows and the size of the index.
+
+Usage:
+    python benchmarks/job_search_benchmark.py [--jobs 100000] [--repeat 20]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+# Add the project root to the path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Read by config.py at import time: a scratch database, no warm-up thread or worker pool
+_DB_DIR = tempfile.mkdtemp()
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(_DB_DIR, 'search_benchmark.db')}"
+os.environ.setdefault('SKILL_MODEL_WARMUP', 'false')
+os.environ.setdefault('SKILL_EXTRACTION_WORKERS', '0')
+
+from sqlalchemy import insert, text
+
+from app import create_app
+from models import JobApplication, JobLog, db
+from models.search import SEARCH_TABLES, rebuild_search_index
+from services import JobService
+from services.search_service import SearchService
+
+COMPANIES = ['Acme', 'Globex', 'Initech', 'Umbrella', 'Hooli', 'Stark Industries', 'Wayne Enterprises', 'Soylent']
+TITLES = ['Data Engineer', 'Backend Developer', 'Frontend Developer', 'DevOps Engineer', 'Data Scientist',
+          'Machine Learning Engineer', 'Site Reliability Engineer', 'Product Manager']
+SKILLS = ['Python', 'Java', 'Kubernetes', 'Docker', 'PostgreSQL', 'React', 'TypeScript', 'Spark', 'Airflow',
+          'Terraform', 'AWS', 'GCP', 'Kafka', 'Go', 'Rust', 'Scala', 'Snowflake', 'dbt', 'Elasticsearch']
+FILLER = ('we are looking for a motivated engineer to join our team and build reliable services '
+          'you will work with product and design on a modern stack in an agile environment with '
+          'strong ownership flexible hours remote friendly benefits package and learning budget').split()
+
+QUERIES = ['kubernetes', 'kube', '"data engineer"', 'snowflake dbt', 'recruiter']
+
+
+class LikeSearchService(SearchService):
+    """The fallback used without the full-text index"""
+    available = False
+
+
+def description(rng):
+    words = rng.choices(FILLER, k=rng.randint(150, 400))
+    for skill in rng.sample(SKILLS, 4):
+        words.insert(rng.randrange(len(words)), skill)
+    return ' '.join(words)
+
+
+def time_search(job_service, search_query, repeat):
+    timings = []
+    total = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        pagination = job_service.get_jobs_paginated(page=1, per_page=20, search_query=search_query)
+        timings.append((time.perf_counter() - started) * 1000)
+        total = pagination.total
+        db.session.expunge_all()
+    timings.sort()
+    return statistics.median(timings), timings[int(len(timings) * 0.95) - 1 if len(timings) > 1 else 0], total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--jobs', type=int, default=100000, help='Number of synthetic job applications')
+    parser.add_argument('--repeat', type=int, default=20, help='Timed runs per query')
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    app = create_app()
+    with app.app_context():
+        started = time.perf_counter()
+        for start in range(0, args.jobs, 5000):
+            db.session.execute(insert(JobApplication), [
+                {'company': rng.choice(COMPANIES), 'title': rng.choice(TITLES), 'description': description(rng)}
+                for _ in range(start, min(start + 5000, args.jobs))
+            ])
+        db.session.execute(insert(JobLog), [
+            {'job_id': job_id, 'note': f"Call with the recruiter about {rng.choice(SKILLS)}"}
+            for job_id in range(1, args.jobs + 1, 10)
+        ])
+        db.session.commit()
+        print(f"{args.jobs} jobs inserted and indexed by the triggers in {time.perf_counter() - started:.1f} s")
+
+        started = time.perf_counter()
+        rebuild_search_index(db.session.connection())
+        db.session.commit()
+        print(f"  full rebuild of the index: {time.perf_counter() - started:.1f} s")
+
+        pages = {
+            name: db.session.execute(text(f"SELECT COUNT(*) FROM dbstat WHERE name LIKE '{name}%'")).scalar()
+            for name in SEARCH_TABLES
+        } if db.session.execute(text("SELECT sqlite_compileoption_used('ENABLE_DBSTAT_VTAB')")).scalar() else {}
+        if pages:
+            page_size = db.session.execute(text("PRAGMA page_size")).scalar()
+            print(f"  index size: {sum(pages.values()) * page_size / 2 ** 20:.1f} MB")
+
+        fts_service = JobService()
+        like_service = JobService()
+        like_service.search_service = LikeSearchService()
+
+        print(f"\nFirst page of 20 results, median / p95 over {args.repeat} runs")
+        print(f"  {'query':<18} {'matches':>8} {'FTS5 ms':>16} {'LIKE ms':>18}")
+        for search_query in QUERIES:
+            fts_p50, fts_p95, fts_total = time_search(fts_service, search_query, args.repeat)
+            like_p50, like_p95, like_total = time_search(like_service, search_query, max(1, args.repeat // 5))
+            print(f"  {search_query:<18} {fts_total:>8} {fts_p50:>7.1f} / {fts_p95:>6.1f} "
+                  f"{like_p50:>8.1f} / {like_p95:>6.1f} ({like_total} matches)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
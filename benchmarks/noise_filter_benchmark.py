@@ -0,0 +1,90 @@
+"""
+Micro-benchmark for the skill noise filter
+
+Compares the compiled NoiseFilter with the previous per-call implementation
+(one regex search per noise pattern, noise set rebuilt on every call) on
+candidate skills sampled from token_dist.json.
+
+Usage:
+    python benchmarks/noise_filter_benchmark.py [--samples 5000] [--repeat 5]
+"""
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import timeit
+
+# Add the project root to the path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from configurations.skill_config import SkillExtractionConfig
+from utils.text_processing import NoiseFilter
+
+
+def legacy_is_noise_skill(skill, noise_patterns, common_words):
+    """The pre-NoiseFilter implementation, kept here as the baseline"""
+    skill_lower = skill.lower().strip() if skill else ""
+    if not skill_lower:
+        return True
+    if len(skill_lower) <= 2 and skill not in SkillExtractionConfig.ALLOWED_SHORT_SKILLS:
+        return True
+    if skill_lower.isdigit():
+        return True
+    noise_set = set(noise_patterns)
+    if skill_lower in noise_set:
+        return True
+    for pattern in noise_patterns:
+        if re.search(rf"\b{re.escape(pattern)}\b", skill_lower):
+            return True
+    skill_words = set(skill_lower.split())
+    if len(skill_words.intersection(common_words)) > len(skill_words) / 2:
+        return True
+    return False
+
+
+def build_samples(n_samples, seed=42):
+    """One- to three-token candidates from the token distribution, plus known noise"""
+    with open(os.path.join(ROOT, 'token_dist.json'), 'r', encoding='utf-8') as f:
+        tokens = list(json.load(f))
+
+    rng = random.Random(seed)
+    samples = [' '.join(rng.sample(tokens, rng.randint(1, 3))) for _ in range(n_samples)]
+    samples[::20] = [rng.choice(SkillExtractionConfig.NOISE_PATTERNS) for _ in samples[::20]]
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--samples', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    config = SkillExtractionConfig()
+    samples = build_samples(args.samples)
+    noise_filter = NoiseFilter.from_config(config)
+
+    legacy = [s for s in samples if not legacy_is_noise_skill(s, config.NOISE_PATTERNS, config.COMMON_WORDS)]
+    compiled = noise_filter.filter(samples)
+    assert legacy == compiled, "NoiseFilter disagrees with the legacy implementation"
+
+    def _legacy():
+        return [s for s in samples if not legacy_is_noise_skill(s, config.NOISE_PATTERNS, config.COMMON_WORDS)]
+
+    def _compiled():
+        return noise_filter.filter(samples)
+
+    legacy_time = min(timeit.repeat(_legacy, number=1, repeat=args.repeat))
+    compiled_time = min(timeit.repeat(_compiled, number=1, repeat=args.repeat))
+
+    print(f"{len(samples)} candidates, {len(config.NOISE_PATTERNS)} noise patterns, "
+          f"{len(samples) - len(compiled)} filtered as noise")
+    print(f"  {'legacy':<12}{legacy_time / len(samples) * 1e6:8.2f} us/skill")
+    print(f"  {'NoiseFilter':<12}{compiled_time / len(samples) * 1e6:8.2f} us/skill")
+    print(f"  {'speedup':<12}{legacy_time / compiled_time:8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
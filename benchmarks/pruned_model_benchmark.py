@@ -0,0 +1,127 @@
+"""
+Compare the configured spaCy model with a pruned copy from `flask skills prune-model`
+
+Each model is loaded by a SkillNER extractor in a fresh subprocess, which
+reports model load time, resident memory and the skills found in every
+document. Parity is how often the pruned model returns exactly the same
+skills, plus the overall Jaccard overlap of the skill sets.
+
+Usage:
+    python benchmarks/pruned_model_benchmark.py --pruned instance/spacy_pruned [--corpus DIR] [--limit 200]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+# Add the project root to the path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Read by config.py at import time: no warm-up thread or worker pool while benchmarking
+os.environ.setdefault('SKILL_MODEL_WARMUP', 'false')
+os.environ.setdefault('SKILL_EXTRACTION_WORKERS', '0')
+
+from app import create_app
+from benchmarks.extractor_backend_benchmark import load_corpus
+from benchmarks.skill_db_memory_benchmark import memory_kb
+
+
+def measure(model, corpus_path):
+    """Run in the subprocess: load SkillNER on one model and extract the corpus"""
+    from configurations.skill_config import SkillExtractionConfig
+    from services.skill.skill_extractor import SkillExtractor
+
+    with open(corpus_path, 'r', encoding='utf-8') as f:
+        documents = json.load(f)
+
+    baseline = memory_kb()
+    config_class = type('BenchmarkConfig', (SkillExtractionConfig,),
+                        {'SPACY_MODEL': model, 'EXTRACTOR_BACKEND': 'skillner'})
+    extractor = SkillExtractor(config_class())
+    loaded = memory_kb()
+
+    started = time.perf_counter()
+    skills = [result.skills for result in extractor.extract_skills_from_texts(documents)]
+    elapsed = time.perf_counter() - started
+
+    print(json.dumps({
+        'load_seconds': extractor.backend.load_seconds,
+        'rss_mb': (loaded['rss'] - baseline['rss']) / 1024,
+        'private_mb': (loaded['private'] - baseline['private']) / 1024 if loaded['private'] is not None else None,
+        'extract_seconds': elapsed,
+        'skills': skills,
+    }))
+
+
+def run_model(model, corpus_path):
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--measure', model, corpus_path],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pruned', help='Pruned model directory')
+    parser.add_argument('--baseline', default=None, help='Model to compare against (default: SKILL_SPACY_MODEL)')
+    parser.add_argument('--corpus', help='Directory of .txt/.md documents (default: job descriptions in the database)')
+    parser.add_argument('--limit', type=int, default=200, help='Maximum number of documents')
+    parser.add_argument('--measure', nargs=2, metavar=('MODEL', 'CORPUS'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        measure(*args.measure)
+        return 0
+    if not args.pruned:
+        parser.error('--pruned is required')
+
+    from configurations.skill_config import SkillExtractionConfig
+    baseline_model = args.baseline or SkillExtractionConfig.SPACY_MODEL
+
+    app = create_app()
+    with app.app_context():
+        documents = load_corpus(args.corpus, args.limit)
+    if not documents:
+        print("No documents to benchmark")
+        return 1
+
+    with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False, encoding='utf-8') as f:
+        json.dump(documents, f)
+        corpus_path = f.name
+
+    try:
+        results = {}
+        for label, model in (('baseline', baseline_model), ('pruned', args.pruned)):
+            try:
+                results[label] = run_model(model, corpus_path)
+            except subprocess.CalledProcessError as e:
+                print(f"  {label:<9} {model} failed to load:\n{e.stderr.strip().splitlines()[-1] if e.stderr else ''}")
+                return 1
+    finally:
+        os.remove(corpus_path)
+
+    print(f"{len(documents)} documents")
+    for label, model in (('baseline', baseline_model), ('pruned', args.pruned)):
+        data = results[label]
+        private = f", private +{data['private_mb']:.0f} MB" if data['private_mb'] is not None else ''
+        print(f"  {label:<9} model load {data['load_seconds']['model']:6.2f}s, "
+              f"RSS +{data['rss_mb']:.0f} MB{private}, extraction {data['extract_seconds']:.2f}s  ({model})")
+
+    identical = shared = union = 0
+    for baseline_skills, pruned_skills in zip(results['baseline']['skills'], results['pruned']['skills']):
+        baseline_set, pruned_set = set(baseline_skills), set(pruned_skills)
+        identical += baseline_set == pruned_set
+        shared += len(baseline_set & pruned_set)
+        union += len(baseline_set | pruned_set)
+    print(f"  parity: {identical}/{len(documents)} documents identical, "
+          f"skill Jaccard {shared / union if union else 1.0:.3f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
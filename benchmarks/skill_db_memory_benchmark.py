@@ -0,0 +1,142 @@
+"""
+Compare the memory cost of SkillNER's SKILL_DB as a dict and as a compact mmap
+
+Each variant is loaded in a fresh subprocess, which reports its resident
+set before loading, after loading and after reading every record (as
+SkillNER does while building its matchers). Private memory is what each
+extra worker costs; shared memory is page cache used by all of them.
+
+Usage:
+    python benchmarks/skill_db_memory_benchmark.py [--skill-db skill_db_relax_20.json]
+    python benchmarks/skill_db_memory_benchmark.py --synthetic 40000
+"""
+import argparse
+import json
+import os
+import random
+import string
+import subprocess
+import sys
+import tempfile
+
+# Add the project root to the path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from services.skill.compact_skill_db import CompactSkillDB
+
+
+def memory_kb():
+    """Resident, private and shared memory of this process in kB (Linux)"""
+    fields = {}
+    try:
+        with open('/proc/self/smaps_rollup') as f:
+            for line in f:
+                name, _, value = line.partition(':')
+                if value.strip().endswith('kB'):
+                    fields[name] = int(value.split()[0])
+    except OSError:
+        import resource
+        return {'rss': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, 'private': None, 'shared': None}
+
+    return {
+        'rss': fields.get('Rss', 0),
+        'private': fields.get('Private_Clean', 0) + fields.get('Private_Dirty', 0),
+        'shared': fields.get('Shared_Clean', 0) + fields.get('Shared_Dirty', 0),
+    }
+
+
+def measure(variant, path):
+    """Run in the subprocess: load one variant and print memory readings as JSON"""
+    readings = {'baseline': memory_kb()}
+
+    if variant == 'dict':
+        with open(path, 'r', encoding='utf-8') as f:
+            skills_db = json.load(f)
+    else:
+        skills_db = CompactSkillDB(path)
+    readings['loaded'] = memory_kb()
+
+    for key in skills_db:
+        record = skills_db[key]
+        record['high_surfce_forms']['full']
+        record['low_surface_forms']
+    readings['scanned'] = memory_kb()
+
+    print(json.dumps(readings))
+
+
+def synthetic_skill_db(count):
+    """Random records shaped like SKILL_DB entries"""
+    rng = random.Random(42)
+    words = [''.join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 10))) for _ in range(5000)]
+    skills_db = {}
+    for index in range(count):
+        tokens = rng.sample(words, rng.randint(1, 4))
+        full = ' '.join(tokens)
+        surface_forms = {'full': full}
+        if len(tokens) > 2:
+            surface_forms['abv'] = ''.join(token[0] for token in tokens)
+        skills_db[f"KS{index:018d}"] = {
+            'skill_name': full.title(),
+            'skill_type': rng.choice(['Hard Skill', 'Soft Skill', 'Certification']),
+            'skill_len': len(tokens),
+            'high_surfce_forms': surface_forms,
+            'low_surface_forms': [' '.join(tokens[:2])] if len(tokens) > 2 else [],
+            'match_on_tokens': len(tokens) > 1,
+        }
+    return skills_db
+
+
+def run_variant(variant, path):
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--measure', variant, path],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--skill-db', default='skill_db_relax_20.json', help="Path to skillNer's SKILL_DB JSON")
+    parser.add_argument('--synthetic', type=int, help='Benchmark a generated SKILL_DB with this many skills instead')
+    parser.add_argument('--measure', nargs=2, metavar=('VARIANT', 'PATH'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        measure(*args.measure)
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        json_path = args.skill_db
+        if args.synthetic:
+            json_path = os.path.join(tmp_dir, 'skill_db.json')
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump(synthetic_skill_db(args.synthetic), f)
+        elif not os.path.exists(json_path):
+            print(f"{json_path} not found (skillNer writes it to the working directory); try --synthetic")
+            return 1
+
+        with open(json_path, 'r', encoding='utf-8') as f:
+            skills_db = json.load(f)
+        compact_path = os.path.join(tmp_dir, 'skill_db.bin')
+        CompactSkillDB.build(compact_path, skills_db)
+
+        print(f"{len(skills_db)} skills: JSON {os.path.getsize(json_path) / 1024:.0f} kB, "
+              f"compact file {os.path.getsize(compact_path) / 1024:.0f} kB")
+        del skills_db
+
+        for variant, path in (('dict', json_path), ('compact', compact_path)):
+            readings = run_variant(variant, path)
+            baseline = readings['baseline']
+            for stage in ('loaded', 'scanned'):
+                delta = {name: (value - baseline[name]) if value is not None else None
+                         for name, value in readings[stage].items()}
+                print(f"  {variant:<8} {stage:<8} RSS +{delta['rss'] / 1024:7.1f} MB"
+                      + (f"   private +{delta['private'] / 1024:7.1f} MB   shared +{delta['shared'] / 1024:7.1f} MB"
+                         if delta['private'] is not None else ''))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
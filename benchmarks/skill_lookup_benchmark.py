@@ -0,0 +1,94 @@
+"""
+Benchmark building the skill lookup from ORM instances and from SkillRecords
+
+Fills a throwaway SQLite database with synthetic skills and variants, then
+times a lookup build and measures the memory it retains (tracemalloc),
+once with the previous approach (Skill/SkillVariant ORM instances, kept in
+the session) and once with SkillLookupService's column query into
+SkillRecords.
+
+Usage:
+    python benchmarks/skill_lookup_benchmark.py [--skills 20000] [--variants 2]
+"""
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Add the project root to the path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Read by config.py at import time: a scratch database, no warm-up thread or worker pool
+_DB_DIR = tempfile.mkdtemp()
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(_DB_DIR, 'lookup_benchmark.db')}"
+os.environ.setdefault('SKILL_MODEL_WARMUP', 'false')
+os.environ.setdefault('SKILL_EXTRACTION_WORKERS', '0')
+
+from sqlalchemy import insert
+
+from app import create_app
+from models import Skill, SkillVariant, db
+from services.skill.skill_lookup_service import SkillLookupService
+
+
+def legacy_build_lookup():
+    """The ORM-instance build this service used before SkillRecords"""
+    lookup = {}
+    with db.session.no_autoflush:
+        for skill in Skill.query.all():
+            lookup[skill.name.lower()] = skill
+            if skill.name.lower() != skill.name:
+                lookup[skill.name] = skill
+        for variant in SkillVariant.query.join(Skill).all():
+            lookup[variant.variant_name.lower()] = variant.skill
+            if variant.variant_name.lower() != variant.variant_name:
+                lookup[variant.variant_name] = variant.skill
+    return lookup
+
+
+def measure(build):
+    """Build time in ms and bytes still allocated once the build returns"""
+    db.session.expunge_all()
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = build()
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed_ms, retained
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--skills', type=int, default=20000, help='Number of synthetic skills')
+    parser.add_argument('--variants', type=int, default=2, help='Variants per skill')
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        db.session.execute(insert(Skill), [{'name': f"Skill {i}", 'is_blacklisted': False} for i in range(args.skills)])
+        db.session.execute(insert(SkillVariant), [
+            {'skill_id': skill_id, 'variant_name': f"skill-{skill_id}-v{v}"}
+            for skill_id in range(1, args.skills + 1) for v in range(args.variants)
+        ])
+        db.session.commit()
+
+        print(f"{args.skills} skills, {args.skills * args.variants} variants")
+        for label, build in (('ORM instances', legacy_build_lookup),
+                             ('SkillRecords', lambda: SkillLookupService())):
+            # Keep the result alive so its memory counts as retained
+            result, elapsed_ms, retained = measure(build)
+            print(f"  {label:<14} build {elapsed_ms:8.1f} ms, retained {retained / 1024 / 1024:6.1f} MB "
+                  f"({retained / args.skills:6.0f} bytes per skill)")
+            del result
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
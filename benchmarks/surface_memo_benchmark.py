@@ -0,0 +1,113 @@
+"""
+Benchmark normalization with and without the surface-form memo
+
+Fills a throwaway SQLite database with synthetic skills, then normalizes
+synthetic postings whose raw strings follow a skewed distribution (a few
+strings recur in most postings, as "Python" or "AWS" do), mixing exact
+matches, casing and spacing variants, unknown names and noise. Reports the
+time per posting without the memo, with a cold memo and with one warmed
+from the skill_surface_forms table, plus the memo hit rate.
+
+Usage:
+    python benchmarks/surface_memo_benchmark.py [--skills 20000] [--postings 2000] [--per-posting 30]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add the project root to the path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Read by config.py at import time: a scratch database, no warm-up thread or worker pool
+_DB_DIR = tempfile.mkdtemp()
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(_DB_DIR, 'memo_benchmark.db')}"
+os.environ.setdefault('SKILL_MODEL_WARMUP', 'false')
+os.environ.setdefault('SKILL_EXTRACTION_WORKERS', '0')
+
+from sqlalchemy import insert
+
+from app import create_app
+from configurations.skill_config import SkillExtractionConfig
+from models import Skill, db
+from services.skill.skill_lookup_service import SkillLookupService
+from services.skill.skill_normalizer import SkillNormalizer
+from services.skill.surface_memo import SurfaceFormMemo
+
+
+def raw_strings(names, count, rng):
+    """Distinct raw strings an extractor could return for the catalog"""
+    noise = ['years of experience', 'strong background', 'team environment', 'full time']
+    strings = set(noise)
+    while len(strings) < count:
+        name = rng.choice(names)
+        kind = rng.randrange(4)
+        if kind == 0:
+            strings.add(name.lower())
+        elif kind == 1:
+            strings.add(name.replace(' ', ''))
+        elif kind == 2:
+            strings.add(f"{name} {rng.randint(1, 9)}")
+        else:
+            strings.add(f"unknown tool {rng.randrange(count)}")
+    return sorted(strings)
+
+
+def normalize_all(normalizer, postings):
+    started = time.perf_counter()
+    hits = 0
+    for raw_skills in postings:
+        hits += normalizer.normalize_skills(raw_skills).memo_hits
+    return (time.perf_counter() - started) * 1000 / len(postings), hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--skills', type=int, default=20000, help='Number of synthetic skills')
+    parser.add_argument('--strings', type=int, default=5000, help='Distinct raw strings')
+    parser.add_argument('--postings', type=int, default=2000, help='Number of postings to normalize')
+    parser.add_argument('--per-posting', type=int, default=30, help='Raw strings per posting')
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    app = create_app()
+    with app.app_context():
+        names = [f"Skill Name {i}" for i in range(args.skills)]
+        db.session.execute(insert(Skill), [{'name': name, 'is_blacklisted': False} for name in names])
+        db.session.commit()
+
+        strings = raw_strings(names, args.strings, rng)
+        # Zipf-like: the first strings recur in most postings
+        weights = [1 / (rank + 1) for rank in range(len(strings))]
+        postings = [rng.choices(strings, weights, k=args.per_posting) for _ in range(args.postings)]
+        total = args.postings * args.per_posting
+
+        config = SkillExtractionConfig()
+        lookup = SkillLookupService()
+        print(f"{args.skills} skills, {len(strings)} distinct strings, {args.postings} postings")
+
+        elapsed, _ = normalize_all(SkillNormalizer(lookup, config), postings)
+        print(f"  no memo     {elapsed:7.3f} ms per posting")
+
+        memo = SurfaceFormMemo(lookup, config)
+        memo.clear()
+        elapsed, hits = normalize_all(SkillNormalizer(lookup, config, memo=memo), postings)
+        print(f"  cold memo   {elapsed:7.3f} ms per posting, {hits / total:.1%} memo hits")
+
+        started = time.perf_counter()
+        stored = memo.persist()
+        persist_ms = (time.perf_counter() - started) * 1000
+        started = time.perf_counter()
+        warmed = SurfaceFormMemo(lookup, config)
+        warm_ms = (time.perf_counter() - started) * 1000
+        elapsed, hits = normalize_all(SkillNormalizer(lookup, config, memo=warmed), postings)
+        print(f"  warm memo   {elapsed:7.3f} ms per posting, {hits / total:.1%} memo hits "
+              f"({stored} outcomes stored in {persist_ms:.0f} ms, loaded {len(warmed)} in {warm_ms:.0f} ms)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
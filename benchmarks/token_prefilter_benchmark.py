@@ -0,0 +1,99 @@
+"""
+Measure what the token_dist.json prefilter drops, and what it costs in recall
+
+For every document the prefilter's dropped characters are counted. When
+SkillNER can be loaded, each document is also extracted with and without
+the prefilter to report the time saved and recall: the share of skills
+found on the full text that are still found on the filtered text.
+
+Usage:
+    python benchmarks/token_prefilter_benchmark.py [--corpus DIR] [--limit 200] [--min-count 1]
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add the project root to the path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Read by config.py at import time: no warm-up thread or worker pool while benchmarking
+os.environ.setdefault('SKILL_MODEL_WARMUP', 'false')
+os.environ.setdefault('SKILL_EXTRACTION_WORKERS', '0')
+
+from app import create_app
+from configurations.skill_config import SkillExtractionConfig
+from exceptions.skill_exceptions import ModelNotLoadedError
+from services.skill.skill_extractor import SkillExtractor
+from services.skill.token_prefilter import TokenPrefilter
+
+from extractor_backend_benchmark import load_corpus
+
+
+def measure_drop(prefilter, documents):
+    """Characters the prefilter removes across the corpus"""
+    total = sum(len(document) for document in documents)
+    started = time.perf_counter()
+    dropped = sum(prefilter.filter(document)[1] for document in documents)
+    elapsed = time.perf_counter() - started
+
+    print(f"  vocabulary     {len(prefilter)} tokens")
+    print(f"  dropped        {dropped} of {total} characters ({dropped / total:.1%})")
+    print(f"  filter time    {elapsed / len(documents) * 1000:.3f} ms/doc")
+
+
+def measure_recall(config_class, documents):
+    """Compare SkillNER results with and without the prefilter"""
+    try:
+        backend = SkillExtractor(config_class()).backend
+    except ModelNotLoadedError as e:
+        print(f"  recall         skipped, SkillNER unavailable: {e}")
+        return
+
+    timings, found = {}, {}
+    for enabled in (False, True):
+        variant = type('PrefilterConfig', (config_class,), {'TOKEN_PREFILTER': enabled})
+        extractor = SkillExtractor(variant(), backend=backend)
+        started = time.perf_counter()
+        found[enabled] = [set(extractor.extract_skills_from_text(document).skills) for document in documents]
+        timings[enabled] = time.perf_counter() - started
+
+    expected = sum(len(skills) for skills in found[False])
+    kept = sum(len(full & filtered) for full, filtered in zip(found[False], found[True]))
+    lost = sorted(set().union(*(full - filtered for full, filtered in zip(found[False], found[True]))))
+
+    print(f"  extraction     {timings[False]:.2f}s unfiltered, {timings[True]:.2f}s filtered")
+    print(f"  recall         {kept / expected:.2%} ({kept} of {expected} skills)" if expected else "  recall         n/a")
+    if lost:
+        print(f"  lost skills    {', '.join(lost[:20])}{' ...' if len(lost) > 20 else ''}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--corpus', help='Directory of .txt/.md documents (default: job descriptions in the database)')
+    parser.add_argument('--limit', type=int, default=200, help='Maximum number of documents')
+    parser.add_argument('--min-count', type=int, default=SkillExtractionConfig.TOKEN_PREFILTER_MIN_COUNT,
+                        help='Minimum token frequency that keeps a sentence')
+    args = parser.parse_args()
+
+    config_class = type('BenchmarkConfig', (SkillExtractionConfig,), {
+        'EXTRACTOR_BACKEND': 'skillner',
+        'TOKEN_PREFILTER_MIN_COUNT': args.min_count,
+    })
+
+    app = create_app()
+    with app.app_context():
+        documents = load_corpus(args.corpus, args.limit)
+    if not documents:
+        print("No documents to benchmark")
+        return 1
+
+    print(f"{len(documents)} documents, min count {args.min_count}")
+    measure_drop(TokenPrefilter.from_config(config_class), documents)
+    measure_recall(config_class, documents)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,7 @@
+# Flask CLI commands package
+
+from .skill_commands import skills_cli
+
+__all__ = [
+    'skills_cli',
+]
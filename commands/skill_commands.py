@@ -0,0 +1,193 @@
+"""
+Flask CLI commands for skill maintenance
+
+Usage:
+    flask skills reextract --processes 4 --batch-size 200
+    flask skills cache --clear
+    flask skills snapshot
+    flask skills prune-model --output instance/spacy_pruned
+    flask skills sidecar --socket /run/jobapp/skills.sock
+"""
+import os
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+
+skills_cli = AppGroup('skills', help='Skill catalogue and extraction commands.')
+
+
+@skills_cli.command('reextract')
+@click.option('--batch-size', default=200, show_default=True, type=click.IntRange(min=1),
+              help='Jobs loaded, extracted and written per batch.')
+@click.option('--processes', '-n', 'n_process', default=1, show_default=True, type=click.IntRange(min=1),
+              help='Extraction worker processes (each loads its own NLP models).')
+@click.option('--checkpoint', type=click.Path(dir_okay=False), default=None,
+              help='Checkpoint file (default: <instance>/skill_reextract_checkpoint.json).')
+@click.option('--restart', is_flag=True, help='Ignore an existing checkpoint and start from the first job.')
+def reextract(batch_size, n_process, checkpoint, restart):
+    """Re-extract skills for every job and sync the JobSkill links."""
+    from services.skill.skill_reextraction_service import SkillReextractionService
+
+    checkpoint = checkpoint or os.path.join(current_app.instance_path, 'skill_reextract_checkpoint.json')
+
+    def _report(stats):
+        click.echo(f"  {stats['jobs_processed']} jobs done (last id {stats['last_job_id']}) "
+                   f"- {stats['jobs_per_second']} jobs/s")
+
+    service = SkillReextractionService(checkpoint, batch_size=batch_size, n_process=n_process)
+    stats = service.run(resume=not restart, progress=_report)
+
+    click.echo(
+        f"Re-extracted {stats['jobs_processed']} jobs ({stats['jobs_failed']} failed): "
+        f"+{stats['links_added']} / -{stats['links_removed']} links, "
+        f"{stats['skills_created']} new skills, {stats['cache_hits']} cache hits, "
+        f"{stats['jobs_per_second']} jobs/s over {stats['elapsed_seconds']}s"
+    )
+
+
+@skills_cli.command('cache')
+@click.option('--clear', is_flag=True, help='Remove every cached extraction result.')
+def cache(clear):
+    """Show (or clear) the extraction result cache."""
+    from services.skill.skill_service import get_skill_service
+
+    extraction_cache = get_skill_service().extraction_cache
+    if clear:
+        deleted = extraction_cache.clear()
+        click.echo(f"Cleared {deleted} cached extraction results")
+        return
+
+    stats = extraction_cache.stats()
+    click.echo(
+        f"{stats['size']} / {stats['max_entries']} entries (config {stats['config_version']}), "
+        f"{stats['hits']} hits, {stats['misses']} misses in this process"
+    )
+
+
+@skills_cli.command('memo')
+@click.option('--clear', is_flag=True, help='Remove every stored normalization outcome.')
+def memo(clear):
+    """Show (or clear) the memo of raw skill strings to normalization outcomes."""
+    from services.skill.skill_service import get_skill_service
+
+    surface_memo = get_skill_service().surface_memo
+    if clear:
+        deleted = surface_memo.clear()
+        click.echo(f"Cleared {deleted} stored normalization outcomes")
+        return
+
+    stats = surface_memo.stats()
+    click.echo(
+        f"{stats['entries']} / {stats['max_entries']} in memory, {stats['stored']} stored "
+        f"(config {stats['config_version']}), {stats['hits']} hits, {stats['misses']} misses in this process"
+    )
+
+
+@skills_cli.command('snapshot')
+def snapshot():
+    """Rebuild the SkillNER matcher and skill lookup snapshots and compare start-up times."""
+    from configurations.skill_config import SkillExtractionConfig
+    from exceptions.skill_exceptions import ModelNotLoadedError
+    from services.skill.compact_skill_db import SKILLNER_SKILL_DB_FILE, skill_db_fingerprint
+    from services.skill.extractor_backends import SkillNerBackend
+    from services.skill.nlp_snapshot import SkillNerSnapshot
+    from services.skill.skill_lookup_service import SkillLookupService
+
+    config = SkillExtractionConfig()
+    if not config.NLP_SNAPSHOT_DIR:
+        raise click.ClickException('NLP snapshots are disabled (SKILL_NLP_SNAPSHOT_DIR is empty).')
+
+    try:
+        cold = SkillNerBackend(config, use_snapshot=False)
+        skills_db = cold.skill_extractor.skills_db
+        nlp_snapshot = SkillNerSnapshot(config.NLP_SNAPSHOT_DIR, cold.nlp, skills_db,
+                                        skill_db_fingerprint(skills_db, SKILLNER_SKILL_DB_FILE))
+        if not nlp_snapshot.supported:
+            raise click.ClickException(f"skillNer {nlp_snapshot.manifest['skillner']} cannot be restored from a snapshot.")
+        if not nlp_snapshot.save(cold.skill_extractor.matchers):
+            raise click.ClickException(f'Could not write {nlp_snapshot.path}.')
+
+        warm = SkillNerBackend(config)
+    except ModelNotLoadedError as e:
+        raise click.ClickException(str(e))
+
+    click.echo(f"Snapshot written to {nlp_snapshot.path}")
+    for label, backend in (('without snapshot', cold), ('with snapshot', warm)):
+        click.echo(f"  {label:<17} model {backend.load_seconds['model']:6.2f}s, "
+                   f"matchers {backend.load_seconds['matchers']:6.2f}s ({backend.matcher_source})")
+
+    # A refresh reads the database and overwrites the lookup snapshot
+    cold_lookup = SkillLookupService(config.NLP_SNAPSHOT_DIR)
+    cold_lookup.refresh()
+    warm_lookup = SkillLookupService(config.NLP_SNAPSHOT_DIR)
+    for label, lookup in (('without snapshot', cold_lookup), ('with snapshot', warm_lookup)):
+        click.echo(f"  {label:<17} skill lookup {lookup.load_seconds:6.2f}s ({lookup.source})")
+
+
+@skills_cli.command('prune-model')
+@click.option('--output', type=click.Path(file_okay=False), default=None,
+              help='Directory for the derived model (default: <instance>/spacy_pruned).')
+@click.option('--keep-top', default=20000, show_default=True, type=click.IntRange(min=0),
+              help='Most frequent vector rows kept in addition to the skill vocabulary.')
+@click.option('--no-remap', is_flag=True, help='Drop discarded words instead of mapping them to their nearest kept vector.')
+def prune_model(output, keep_top, no_remap):
+    """Write a copy of the spaCy model with pruned, memory-mappable vectors."""
+    from configurations.skill_config import SkillExtractionConfig
+    from models import Skill, SkillVariant
+    from services.skill.pruned_model import build_pruned_model, collect_vocabulary
+
+    config = SkillExtractionConfig()
+    output = output or os.path.join(current_app.instance_path, 'spacy_pruned')
+    terms = [name for (name,) in Skill.query.with_entities(Skill.name)]
+    terms += [name for (name,) in SkillVariant.query.with_entities(SkillVariant.variant_name)]
+    vocabulary = collect_vocabulary(config.TOKEN_DIST_PATH, terms)
+
+    try:
+        stats = build_pruned_model(config.SPACY_MODEL, output, vocabulary, keep_top=keep_top, remap=not no_remap)
+    except OSError as e:
+        raise click.ClickException(f"Could not load '{config.SPACY_MODEL}': {e}")
+
+    click.echo(
+        f"Wrote {output}: {stats['rows_after']} / {stats['rows_before']} vector rows "
+        f"({len(vocabulary)} vocabulary words, {stats['remapped_keys']} words remapped), "
+        f"removed components: {', '.join(stats['removed_components']) or 'none'}"
+    )
+    click.echo(f"Use it with SKILL_SPACY_MODEL={output}; compare with "
+               f"python benchmarks/pruned_model_benchmark.py --pruned {output}")
+
+
+@skills_cli.command('sidecar')
+@click.option('--socket', 'socket_path', default=None,
+              help='Unix socket to listen on (default: SKILL_EXTRACTION_SIDECAR).')
+def sidecar(socket_path):
+    """Serve skill extraction to web workers over a Unix socket."""
+    from configurations.skill_config import SkillExtractionConfig
+    from exceptions.skill_exceptions import ModelNotLoadedError
+    from services.skill.extraction_sidecar import ExtractionSidecarServer
+    from services.skill.skill_extractor import SkillExtractor
+
+    socket_path = socket_path or current_app.config.get('SKILL_EXTRACTION_SIDECAR')
+    if not socket_path:
+        raise click.ClickException('Pass --socket or set SKILL_EXTRACTION_SIDECAR.')
+
+    try:
+        extractor = SkillExtractor(SkillExtractionConfig())
+    except ModelNotLoadedError as e:
+        raise click.ClickException(str(e))
+
+    app = current_app._get_current_object()
+
+    def _reload_vocabulary():
+        # Handler threads have no app context; the catalog backend reads the database
+        with app.app_context():
+            extractor.reload_vocabulary()
+
+    server = ExtractionSidecarServer(socket_path, extractor, reload_vocabulary=_reload_vocabulary)
+    click.echo(f"Skill extraction sidecar listening on {socket_path}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
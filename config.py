@@ -24,6 +24,10 @@ class Config:
 
     # Application settings
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file upload
+    # Job cards per dashboard page
+    DASHBOARD_PER_PAGE = int(os.environ.get('DASHBOARD_PER_PAGE', 24))
+    # Seconds a job count is reused for the dashboard and `count=cached` listings (0 = recount every page)
+    JOB_COUNT_CACHE_SECONDS = int(os.environ.get('JOB_COUNT_CACHE_SECONDS', 60))
 
     # LaTeX compilation timeout
     LATEX_TIMEOUT = 60  # seconds
@@ -35,6 +39,23 @@ class Config:
     # Security settings
     SEND_FILE_MAX_AGE_DEFAULT = timedelta(hours=1)
 
+    # Skill extraction: load NLP models in a background thread at startup
+    SKILL_MODEL_WARMUP = os.environ.get('SKILL_MODEL_WARMUP', 'true').lower() == 'true'
+    # Worker processes for background skill extraction on job save (0 = extract inline).
+    # Each loads its own copy of the NLP models, so the web process skips its warm-up then.
+    SKILL_EXTRACTION_WORKERS = int(os.environ.get('SKILL_EXTRACTION_WORKERS', 0))
+    # Cached extraction results kept in the database, evicted LRU (0 = disabled)
+    SKILL_EXTRACTION_CACHE_SIZE = int(os.environ.get('SKILL_EXTRACTION_CACHE_SIZE', 5000))
+    # Unix socket of a shared extraction sidecar (`flask skills sidecar`); unset = load models in-process
+    SKILL_EXTRACTION_SIDECAR = os.environ.get('SKILL_EXTRACTION_SIDECAR')
+    SKILL_EXTRACTION_SIDECAR_TIMEOUT = float(os.environ.get('SKILL_EXTRACTION_SIDECAR_TIMEOUT', 60))
+    # Batch extraction API: documents accepted per request, and processed per streamed chunk
+    SKILL_BATCH_MAX_DOCUMENTS = int(os.environ.get('SKILL_BATCH_MAX_DOCUMENTS', 1000))
+    SKILL_BATCH_CHUNK_SIZE = int(os.environ.get('SKILL_BATCH_CHUNK_SIZE', 32))
+
+    # Seconds between checks of the skill catalog version for other workers' edits (0 = every request)
+    SKILL_CATALOG_CHECK_INTERVAL = float(os.environ.get('SKILL_CATALOG_CHECK_INTERVAL', 2))
+
     ## Logging configuration (centralized)
     LOG_FOLDER = os.path.join(os.getcwd(), 'logs')
     LOG_LEVEL = logging.INFO
@@ -93,6 +114,8 @@ class TestingConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
     WTF_CSRF_ENABLED = False  # Disable CSRF for testing
+    SKILL_MODEL_WARMUP = False  # Don't load NLP models in tests
+    SKILL_EXTRACTION_WORKERS = 0  # Extract inline so tests are deterministic
 
     # Testing-specific logging
     LOG_LEVEL = logging.WARNING  # Reduce log noise in tests
@@ -1,9 +1,56 @@
+import hashlib
+import os
 from typing import ClassVar, Tuple, FrozenSet
 
 class SkillExtractionConfig:
     """Configuration for skill extraction and processing"""
     
-    SPACY_MODEL: ClassVar[str] = "en_core_web_lg"
+    # Package name or model directory, e.g. one written by `flask skills prune-model`
+    SPACY_MODEL: ClassVar[str] = os.environ.get('SKILL_SPACY_MODEL', "en_core_web_lg")
+
+    # Matching backend: "skillner" (generic SKILL_DB) or "catalog" (our Skill/SkillVariant tables)
+    EXTRACTOR_BACKEND: ClassVar[str] = os.environ.get('SKILL_EXTRACTOR_BACKEND', 'skillner')
+
+    # Where SkillNER's built matchers and the skill lookup's rows are snapshotted for fast start-up ("" disables)
+    NLP_SNAPSHOT_DIR: ClassVar[str] = os.environ.get(
+        'SKILL_NLP_SNAPSHOT_DIR',
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'instance', 'nlp_snapshot')
+    )
+
+    # Extract each '#### ' section of a description separately, caching results per section
+    SECTION_CHUNKING: ClassVar[bool] = os.environ.get('SKILL_SECTION_CHUNKING', 'true').lower() == 'true'
+
+    # Which parts of a description are annotated: "full" or "requirements"
+    # (only sections likely to list skills; see services/skill/section_targeting.py)
+    EXTRACTION_SCOPE: ClassVar[str] = os.environ.get('SKILL_EXTRACTION_SCOPE', 'full')
+
+    # Drop sentences with no token from SkillNER's vocabulary (token_dist.json) before matching
+    TOKEN_PREFILTER: ClassVar[bool] = os.environ.get('SKILL_TOKEN_PREFILTER', 'false').lower() == 'true'
+    TOKEN_DIST_PATH: ClassVar[str] = os.environ.get(
+        'SKILL_TOKEN_DIST_PATH',
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'token_dist.json')
+    )
+    # Tokens occurring in fewer skills than this do not keep a sentence
+    TOKEN_PREFILTER_MIN_COUNT: ClassVar[int] = int(os.environ.get('SKILL_TOKEN_PREFILTER_MIN_COUNT', 1))
+
+    # Texts tokenized per nlp.pipe() call when extracting several at once
+    PIPE_BATCH_SIZE: ClassVar[int] = 32
+
+    # Serve SKILL_DB from a memory-mapped file in NLP_SNAPSHOT_DIR, shared by all workers on the host
+    COMPACT_SKILL_DB: ClassVar[bool] = os.environ.get('SKILL_COMPACT_DB', 'true').lower() == 'true'
+
+    # Map names with no exact match to the most similar catalog skill (see services/skill/fuzzy_index.py)
+    FUZZY_MATCHING: ClassVar[bool] = os.environ.get('SKILL_FUZZY_MATCHING', 'true').lower() == 'true'
+    # Minimum trigram Jaccard similarity, and minimum name length once separators are removed
+    FUZZY_MATCH_THRESHOLD: ClassVar[float] = float(os.environ.get('SKILL_FUZZY_MATCH_THRESHOLD', 0.75))
+    FUZZY_MIN_LENGTH: ClassVar[int] = 4
+
+    # Raw skill strings whose normalization outcome is kept in memory, and persisted
+    # to warm new processes (see services/skill/surface_memo.py; 0 disables)
+    SURFACE_MEMO_SIZE: ClassVar[int] = int(os.environ.get('SKILL_SURFACE_MEMO_SIZE', 20000))
+
+    # Bump when extraction logic changes so cached results are not reused
+    EXTRACTION_VERSION: ClassVar[int] = 1
     MIN_SKILL_LENGTH: ClassVar[int] = 2
 
     ALLOWED_SHORT_SKILLS: ClassVar[FrozenSet[str]] = frozenset({
@@ -42,4 +89,36 @@ class SkillExtractionConfig:
         'exposure to', 'some experience', 'hands on experience'
     )
     
-    COMMON_WORDS: ClassVar[FrozenSet[str]] = frozenset({'the', 'and', 'or', 'of', 'in', 'to', 'for', 'with', 'on', 'at', 'by', 'from'})
\ No newline at end of file
+    # Section header keywords for the "requirements" extraction scope (prefixes, case-insensitive)
+    SKILL_SECTION_KEYWORDS: ClassVar[Tuple[str, ...]] = (
+        'requirement', 'qualification', 'skill', 'experience', 'expertise', 'knowledge', 'competenc',
+        'what you bring', "what you'll bring", 'what you will bring', 'what you need', "what you'll need",
+        'what we are looking for', "what we're looking for", 'looking for', 'who you are', 'about you',
+        'you have', 'must have', 'nice to have', 'preferred', 'bonus', 'tech stack', 'technolog', 'tools',
+        'responsibilit', 'what you will do', "what you'll do", 'the role', 'your role', 'profile',
+    )
+    BOILERPLATE_SECTION_KEYWORDS: ClassVar[Tuple[str, ...]] = (
+        'benefit', 'perks', 'what we offer', 'we offer', 'why join', 'why work', 'about us', 'about the company',
+        'who we are', 'our company', 'our mission', 'our values', 'our culture', 'culture', 'mission',
+        'equal opportunit', 'equal employment', 'diversity', 'eeo', 'compensation', 'salary', 'pay range',
+        'how to apply', 'application process', 'hiring process', 'interview process', 'privacy', 'disclaimer',
+    )
+    
+    COMMON_WORDS: ClassVar[FrozenSet[str]] = frozenset({'the', 'and', 'or', 'of', 'in', 'to', 'for', 'with', 'on', 'at', 'by', 'from'})
+
+    @classmethod
+    def version(cls) -> str:
+        """Short fingerprint of every setting that affects extracted skills"""
+        fingerprint = repr((
+            cls.EXTRACTION_VERSION,
+            cls.EXTRACTOR_BACKEND,
+            cls.SPACY_MODEL,
+            cls.SECTION_CHUNKING,
+            cls.TOKEN_PREFILTER,
+            cls.TOKEN_PREFILTER_MIN_COUNT,
+            cls.MIN_SKILL_LENGTH,
+            sorted(cls.ALLOWED_SHORT_SKILLS),
+            cls.NOISE_PATTERNS,
+            sorted(cls.COMMON_WORDS),
+        ))
+        return hashlib.sha256(fingerprint.encode('utf-8')).hexdigest()[:16]
@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from models import JobApplication
+
+@dataclass
+class JobPage:
+    """One page of job applications from keyset pagination"""
+    items: List[JobApplication]
+    per_page: int
+    next_cursor: Optional[str] = None  # None on the last page
+    prev_cursor: Optional[str] = None  # None on the first page
+    total: Optional[int] = None  # matching jobs, if counted
+    total_is_cached: bool = False  # counted up to JOB_COUNT_CACHE_SECONDS ago
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    @property
+    def has_prev(self) -> bool:
+        return self.prev_cursor is not None
+
+    @staticmethod
+    def job_to_dict(job: JobApplication) -> Dict[str, Any]:
+        return {
+            'id': job.id,
+            'company': job.company,
+            'title': job.title,
+            'status': job.status,
+            'job_mode': job.job_mode,
+            'country': job.country,
+            'office_location': job.office_location,
+            'url': job.url,
+            'last_update': job.last_update.isoformat() if job.last_update else None,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'jobs': [self.job_to_dict(job) for job in self.items],
+            'per_page': self.per_page,
+            'next_cursor': self.next_cursor,
+            'prev_cursor': self.prev_cursor,
+            'total': self.total,
+            'total_is_cached': self.total_is_cached,
+        }
@@ -1,8 +1,34 @@
-from dataclasses import dataclass
-from typing import List, Optional, Dict
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Dict
 
 from models import Skill
 
+@dataclass(frozen=True, slots=True)
+class SkillRecord:
+    """Immutable snapshot of a Skill row, safe to share across requests and sessions"""
+    id: int
+    name: str
+    category_id: Optional[int] = None
+    is_blacklisted: bool = False
+
+    @classmethod
+    def from_skill(cls, skill: Skill) -> 'SkillRecord':
+        return cls(skill.id, skill.name, skill.category_id, bool(skill.is_blacklisted))
+
+@dataclass(frozen=True, slots=True)
+class SurfaceFormOutcome:
+    """What normalization makes of one raw skill string"""
+    name: str  # after casing rules
+    skill: Optional[SkillRecord] = None
+    noise: bool = False
+    fuzzy: bool = False
+
+    @property
+    def outcome(self) -> str:
+        if self.noise:
+            return 'noise'
+        return 'skill' if self.skill is not None else 'unmatched'
+
 @dataclass
 class ExtractedSkillsResult:
     """Result from skill extraction process"""
@@ -10,22 +36,61 @@ class ExtractedSkillsResult:
     total_skills: int
     success: bool
     error: Optional[str] = None
+    stage_timings: Dict[str, float] = field(default_factory=dict)  # milliseconds per stage
+    text_length: int = 0
+    candidate_count: int = 0  # backend matches before noise filtering
+    prefilter_dropped_chars: int = 0  # characters the token prefilter kept from the matcher
 
 @dataclass
 class NormalizedSkillsResult:
     """Result from skill normalization process"""
-    normalized_skills: List[Skill]  # SQLAlchemy Skill objects
+    normalized_skills: List[SkillRecord]
     unmatched_skills: List[str] 
     success: bool
     error: Optional[str] = None
+    fuzzy_matches: Dict[str, str] = field(default_factory=dict)  # extracted name -> canonical name
+    fuzzy_ms: float = 0.0  # time spent in fuzzy lookups
+    memo_hits: int = 0  # raw strings resolved from the surface-form memo
+
+    @property
+    def skill_ids(self) -> List[int]:
+        return [skill.id for skill in self.normalized_skills]
 
 @dataclass
 class ProcessedSkillsResult:
     """Complete skill processing result"""
     extracted_skills: List[str]
-    normalized_skills: List[Skill]  # SQLAlchemy Skill objects
+    normalized_skills: List[SkillRecord]
     unmatched_skills: List[str]
-    categorized_skills: Dict[str, List[Skill]]
+    categorized_skills: Dict[str, List[SkillRecord]]
     total_skills: int
     success: bool
     error: Optional[str] = None
+    stage_timings: Dict[str, float] = field(default_factory=dict)  # milliseconds per stage
+    counters: Dict[str, int] = field(default_factory=dict)  # text length, match and unmatched counts
+    fuzzy_matches: Dict[str, str] = field(default_factory=dict)  # extracted name -> canonical name
+    memo_hits: int = 0
+
+    @property
+    def skill_ids(self) -> List[int]:
+        """IDs of the normalized skills (fetch rows with SkillService.get_skills_by_ids)"""
+        return [skill.id for skill in self.normalized_skills]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form used by the extraction API"""
+        if not self.success:
+            return {'success': False, 'error': self.error}
+
+        return {
+            'success': True,
+            'extracted_skills': self.extracted_skills,
+            'normalized_skills': [{'id': s.id, 'name': s.name} for s in self.normalized_skills],
+            'unmatched_skills': self.unmatched_skills,
+            'fuzzy_matches': self.fuzzy_matches,
+            'categorized_skills': {
+                category: [{'id': s.id, 'name': s.name} for s in skills]
+                for category, skills in self.categorized_skills.items()
+            },
+            'total_skills': self.total_skills,
+            'stage_timings': self.stage_timings
+        }
@@ -0,0 +1,111 @@
+"""
+Database migration script to make (job_id, skill_id) unique in job_skill
+Run this script on databases created before bulk job skill linking; it
+removes duplicate links first
+"""
+import sys
+import os
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import text
+
+# Simple Flask app for migration
+app = Flask(__name__)
+app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL') or 'sqlite:///job_app.db'
+app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+
+db = SQLAlchemy(app)
+
+def check_table_exists(connection, table_name):
+    """Check if a table exists in the database"""
+    result = connection.execute(text(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name=:table_name"
+    ), {"table_name": table_name})
+    return result.fetchone() is not None
+
+def check_index_exists(connection, index_name):
+    """Check if an index (or unique constraint) exists in the database"""
+    result = connection.execute(text(
+        "SELECT name FROM sqlite_master WHERE type='index' AND name=:index_name"
+    ), {"index_name": index_name})
+    return result.fetchone() is not None
+
+def check_job_skill_unique(connection):
+    """Check if job_skill has a unique index on (job_id, skill_id), named or created with the table"""
+    for index in connection.execute(text("PRAGMA index_list(job_skill)")).mappings():
+        if not index['unique']:
+            continue
+        columns = [row['name'] for row in connection.execute(text(f"PRAGMA index_info('{index['name']}')")).mappings()]
+        if columns == ['job_id', 'skill_id']:
+            return True
+    return False
+
+def add_job_skill_unique_constraint():
+    """Delete duplicate job_skill rows and add a unique index on (job_id, skill_id)"""
+    print("Adding job skill unique constraint...")
+
+    with app.app_context():
+        try:
+            with db.engine.connect() as connection:
+                trans = connection.begin()
+
+                try:
+                    if not check_table_exists(connection, 'job_skill'):
+                        print("  Table job_skill does not exist, skipping")
+                        trans.commit()
+                        return True
+
+                    if check_job_skill_unique(connection):
+                        print("  job_skill already has a unique (job_id, skill_id) index, skipping")
+                        trans.commit()
+                        return True
+
+                    # Keep the oldest row of each duplicated link
+                    result = connection.execute(text("""
+                        DELETE FROM job_skill
+                        WHERE id NOT IN (SELECT MIN(id) FROM job_skill GROUP BY job_id, skill_id)
+                    """))
+                    print(f"✓ Removed {result.rowcount} duplicate job skill links")
+
+                    # SQLite cannot add a table constraint; a unique index enforces the same
+                    connection.execute(text(
+                        "CREATE UNIQUE INDEX uq_job_skill ON job_skill (job_id, skill_id)"
+                    ))
+                    print("✓ Added unique index uq_job_skill on job_skill (job_id, skill_id)")
+
+                    trans.commit()
+                    return True
+
+                except Exception as e:
+                    trans.rollback()
+                    raise e
+
+        except Exception as e:
+            print(f"✗ Error adding job skill unique constraint: {str(e)}")
+            return False
+
+def main():
+    """Main migration function"""
+    print("=" * 60)
+    print("JobApp_v2 - Add Job Skill Unique Constraint Migration")
+    print("=" * 60)
+
+    success = add_job_skill_unique_constraint()
+
+    print("\n" + "=" * 60)
+    if success:
+        print("✓ Migration completed successfully!")
+    else:
+        print("✗ Migration failed!")
+        print("Please check the errors above and try again.")
+    print("=" * 60)
+
+    return success
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,132 @@
+"""
+Database migration script to add the indexes behind the hot query paths
+Run this script on databases created before these indexes were declared
+on the models; indexes that already exist are left alone
+"""
+import sys
+import os
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import text
+
+# Simple Flask app for migration
+app = Flask(__name__)
+app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL') or 'sqlite:///job_app.db'
+app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+
+db = SQLAlchemy(app)
+
+# (index name, table, indexed columns or expressions), as declared on the models
+INDEXES = [
+    # Dashboard ordering, filters (ordered by last update) and group-by keys
+    ('ix_job_application_last_update', 'job_application', 'last_update'),
+    ('ix_job_application_status_last_update', 'job_application', 'status, last_update'),
+    ('ix_job_application_country_last_update', 'job_application', 'country, last_update'),
+    ('ix_job_application_job_mode_last_update', 'job_application', 'job_mode, last_update'),
+    # LogService.get_logs_for_job
+    ('ix_job_log_job_id_created_at', 'job_log', 'job_id, created_at'),
+    # Analytics joins from skills to jobs (uq_job_skill covers job_id)
+    ('ix_job_skill_skill_id', 'job_skill', 'skill_id'),
+    # Case-insensitive skill name checks, variant lookups
+    ('ix_skills_name_lower', 'skills', 'lower(name)'),
+    ('ix_skill_variants_variant_name', 'skill_variants', 'variant_name'),
+    ('ix_skill_variants_skill_id', 'skill_variants', 'skill_id'),
+]
+
+# Single-column indexes replaced by the composite ones above
+SUPERSEDED_INDEXES = [
+    'ix_job_application_status',
+    'ix_job_application_country',
+    'ix_job_application_job_mode',
+]
+
+def check_table_exists(connection, table_name):
+    """Check if a table exists in the database"""
+    result = connection.execute(text(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name=:table_name"
+    ), {"table_name": table_name})
+    return result.fetchone() is not None
+
+def check_index_exists(connection, index_name):
+    """Check if an index exists in the database"""
+    result = connection.execute(text(
+        "SELECT name FROM sqlite_master WHERE type='index' AND name=:index_name"
+    ), {"index_name": index_name})
+    return result.fetchone() is not None
+
+def check_job_skill_unique(connection):
+    """Check if job_skill has a unique index on (job_id, skill_id), named or created with the table"""
+    for index in connection.execute(text("PRAGMA index_list(job_skill)")).mappings():
+        if not index['unique']:
+            continue
+        columns = [row['name'] for row in connection.execute(text(f"PRAGMA index_info('{index['name']}')")).mappings()]
+        if columns == ['job_id', 'skill_id']:
+            return True
+    return False
+
+def add_query_indexes():
+    """Create every missing index in INDEXES and drop the superseded ones"""
+    print("Adding query indexes...")
+
+    with app.app_context():
+        try:
+            with db.engine.connect() as connection:
+                trans = connection.begin()
+
+                try:
+                    for index_name, table_name, columns in INDEXES:
+                        if not check_table_exists(connection, table_name):
+                            print(f"  Table {table_name} does not exist, skipping {index_name}")
+                            continue
+                        if check_index_exists(connection, index_name):
+                            print(f"  Index {index_name} already exists, skipping")
+                            continue
+
+                        connection.execute(text(f"CREATE INDEX {index_name} ON {table_name} ({columns})"))
+                        print(f"✓ Added index {index_name} on {table_name} ({columns})")
+
+                    for index_name in SUPERSEDED_INDEXES:
+                        if check_index_exists(connection, index_name):
+                            connection.execute(text(f"DROP INDEX {index_name}"))
+                            print(f"✓ Dropped index {index_name}, superseded by a composite index")
+
+                    if check_table_exists(connection, 'job_skill') and not check_job_skill_unique(connection):
+                        print("  job_skill has no uq_job_skill index yet: "
+                              "run migrations/add_job_skill_unique_constraint.py")
+
+                    trans.commit()
+                    return True
+
+                except Exception as e:
+                    trans.rollback()
+                    raise e
+
+        except Exception as e:
+            print(f"✗ Error adding query indexes: {str(e)}")
+            return False
+
+def main():
+    """Main migration function"""
+    print("=" * 60)
+    print("JobApp_v2 - Add Query Indexes Migration")
+    print("=" * 60)
+
+    success = add_query_indexes()
+
+    print("\n" + "=" * 60)
+    if success:
+        print("✓ Migration completed successfully!")
+    else:
+        print("✗ Migration failed!")
+        print("Please check the errors above and try again.")
+    print("=" * 60)
+
+    return success
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
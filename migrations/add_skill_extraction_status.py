@@ -0,0 +1,98 @@
+"""
+Database migration script to add the skill extraction status column
+Run this script on databases created before background skill extraction
+"""
+import sys
+import os
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import text
+
+# Simple Flask app for migration
+app = Flask(__name__)
+app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL') or 'sqlite:///job_app.db'
+app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+
+db = SQLAlchemy(app)
+
+def check_table_exists(connection, table_name):
+    """Check if a table exists in the database"""
+    result = connection.execute(text(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name=:table_name"
+    ), {"table_name": table_name})
+    return result.fetchone() is not None
+
+def check_column_exists(connection, table_name, column_name):
+    """Check if a column exists in a table"""
+    result = connection.execute(text(f"PRAGMA table_info({table_name})"))
+    columns = [row[1] for row in result]
+    return column_name in columns
+
+def add_skill_extraction_status():
+    """Add job_application.skill_extraction_status and mark jobs with skills as done"""
+    print("Adding skill extraction status column...")
+
+    with app.app_context():
+        try:
+            with db.engine.connect() as connection:
+                trans = connection.begin()
+
+                try:
+                    if not check_table_exists(connection, 'job_application'):
+                        print("  Table job_application does not exist, skipping")
+                        trans.commit()
+                        return True
+
+                    if check_column_exists(connection, 'job_application', 'skill_extraction_status'):
+                        print("  Column skill_extraction_status already exists, skipping")
+                        trans.commit()
+                        return True
+
+                    connection.execute(text(
+                        "ALTER TABLE job_application ADD COLUMN skill_extraction_status VARCHAR(20)"
+                    ))
+                    print("✓ Added column skill_extraction_status to job_application")
+
+                    # Jobs that already have linked skills were extracted inline
+                    result = connection.execute(text("""
+                        UPDATE job_application SET skill_extraction_status = 'done'
+                        WHERE id IN (SELECT DISTINCT job_id FROM job_skill)
+                    """))
+                    print(f"✓ Marked {result.rowcount} existing jobs as extracted")
+
+                    trans.commit()
+                    return True
+
+                except Exception as e:
+                    trans.rollback()
+                    raise e
+
+        except Exception as e:
+            print(f"✗ Error adding skill extraction status: {str(e)}")
+            return False
+
+def main():
+    """Main migration function"""
+    print("=" * 60)
+    print("JobApp_v2 - Add Skill Extraction Status Migration")
+    print("=" * 60)
+
+    success = add_skill_extraction_status()
+
+    print("\n" + "=" * 60)
+    if success:
+        print("✓ Migration completed successfully!")
+    else:
+        print("✗ Migration failed!")
+        print("Please check the errors above and try again.")
+    print("=" * 60)
+
+    return success
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
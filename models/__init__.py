@@ -3,23 +3,29 @@ Models package for JobApp_v2
 
 This package contains all database models organized into separate modules:
 - base: Database setup and common imports
-- enums: Application enums (ApplicationStatus, TemplateType, JobMode)
+- enums: Application enums (ApplicationStatus, TemplateType, JobMode, SkillExtractionStatus)
 - user: User data model
 - template: Template management model
 - job: Job application, document, and log models
+- catalog_version: Skill catalog version stamp for cross-process cache invalidation
+- search: SQLite FTS5 search tables over jobs and log notes
 """
 
 # Import base database setup
 from .base import db
 
 # Import enums
-from .enums import ApplicationStatus, TemplateType, JobMode
+from .enums import ApplicationStatus, TemplateType, JobMode, SkillExtractionStatus
 
 # Import models
 from .user import UserData, UserSkill
 from .template import MasterTemplate
 from .job import JobApplication, Document, JobLog, JobSkill
-from .skill import Skill, SkillCategory, SkillVariant
+from .skill import Skill, SkillCategory, SkillVariant, SkillExtractionCacheEntry, SkillSurfaceForm
+from .catalog_version import SkillCatalogVersion, SkillCatalogChange
+
+# Registers the search tables with db.create_all
+from . import search
 
 # Make everything available at package level
 __all__ = [
@@ -27,6 +33,7 @@ __all__ = [
     'ApplicationStatus',
     'TemplateType',
     'JobMode',
+    'SkillExtractionStatus',
     'UserData',
     'UserSkill',
     'MasterTemplate',
@@ -37,6 +44,10 @@ __all__ = [
     'Skill',
     'SkillCategory',
     'SkillVariant',
+    'SkillExtractionCacheEntry',
+    'SkillSurfaceForm',
+    'SkillCatalogVersion',
+    'SkillCatalogChange',
 ]
 
 
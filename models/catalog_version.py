@@ -0,0 +1,114 @@
+"""
+Skill catalog version stamp
+
+Skill lookups and vocabularies are cached per process. Every flush that
+writes a Skill, SkillVariant or SkillCategory bumps a single-row version
+counter in the same transaction, and logs which skills it touched, so each
+worker can tell with one primary-key read whether its caches are stale and
+reload only the skills that changed.
+"""
+from typing import Optional, Set
+
+from sqlalchemy import event, insert, select, update
+from sqlalchemy.orm import Session
+
+from .base import db
+from .skill import Skill, SkillCategory, SkillVariant
+
+# Versions whose changed skills are kept; workers further behind reload everything
+CHANGE_LOG_SIZE = 1000
+
+CATALOG_MODELS = (Skill, SkillVariant, SkillCategory)
+
+
+class SkillCatalogVersion(db.Model):
+    """Single-row counter bumped on every write to skills, variants or categories"""
+    __tablename__ = 'skill_catalog_version'
+
+    id = db.Column(db.Integer, primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+    @classmethod
+    def current(cls) -> int:
+        """Current catalog version (a primary-key read)"""
+        return db.session.query(cls.version).filter(cls.id == 1).scalar() or 0
+
+    def __repr__(self) -> str:
+        return f'<SkillCatalogVersion {self.version}>'
+
+
+class SkillCatalogChange(db.Model):
+    """Skills touched by each catalog version"""
+    __tablename__ = 'skill_catalog_change'
+
+    id = db.Column(db.Integer, primary_key=True)
+    version = db.Column(db.Integer, nullable=False, index=True)
+    skill_id = db.Column(db.Integer, nullable=True)  # NULL: a bulk statement, skills unknown
+
+    @classmethod
+    def skill_ids_between(cls, since: int, until: int) -> Optional[Set[int]]:
+        """IDs of the skills changed after version since, or None if they are unknown"""
+        if until - since > CHANGE_LOG_SIZE:
+            return None
+        skill_ids = {
+            skill_id for (skill_id,) in db.session.query(cls.skill_id)
+            .filter(cls.version > since, cls.version <= until)
+        }
+        return None if None in skill_ids else skill_ids
+
+    def __repr__(self) -> str:
+        return f'<SkillCatalogChange v{self.version} skill {self.skill_id}>'
+
+
+@event.listens_for(SkillCatalogVersion.__table__, 'after_create')
+def _insert_version_row(target, connection, **kw):
+    connection.execute(target.insert().values(id=1, version=0))
+
+
+def _bump_version(connection, skill_ids) -> int:
+    """Increment the version and log the touched skills, on the flushing connection"""
+    versions = SkillCatalogVersion.__table__
+    result = connection.execute(
+        update(versions).where(versions.c.id == 1).values(version=versions.c.version + 1)
+    )
+    if not result.rowcount:
+        connection.execute(insert(versions).values(id=1, version=1))
+    version = connection.execute(select(versions.c.version).where(versions.c.id == 1)).scalar()
+
+    changes = SkillCatalogChange.__table__
+    if skill_ids:
+        connection.execute(insert(changes), [{'version': version, 'skill_id': skill_id} for skill_id in skill_ids])
+    connection.execute(changes.delete().where(changes.c.version <= version - CHANGE_LOG_SIZE))
+    return version
+
+
+@event.listens_for(Session, 'after_flush')
+def _stamp_catalog_flush(session, flush_context):
+    touched = False
+    skill_ids = set()
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if not isinstance(instance, CATALOG_MODELS):
+            continue
+        if instance in session.dirty and not session.is_modified(instance, include_collections=False):
+            continue
+        touched = True
+        if isinstance(instance, Skill):
+            skill_ids.add(instance.id)
+        elif isinstance(instance, SkillVariant):
+            skill_ids.add(instance.skill_id)
+
+    if touched:
+        _bump_version(session.connection(), skill_ids)
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _stamp_catalog_statement(orm_execute_state):
+    """Bulk insert/update/delete statements bypass the flush"""
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None or not issubclass(mapper.class_, CATALOG_MODELS):
+        return
+    # Categories do not change lookup entries; skill statements force a full reload
+    skill_ids = {None} if issubclass(mapper.class_, (Skill, SkillVariant)) else set()
+    _bump_version(orm_execute_state.session.connection(), skill_ids)
@@ -21,6 +21,12 @@ class TemplateType(Enum):
     FILE = "file"
 
 
+class SkillExtractionStatus(Enum):
+    PENDING = "pending"
+    DONE = "done"
+    FAILED = "failed"
+
+
 class JobMode(Enum):
     REMOTE = "Remote"
     HYBRID = "Hybrid"
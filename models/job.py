@@ -2,6 +2,7 @@
 Job application related models
 """
 from datetime import datetime, timezone
+from sqlalchemy import insert
 from sqlalchemy.ext.associationproxy import association_proxy
 
 from .base import db
@@ -9,12 +10,13 @@ from .enums import ApplicationStatus, JobMode
 
 class JobApplication(db.Model):
     """Model for job applications"""
+    # Indexes on existing databases: python migrations/add_query_indexes.py
     id = db.Column(db.Integer, primary_key=True)
     company = db.Column(db.String(100), nullable=False)
     title = db.Column(db.String(200), nullable=False)
     description = db.Column(db.Text)
     status = db.Column(db.String(50), default=ApplicationStatus.COLLECTED.value, nullable=False)
-    last_update = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+    last_update = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), index=True)
     url = db.Column(db.String(500))
 
     # New fields for location and job mode
@@ -22,6 +24,9 @@ class JobApplication(db.Model):
     country = db.Column(db.String(100))  # Country
     job_mode = db.Column(db.String(50), default=JobMode.ON_SITE.value)  # Remote, Hybrid, On-site
 
+    # Background skill extraction state (pending, done, failed); None if never run
+    skill_extraction_status = db.Column(db.String(20))
+
     # Relationships
     documents = db.relationship('Document', backref='job_application', lazy=True, cascade='all, delete-orphan')
     logs = db.relationship('JobLog', backref='job_application', lazy=True, cascade='all, delete-orphan', order_by='JobLog.created_at.desc()')
@@ -29,6 +34,13 @@ class JobApplication(db.Model):
 
     # Association proxy for direct access to skills
     skills = association_proxy('job_skills', 'skills')
+
+    # Dashboard filters, ordered by last update; the leading column serves the GROUP BY counts
+    __table_args__ = (
+        db.Index('ix_job_application_status_last_update', 'status', 'last_update'),
+        db.Index('ix_job_application_country_last_update', 'country', 'last_update'),
+        db.Index('ix_job_application_job_mode_last_update', 'job_mode', 'last_update'),
+    )
     
     @property
     def status_enum(self) -> ApplicationStatus:
@@ -99,6 +111,9 @@ class Document(db.Model):
 
 class JobLog(db.Model):
     """Model for job application logs and status changes"""
+    # A job's logs, newest first
+    __table_args__ = (db.Index('ix_job_log_job_id_created_at', 'job_id', 'created_at'),)
+
     id = db.Column(db.Integer, primary_key=True)
     job_id = db.Column(db.Integer, db.ForeignKey('job_application.id'), nullable=False)
     created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
@@ -113,9 +128,26 @@ class JobLog(db.Model):
 
 class JobSkill(db.Model):
     """Model for job application skills"""
+    # Existing databases: python migrations/add_job_skill_unique_constraint.py
+    # (the unique index also serves lookups by job_id)
+    __table_args__ = (db.UniqueConstraint('job_id', 'skill_id', name='uq_job_skill'),)
+
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     job_id = db.Column(db.Integer, db.ForeignKey('job_application.id'), nullable=False)  # Corrected foreign key
-    skill_id = db.Column(db.Integer, db.ForeignKey('skills.id'), nullable=False)
+    skill_id = db.Column(db.Integer, db.ForeignKey('skills.id'), nullable=False, index=True)
+
+    @classmethod
+    def insert_ignoring_duplicates(cls):
+        """INSERT that skips (job_id, skill_id) pairs already linked, e.g. by a concurrent worker"""
+        dialect = db.session.get_bind().dialect.name
+        if dialect == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        elif dialect == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            # MySQL
+            return insert(cls).prefix_with('IGNORE')
+        return dialect_insert(cls).on_conflict_do_nothing(index_elements=['job_id', 'skill_id'])
 
     def __repr__(self) -> str:
         return f"<JobSkill(job_id={self.job_id}, skill_id={self.skill_id})>"
\ No newline at end of file
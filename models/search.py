@@ -0,0 +1,139 @@
+"""
+Full-text search index over jobs and log notes
+
+On SQLite, job_search indexes the company, title and description of each
+job application and job_log_search the note of each log entry, as FTS5
+external-content tables: the text stays in job_application and job_log,
+and triggers keep the index in step with every insert, update and delete.
+The tables are created (and filled from existing rows) by db.create_all,
+so an existing database is indexed on its next start. Other engines, or a
+SQLite build without FTS5, fall back to LIKE searches.
+"""
+import weakref
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection, Engine
+
+from .base import db
+
+# tokenize: case and accent insensitive; prefix: index 2 and 3 character prefixes for search-as-you-type
+SEARCH_TABLES = {
+    'job_search': (
+        "CREATE VIRTUAL TABLE job_search USING fts5("
+        "company, title, description, "
+        "content='job_application', content_rowid='id', "
+        "tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+    ),
+    'job_log_search': (
+        "CREATE VIRTUAL TABLE job_log_search USING fts5("
+        "note, job_id UNINDEXED, "
+        "content='job_log', content_rowid='id', "
+        "tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+    ),
+}
+
+SEARCH_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS job_search_ai AFTER INSERT ON job_application BEGIN
+        INSERT INTO job_search(rowid, company, title, description)
+        VALUES (new.id, new.company, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS job_search_ad AFTER DELETE ON job_application BEGIN
+        INSERT INTO job_search(job_search, rowid, company, title, description)
+        VALUES ('delete', old.id, old.company, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS job_search_au AFTER UPDATE OF company, title, description ON job_application BEGIN
+        INSERT INTO job_search(job_search, rowid, company, title, description)
+        VALUES ('delete', old.id, old.company, old.title, old.description);
+        INSERT INTO job_search(rowid, company, title, description)
+        VALUES (new.id, new.company, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS job_log_search_ai AFTER INSERT ON job_log BEGIN
+        INSERT INTO job_log_search(rowid, note, job_id) VALUES (new.id, new.note, new.job_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS job_log_search_ad AFTER DELETE ON job_log BEGIN
+        INSERT INTO job_log_search(job_log_search, rowid, note, job_id)
+        VALUES ('delete', old.id, old.note, old.job_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS job_log_search_au AFTER UPDATE OF note, job_id ON job_log BEGIN
+        INSERT INTO job_log_search(job_log_search, rowid, note, job_id)
+        VALUES ('delete', old.id, old.note, old.job_id);
+        INSERT INTO job_log_search(rowid, note, job_id) VALUES (new.id, new.note, new.job_id);
+    END
+    """,
+]
+
+# Engine -> whether its database has the search tables
+_available: 'weakref.WeakKeyDictionary[Engine, bool]' = weakref.WeakKeyDictionary()
+
+
+def _fts5_supported(connection: Connection) -> bool:
+    return bool(connection.exec_driver_sql("SELECT sqlite_compileoption_used('ENABLE_FTS5')").scalar())
+
+
+def _table_exists(connection: Connection, name: str) -> bool:
+    return connection.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type='table' AND name=:name"), {'name': name}
+    ).first() is not None
+
+
+def create_search_index(connection: Connection) -> bool:
+    """
+    Create the missing search tables and their triggers, indexing existing rows
+
+    Returns:
+        bool: Whether the database has the search tables
+    """
+    if connection.dialect.name != 'sqlite' or not _fts5_supported(connection):
+        return False
+
+    for name, ddl in SEARCH_TABLES.items():
+        if not _table_exists(connection, name):
+            connection.exec_driver_sql(ddl)
+            connection.exec_driver_sql(f"INSERT INTO {name}({name}) VALUES ('rebuild')")
+    for ddl in SEARCH_TRIGGERS:
+        connection.exec_driver_sql(ddl)
+    return True
+
+
+def rebuild_search_index(connection: Connection) -> None:
+    """Re-index every job and log note (after writes that bypassed the triggers)"""
+    for name in SEARCH_TABLES:
+        connection.exec_driver_sql(f"INSERT INTO {name}({name}) VALUES ('rebuild')")
+
+
+def search_index_available(engine: Engine) -> bool:
+    """Whether full-text searches can use the search tables (checked once per engine)"""
+    available = _available.get(engine)
+    if available is None:
+        if engine.dialect.name != 'sqlite':
+            available = False
+        else:
+            with engine.connect() as connection:
+                available = all(_table_exists(connection, name) for name in SEARCH_TABLES)
+        _available[engine] = available
+    return available
+
+
+@event.listens_for(db.metadata, 'after_create')
+def _create_search_tables(target, connection, **kw):
+    _available[connection.engine] = create_search_index(connection)
+
+
+@event.listens_for(db.metadata, 'before_drop')
+def _drop_search_tables(target, connection, **kw):
+    if connection.dialect.name != 'sqlite':
+        return
+    for name in SEARCH_TABLES:
+        connection.exec_driver_sql(f"DROP TABLE IF EXISTS {name}")
+    _available[connection.engine] = False
@@ -1,3 +1,4 @@
+from datetime import datetime, timezone
 from sqlalchemy.orm import relationship
 from .base import db
 
@@ -16,6 +17,9 @@ class Skill(db.Model):
     category = relationship('SkillCategory', back_populates='skills', lazy=True)
     variants = relationship('SkillVariant', back_populates='skill', cascade='all, delete-orphan')
 
+    # Case-insensitive name lookups
+    __table_args__ = (db.Index('ix_skills_name_lower', db.func.lower(name)),)
+
     def __repr__(self) -> str:
         return f"<Skill(name={self.name}, category_id={self.category_id})>"
 
@@ -40,10 +44,43 @@ class SkillCategory(db.Model):
 class SkillVariant(db.Model):
     __tablename__ = 'skill_variants'
     id = db.Column(db.Integer, primary_key=True)
-    skill_id = db.Column(db.Integer, db.ForeignKey('skills.id'), nullable=False)
-    variant_name = db.Column(db.String(255), nullable=False)
+    skill_id = db.Column(db.Integer, db.ForeignKey('skills.id'), nullable=False, index=True)
+    variant_name = db.Column(db.String(255), nullable=False, index=True)
 
     skill = relationship('Skill', back_populates='variants')
     
     def __repr__(self) -> str:
-        return f'<SkillVariant {self.variant_name} -> {self.skill.name}>'
\ No newline at end of file
+        return f'<SkillVariant {self.variant_name} -> {self.skill.name}>'
+
+
+class SkillExtractionCacheEntry(db.Model):
+    """Raw skills extracted from a cleaned description, keyed by content hash"""
+    __tablename__ = 'skill_extraction_cache'
+
+    content_hash = db.Column(db.String(64), primary_key=True)
+    config_version = db.Column(db.String(16), nullable=False)
+    skills = db.Column(db.Text, nullable=False)  # JSON list of raw skill strings
+    hit_count = db.Column(db.Integer, nullable=False, default=0)
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+    last_used_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False, index=True)
+
+    def __repr__(self) -> str:
+        return f'<SkillExtractionCacheEntry {self.content_hash[:12]} v{self.config_version}>'
+
+
+class SkillSurfaceForm(db.Model):
+    """Normalization outcome of a raw extracted skill string"""
+    __tablename__ = 'skill_surface_forms'
+
+    surface = db.Column(db.String(255), primary_key=True)
+    config_version = db.Column(db.String(16), nullable=False)
+    name = db.Column(db.String(255), nullable=False)  # surface after casing rules
+    outcome = db.Column(db.String(10), nullable=False)  # 'skill', 'noise' or 'unmatched'
+    skill_id = db.Column(db.Integer, nullable=True, index=True)
+    skill_name = db.Column(db.String(255), nullable=True)
+    fuzzy = db.Column(db.Boolean, nullable=False, default=False)
+    match_key = db.Column(db.String(255), nullable=False, index=True)  # fuzzy_key(name)
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False, index=True)
+
+    def __repr__(self) -> str:
+        return f'<SkillSurfaceForm {self.surface!r} {self.outcome}>'
@@ -12,6 +12,8 @@ from .user import user_bp
 
 from .analytics import analytics_bp
 
+from .health import health_bp
+
 __all__ = [
     'main_bp',
     'jobs_bp',
@@ -20,4 +22,5 @@ __all__ = [
     'skill_bp',
     'skill_category_bp',
     'analytics_bp',
+    'health_bp',
 ]
@@ -0,0 +1,37 @@
+"""
+Health check routes for load balancers and process supervisors
+"""
+from flask import Blueprint, jsonify, current_app
+from sqlalchemy import text
+
+from models import db
+from services.skill.skill_service import get_skill_readiness
+
+health_bp = Blueprint('health', __name__)
+
+
+@health_bp.route('/live')
+def live():
+    """Liveness probe: the process is up and serving requests"""
+    return jsonify({'status': 'ok'})
+
+
+@health_bp.route('/ready')
+def ready():
+    """Readiness probe: NLP models, skill lookup and database are all available"""
+    checks = get_skill_readiness()
+    error = checks.pop('error')
+
+    try:
+        db.session.execute(text('SELECT 1'))
+        checks['database'] = True
+    except Exception as e:
+        current_app.logger.warning(f"Readiness database check failed: {e}")
+        checks['database'] = False
+
+    is_ready = all(checks.values())
+    payload = {'status': 'ready' if is_ready else 'not_ready', 'checks': checks}
+    if error:
+        payload['error'] = error
+
+    return jsonify(payload), 200 if is_ready else 503
@@ -489,13 +489,13 @@ def edit_job(job_id):
 
         if form.validate_on_submit():
             try:
-                # Sanitize inputs
-                company = escape(form.company.data.strip())
-                title = escape(form.title.data.strip())
-                description = escape(form.description.data.strip()) if form.description.data else None
+                # update_job sanitizes the text fields
+                company = form.company.data.strip()
+                title = form.title.data.strip()
+                description = form.description.data.strip() if form.description.data else None
                 url = form.url.data.strip() if form.url.data else None
-                office_location = escape(form.office_location.data.strip()) if form.office_location.data else None
-                country = escape(form.country.data.strip()) if form.country.data else None
+                office_location = form.office_location.data.strip() if form.office_location.data else None
+                country = form.country.data.strip() if form.country.data else None
                 job_mode = form.job_mode.data.strip() if form.job_mode.data else None
 
                 # Validate required fields
@@ -507,7 +507,7 @@ def edit_job(job_id):
                 old_company = job.company
                 old_title = job.title
 
-                service.update_job(job_id=job_id, **{
+                success, updated_job, error = service.update_job(job_id=job_id, **{
                     'company': company,
                     'title': title,
                     'description': description,
@@ -516,17 +516,19 @@ def edit_job(job_id):
                     'country': country,
                     'job_mode': job_mode
                 })
+                if not success:
+                    raise RuntimeError(error)
 
                 # Create a log entry for the edit
                 log_service.create_log(
                     job_id,
-                    note=f'Job details updated: {old_company} - {old_title} → {company} - {title}'
+                    note=f'Job details updated: {old_company} - {old_title} → {updated_job.company} - {updated_job.title}'
                 )
 
-                # Update the skills
-                raw_description = form.description.data.strip() if form.description.data else None
-                extracted_skills = service.extract_job_skills(job.id, raw_description)
-                if not extracted_skills:
+                # Update the skills from the stored description, which background
+                # workers compare against to detect a newer edit
+                extraction_status = service.schedule_skill_extraction(job_id, updated_job.description)
+                if extraction_status is None:
                    current_app.logger.warning(f'No skills extracted for job {job.id}')
 
                 current_app.logger.info(f'Job application updated: {title} at {company}')
@@ -700,3 +702,51 @@ def extract_skills_for_job(job_id):
     except Exception as e:
         current_app.logger.error(f"Error extracting skills for job {job_id}: {str(e)}")
         return error_response("An error occurred while extracting skills.")
+
+
+@jobs_bp.route('/<int:job_id>/skills/status', methods=['GET'])
+def skill_extraction_status(job_id):
+    """Poll the background skill extraction state of a job"""
+    status = JobService().get_skill_extraction_status(job_id)
+    if status is None:
+        return error_response("Job not found.", status_code=404)
+
+    return success_response("Skill extraction status retrieved", data=status)
+
+
+# Jobs per page accepted by the listing API
+API_MAX_PER_PAGE = 100
+
+
+@jobs_bp.route('/api/jobs', methods=['GET'])
+def api_list_jobs():
+    """
+    List job applications a page at a time, newest first (best search matches first when searching)
+
+    Query parameters: cursor (next_cursor or prev_cursor of a previous response), per_page,
+    search, status, job_mode, country, and count ('exact' or 'cached' to include the total)
+    """
+    try:
+        per_page = request.args.get('per_page', 20, type=int)
+        if not 1 <= per_page <= API_MAX_PER_PAGE:
+            return error_response(f"per_page must be between 1 and {API_MAX_PER_PAGE}.")
+
+        count = request.args.get('count', '').strip() or None
+        if count not in (None, 'exact', 'cached'):
+            return error_response("count must be 'exact' or 'cached'.")
+
+        job_page = JobService().get_jobs_page(
+            cursor=request.args.get('cursor') or None,
+            per_page=per_page,
+            search_query=request.args.get('search', '').strip(),
+            status_filter=request.args.get('status', '').strip(),
+            job_mode_filter=request.args.get('job_mode', '').strip(),
+            country_filter=request.args.get('country', '').strip(),
+            include_relationships=False,
+            count=count
+        )
+        return success_response("Jobs retrieved", data=job_page.to_dict())
+
+    except Exception as e:
+        current_app.logger.error(f"Error listing jobs: {str(e)}")
+        return error_response("An error occurred while listing jobs.", status_code=500)
@@ -10,7 +10,7 @@ main_bp = Blueprint('main', __name__)
 
 @main_bp.route('/')
 def dashboard():
-    """Dashboard showing all job applications with search and filtering"""
+    """Dashboard showing a page of job applications with search and filtering"""
     try:
         job_service = JobService()
 
@@ -19,9 +19,20 @@ def dashboard():
         status_filter = request.args.get('status', '').strip()
         job_mode_filter = request.args.get('job_mode', '').strip()
         country_filter = request.args.get('country', '').strip()
+        cursor = request.args.get('cursor') or None
 
-        # Get filtered jobs using service
-        jobs = job_service.filter_jobs(search_query, status_filter, job_mode_filter, country_filter)
+        # Get one page of filtered jobs using service
+        job_page = job_service.get_jobs_page(
+            cursor=cursor,
+            per_page=current_app.config.get('DASHBOARD_PER_PAGE', 24),
+            search_query=search_query,
+            status_filter=status_filter,
+            job_mode_filter=job_mode_filter,
+            country_filter=country_filter,
+            include_relationships=False,
+            count='cached'
+        )
+        jobs = job_page.items
 
         # create short blurb for each job
         character_limit = 150
@@ -30,14 +41,21 @@ def dashboard():
             short = desc[:character_limit].rstrip()
             job.description_short = f"{short}..." if len(desc) > character_limit else short
 
+        # Highlight the matched words instead when searching
+        if search_query and jobs:
+            snippets = job_service.get_search_snippets(search_query, [job.id for job in jobs])
+            for job in jobs:
+                job.search_snippet = snippets.get(job.id)
+
         # Get summary statistics using service
         summary = job_service.get_job_statistics()
 
         # Get unique countries for filter dropdown
-        countries = sorted([country for country in summary['country_counts'].keys() if country])
+        countries = job_service.get_countries()
 
         return render_template('dashboard.html',
                              jobs=jobs,
+                             job_page=job_page,
                              summary=summary,
                              status_options=ApplicationStatus,
                              job_mode_options=JobMode,
@@ -52,6 +70,7 @@ def dashboard():
         flash_error('An error occurred while loading the dashboard.')
         return render_template('dashboard.html',
                              jobs=[],
+                             job_page=None,
                              summary={'total_jobs': 0, 'status_counts': {}, 'status_percentages': {}, 'job_mode_counts': {}, 'country_counts': {}, 'top_countries': []},
                              status_options=ApplicationStatus,
                              job_mode_options=JobMode,
@@ -1,9 +1,15 @@
-from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify, current_app
+import itertools
+import json
+import os
+
+from flask import (Blueprint, Response, render_template, request, redirect, url_for, flash, jsonify,
+                   current_app, stream_with_context)
 from sqlalchemy.orm import joinedload
 from sqlalchemy.exc import IntegrityError
 
 from models import Skill, SkillVariant, SkillCategory, db
 from services.skill.skill_service import get_skill_service
+from services.skill.section_targeting import EXTRACTION_SCOPES
 from utils.responses import flash_error, flash_success
 
 skill_bp = Blueprint('skill', __name__)
@@ -116,8 +122,8 @@ def add_variant(skill_id):
             flash('This variant already exists', 'error')
             return redirect(url_for('skill.edit_skill', skill_id=skill_id))
         
-        # Refresh the skill service cache since we added a variant
-        skill_service.refresh_cache()
+        # Index the new variant in the skill service caches
+        skill_service.apply_variant_change(skill, added=variant_name)
         
         flash(f'Variant "{variant_name}" added successfully', 'success')
         
@@ -138,13 +144,14 @@ def delete_variant(variant_id):
 
         variant = SkillVariant.query.get_or_404(variant_id)
         skill_id = variant.skill_id
+        skill = variant.skill
         variant_name = variant.variant_name
         
         db.session.delete(variant)
         db.session.commit()
         
-        # Refresh the skill service cache since we deleted a variant
-        skill_service.refresh_cache()
+        # Drop the variant from the skill service caches
+        skill_service.apply_variant_change(skill, removed=variant_name)
         
         flash(f'Variant "{variant_name}" deleted successfully', 'success')
         
@@ -357,30 +364,147 @@ def api_extract_skills():
         if not isinstance(text, str):
             return jsonify({'error': 'text must be a string'}), 400
 
-        result = skill_service.process_job_description(text)
+        scope = data.get('scope') or request.args.get('scope')
+        if scope and scope not in EXTRACTION_SCOPES:
+            return jsonify({'error': f"scope must be one of: {', '.join(EXTRACTION_SCOPES)}"}), 400
+
+        result = skill_service.process_job_description(text, scope=scope)
         
         if result.success:
-            return jsonify({
-                'success': True,
-                'extracted_skills': result.extracted_skills,
-                'normalized_skills': [{'id': s.id, 'name': s.name} for s in result.normalized_skills],
-                'unmatched_skills': result.unmatched_skills,
-                'categorized_skills': {
-                    category: [{'id': s.id, 'name': s.name} for s in skills]
-                    for category, skills in result.categorized_skills.items()
-                },
-                'total_skills': result.total_skills
-            })
+            return jsonify(result.to_dict())
         else:
-            return jsonify({
-                'success': False,
-                'error': result.error
-            }), 400
+            return jsonify(result.to_dict()), 400
             
     except Exception as e:
         current_app.logger.exception("api_extract_skills failed")
         return jsonify({'error': 'Internal server error'}), 500
 
+NDJSON_MIMETYPES = ('application/x-ndjson', 'application/jsonl')
+
+
+def _iter_ndjson_documents(stream):
+    """Read documents from an NDJSON body one line at a time (a bad line yields its ValueError)"""
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as e:
+            yield e
+
+
+def _parse_batch_document(index, document):
+    """Return (id, text) for a batch entry: a string or an object with 'text' and optional 'id'"""
+    if isinstance(document, ValueError):
+        raise ValueError(f"invalid JSON: {document}")
+    if isinstance(document, str):
+        return index, document
+    if isinstance(document, dict) and isinstance(document.get('text'), str):
+        return document.get('id', index), document['text']
+    raise ValueError("each document must be a string or an object with a string 'text'")
+
+
+def _stream_batch_results(documents, chunk_size, max_documents, scope=None):
+    """
+    Process documents chunk by chunk and yield one NDJSON line per document
+
+    Documents are pulled from the iterator only when the previous chunk has
+    been written out, so a slow client holds back reading the upload instead
+    of results piling up in memory.
+    """
+    skill_service = get_skill_service()
+    documents = iter(enumerate(documents))
+    processed = 0
+
+    while True:
+        chunk = list(itertools.islice(documents, chunk_size))
+        if not chunk:
+            return
+
+        remaining = max_documents - processed
+        overflow = len(chunk) > remaining
+        chunk = chunk[:remaining]
+
+        entries, texts = [], []
+        for index, document in chunk:
+            try:
+                doc_id, text = _parse_batch_document(index, document)
+            except ValueError as e:
+                entries.append((index, None, str(e)))
+                continue
+            entries.append((index, doc_id, None))
+            texts.append(text)
+
+        results = iter(skill_service.process_job_descriptions(texts, scope=scope))
+        for index, doc_id, error in entries:
+            if error:
+                line = {'index': index, 'success': False, 'error': error}
+            else:
+                line = {'index': index, 'id': doc_id, **next(results).to_dict()}
+            yield json.dumps(line) + '\n'
+
+        processed += len(chunk)
+        if overflow:
+            yield json.dumps({'success': False, 'error': f'Batch exceeds {max_documents} documents'}) + '\n'
+            return
+
+
+@skill_bp.route('/api/skills/extract/batch', methods=['POST'])
+def api_extract_skills_batch():
+    """
+    Extract skills from many documents, streaming one NDJSON result line per document
+
+    Accepts a JSON array (or {"documents": [...], "scope": ...}) or an NDJSON
+    body where each document is a string or {"id": ..., "text": ...}. The
+    extraction scope can also be passed as a ?scope= query parameter.
+    """
+    try:
+        max_documents = current_app.config.get('SKILL_BATCH_MAX_DOCUMENTS', 1000)
+        chunk_size = max(1, current_app.config.get('SKILL_BATCH_CHUNK_SIZE', 32))
+        scope = request.args.get('scope')
+
+        if request.mimetype in NDJSON_MIMETYPES:
+            documents = _iter_ndjson_documents(request.stream)
+        else:
+            data = request.get_json(silent=True)
+            if isinstance(data, dict):
+                scope = data.get('scope') or scope
+                data = data.get('documents')
+            if not isinstance(data, list):
+                return jsonify({'error': 'Expected a JSON array of documents or an NDJSON body'}), 400
+            if len(data) > max_documents:
+                return jsonify({'error': f'Batch exceeds {max_documents} documents'}), 413
+            documents = data
+
+        if scope and scope not in EXTRACTION_SCOPES:
+            return jsonify({'error': f"scope must be one of: {', '.join(EXTRACTION_SCOPES)}"}), 400
+
+        return Response(
+            stream_with_context(_stream_batch_results(documents, chunk_size, max_documents, scope)),
+            mimetype='application/x-ndjson'
+        )
+
+    except Exception as e:
+        current_app.logger.exception("api_extract_skills_batch failed")
+        return jsonify({'error': 'Internal server error'}), 500
+
+@skill_bp.route('/api/skills/pipeline-metrics')
+def api_pipeline_metrics():
+    """Per-stage timing and size histograms of the skill pipeline in this worker"""
+    try:
+        from services.skill.pipeline_metrics import pipeline_metrics
+
+        metrics = pipeline_metrics.snapshot()
+        metrics['extraction_cache'] = get_skill_service().extraction_cache.stats()
+        metrics['surface_memo'] = get_skill_service().surface_memo.stats()
+        metrics['pid'] = os.getpid()
+        return jsonify(metrics)
+
+    except Exception as e:
+        current_app.logger.exception("api_pipeline_metrics failed")
+        return jsonify({'error': 'Internal server error'}), 500
+
 @skill_bp.route('/api/skills/audit', methods=['POST'])
 def api_audit_skills():
     """Audit existing job skills via API"""
@@ -7,6 +7,7 @@ from .log_service import LogService
 from .job_service import JobService
 from .category_service import CategoryService
 from .analytics_service import AnalyticsService
+from .search_service import SearchService
 
 __all__ = [
     'JobService',
@@ -15,4 +16,5 @@ __all__ = [
     'LogService',
     'CategoryService',
     'AnalyticsService',
+    'SearchService',
 ]
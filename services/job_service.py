@@ -4,18 +4,84 @@ Job service for handling job application business logic
 from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any, Tuple
 from collections import defaultdict
-from sqlalchemy.orm import joinedload, selectinload  
+from sqlalchemy import and_, event, or_, tuple_
+from sqlalchemy.orm import Session, joinedload, selectinload
+from flask import current_app
 from flask_sqlalchemy.pagination import Pagination
 import logging
 
-from models import JobApplication, JobSkill, ApplicationStatus, JobMode, JobLog, db, Skill
+from models import JobApplication, JobSkill, ApplicationStatus, JobMode, JobLog, SkillExtractionStatus, db, Skill
+
+from dtos.job_dtos import JobPage
 
 from .base_service import BaseService
+from .cache_service import cache_service
+from .search_service import SearchService, search_terms
 from .skill.skill_service import get_skill_service
+from .skill.extraction_executor import extraction_executor
 
 from utils.scraper import scrape_job_data
 from utils.responses import handle_scraping_response
 from utils.forms import sanitize_input
+from utils.pagination import NEXT, PREV, decode_cursor, encode_cursor
+
+# Bumped by flushes that write jobs or log notes, so this process never serves stale cached counts
+_job_count_generation = 0
+
+
+def _keyset_ranges(keys, key, backwards=False):
+    """
+    Conditions for the rows after the given sort key (before it when backwards)
+
+    NULLs sort below every value, as SQLite orders them. Rows with a NULL in
+    the leading column are a separate range, so each condition stays an index
+    range read; they are returned in reading order, and together select every
+    row after the key.
+
+    Args:
+        keys: (column, descending, nullable) triples of the ordering
+        key: Sort key values of the row to start from
+    """
+    columns = [column for column, _, _ in keys]
+    if len({descending for _, descending, _ in keys}) == 1 and not any(nullable for _, _, nullable in keys[1:]):
+        # One direction: row-value comparisons, read as index ranges
+        downwards = keys[0][1] != backwards
+        if key[0] is None:
+            rest = tuple_(*columns[1:]) < tuple_(*key[1:]) if downwards else tuple_(*columns[1:]) > tuple_(*key[1:])
+            below_null = [and_(columns[0].is_(None), rest)]
+            return below_null if downwards else below_null + [columns[0].is_not(None)]
+        if downwards:
+            ranges = [tuple_(*columns) < tuple_(*key)]
+            return ranges + [columns[0].is_(None)] if keys[0][2] else ranges
+        return [tuple_(*columns) > tuple_(*key)]
+
+    clauses = []
+    for i, (column, descending, nullable) in enumerate(keys):
+        same = [columns[j].is_(None) if key[j] is None else columns[j] == key[j] for j in range(i)]
+        if descending != backwards:
+            if key[i] is None:
+                continue  # nothing sorts below NULL
+            later = or_(column < key[i], column.is_(None)) if nullable else column < key[i]
+        else:
+            later = column.is_not(None) if key[i] is None else column > key[i]
+        clauses.append(and_(*same, later))
+    return [or_(*clauses)]
+
+
+def _order_by(column, descending):
+    """Sort a column with NULLs below every value, on every engine"""
+    return column.desc().nulls_last() if descending else column.asc().nulls_first()
+
+
+class EmptyPagination(Pagination):
+    """Pagination with no items, returned when the page query fails"""
+
+    def _query_items(self):
+        return []
+
+    def _query_count(self):
+        return 0
+
 
 class JobService(BaseService):
     """Service for job application operations"""
@@ -24,6 +90,7 @@ class JobService(BaseService):
         super().__init__()
         # Get the skill service instance
         self.skill_service = get_skill_service()
+        self.search_service = SearchService()
         self.logger.info("JobService initialized")
 
     def get_job_by_id(self, job_id):
@@ -77,11 +144,56 @@ class JobService(BaseService):
             self.logger.error(f"Error getting all jobs: {str(e)}", exc_info=True)
             return []
 
+    def _filtered_jobs_query(self, search_query=None, status_filter=None, job_mode_filter=None,
+                             country_filter=None):
+        """
+        Job query restricted to the dashboard search and filters
+
+        Returns:
+            tuple: (query, search rank column or None, query counting the same
+                   jobs without ranking them)
+        """
+        query = JobApplication.query
+
+        # Apply filters
+        filters_applied = []
+
+        if status_filter:
+            query = query.filter(JobApplication.status == status_filter)
+            filters_applied.append(f"status='{status_filter}'")
+
+        if job_mode_filter:
+            query = query.filter(JobApplication.job_mode == job_mode_filter)
+            filters_applied.append(f"mode='{job_mode_filter}'")
+
+        if country_filter:
+            query = query.filter(JobApplication.country == country_filter)
+            filters_applied.append(f"country='{country_filter}'")
+
+        # Search last: the total is counted on the same filters without ranking the matches
+        rank = None
+        count_query = query
+        if search_query:
+            filtered = query
+            query, rank = self._apply_search(filtered, search_query)
+            count_query = query
+            if rank is not None:
+                count_query, _ = self._apply_search(filtered, search_query, ranked=False)
+            filters_applied.append(f"search='{search_query}'")
+
+        if filters_applied:
+            self.logger.debug(f"Applied filters: {', '.join(filters_applied)}")
+
+        return query, rank, count_query
+
     def get_jobs_paginated(self, page=1, per_page=20, search_query=None, status_filter=None,
-                          job_mode_filter=None, country_filter=None):
+                          job_mode_filter=None, country_filter=None, include_relationships=True):
         """
         Get paginated job applications with filtering
 
+        Uses OFFSET and counts every match on each page; get_jobs_page reads
+        deep pages as fast as the first one.
+
         Args:
             page: Page number
             per_page: Items per page
@@ -89,6 +201,7 @@ class JobService(BaseService):
             status_filter: Status filter
             job_mode_filter: Job mode filter
             country_filter: Country filter
+            include_relationships: Whether to load the documents and logs of the page's jobs
 
         Returns:
             Pagination object with optimized queries
@@ -98,48 +211,28 @@ class JobService(BaseService):
             self.logger.debug(f"Filters - Search: {search_query}, Status: {status_filter}, "
                             f"Mode: {job_mode_filter}, Country: {country_filter}")
 
-            query = JobApplication.query.options(  
-                selectinload(JobApplication.documents),  
-                selectinload(JobApplication.logs)  
-            ) 
-
-            # Apply filters
-            filters_applied = []
-
-            if search_query:
-                search_term = f"%{search_query}%"
-                query = query.filter(
-                    db.or_(
-                        JobApplication.company.ilike(search_term),
-                        JobApplication.title.ilike(search_term),
-                        JobApplication.description.ilike(search_term)
-                    )
+            query, rank, count_query = self._filtered_jobs_query(
+                search_query, status_filter, job_mode_filter, country_filter
+            )
+            if include_relationships:
+                query = query.options(
+                    selectinload(JobApplication.documents),
+                    selectinload(JobApplication.logs)
                 )
-                filters_applied.append(f"search='{search_query}'")
-
-            if status_filter:
-                query = query.filter(JobApplication.status == status_filter)
-                filters_applied.append(f"status='{status_filter}'")
-
-            if job_mode_filter:
-                query = query.filter(JobApplication.job_mode == job_mode_filter)
-                filters_applied.append(f"mode='{job_mode_filter}'")
 
-            if country_filter:
-                query = query.filter(JobApplication.country == country_filter)
-                filters_applied.append(f"country='{country_filter}'")
-
-            if filters_applied:
-                self.logger.debug(f"Applied filters: {', '.join(filters_applied)}")
-
-            # Order by last update
+            # Best search matches first, then by last update
+            if rank is not None:
+                query = query.order_by(rank)
             query = query.order_by(JobApplication.last_update.desc())
 
             pagination = query.paginate(
                 page=page,
                 per_page=per_page,
-                error_out=False
+                error_out=False,
+                count=rank is None
             )
+            if rank is not None:
+                pagination.total = count_query.count()
         
             self.logger.info(f"Paginated query returned {pagination.total} total jobs, "
                            f"showing {len(pagination.items)} items on page {page}")
@@ -149,7 +242,139 @@ class JobService(BaseService):
         except Exception as e:
             self.logger.error(f"Error getting paginated jobs: {str(e)}", exc_info=True)
             # Return empty pagination object
-            return Pagination(query=None, page=page, per_page=per_page, total=0, items=[])
+            return EmptyPagination(page=page, per_page=per_page, error_out=False)
+
+    def get_jobs_page(self, cursor=None, per_page=20, search_query=None, status_filter=None,
+                      job_mode_filter=None, country_filter=None, include_relationships=True,
+                      count=None) -> JobPage:
+        """
+        Get a page of job applications with keyset (cursor) pagination
+
+        Jobs are ordered by (last_update, id), newest first, after the search
+        rank when searching. A page starts right after (or ends right before)
+        the sort key held by the cursor, an index range read, so deep pages
+        cost the same as the first one.
+
+        Args:
+            cursor: next_cursor or prev_cursor of a previous page; None for the first page
+            per_page: Items per page
+            search_query: Search term
+            status_filter: Status filter
+            job_mode_filter: Job mode filter
+            country_filter: Country filter
+            include_relationships: Whether to load the documents and logs of the page's jobs
+            count: 'exact' to count the matching jobs, 'cached' to reuse a count up
+                to JOB_COUNT_CACHE_SECONDS old, None not to count them
+
+        Returns:
+            JobPage: The jobs with the cursors of the neighbouring pages
+        """
+        try:
+            self.logger.debug(f"Fetching job page - Cursor: {cursor}, Per page: {per_page}")
+            query, rank, count_query = self._filtered_jobs_query(
+                search_query, status_filter, job_mode_filter, country_filter
+            )
+            if include_relationships:
+                query = query.options(
+                    selectinload(JobApplication.documents),
+                    selectinload(JobApplication.logs)
+                )
+
+            # (column, descending, nullable) triples; the id makes every key unique
+            keys = [(JobApplication.last_update, True, True), (JobApplication.id, True, False)]
+            if rank is not None:
+                keys.insert(0, (rank, False, False))
+                query = query.add_columns(rank)
+
+            direction, key = NEXT, None
+            if cursor:
+                try:
+                    direction, key = decode_cursor(cursor, len(keys))
+                    key = self._parse_sort_key(key)
+                except ValueError as e:
+                    self.logger.warning(f"Ignoring job page cursor: {e}")
+                    direction, key = NEXT, None
+
+            backwards = direction == PREV
+            query = query.order_by(*[
+                _order_by(column, descending != backwards) for column, descending, _ in keys
+            ])
+
+            if key is None:
+                rows = query.limit(per_page + 1).all()
+            else:
+                # Later ranges are only read when the earlier ones run short of a page
+                rows = []
+                for condition in _keyset_ranges(keys, key, backwards):
+                    rows += query.filter(condition).limit(per_page + 1 - len(rows)).all()
+                    if len(rows) > per_page:
+                        break
+            more = len(rows) > per_page
+            rows = rows[:per_page]
+            if backwards:
+                rows.reverse()
+
+            if rank is not None:
+                items = [job for job, _ in rows]
+                sort_keys = [[job_rank, job.last_update, job.id] for job, job_rank in rows]
+            else:
+                items = rows
+                sort_keys = [[job.last_update, job.id] for job in rows]
+
+            # Reading forwards there is a previous page if we started from a cursor, and vice versa
+            has_next = more if not backwards else key is not None
+            has_prev = more if backwards else key is not None
+            page = JobPage(
+                items=items,
+                per_page=per_page,
+                next_cursor=encode_cursor(NEXT, self._dump_sort_key(sort_keys[-1])) if items and has_next else None,
+                prev_cursor=encode_cursor(PREV, self._dump_sort_key(sort_keys[0])) if items and has_prev else None,
+            )
+
+            if count == 'exact':
+                page.total = count_query.order_by(None).count()
+            elif count == 'cached':
+                page.total = self._cached_job_count(
+                    count_query, (search_query, status_filter, job_mode_filter, country_filter)
+                )
+                page.total_is_cached = True
+
+            self.logger.info(f"Job page returned {len(items)} items"
+                           f"{f' of {page.total}' if page.total is not None else ''}")
+            return page
+
+        except Exception as e:
+            self.logger.error(f"Error getting job page: {str(e)}", exc_info=True)
+            return JobPage(items=[], per_page=per_page)
+
+    @staticmethod
+    def _dump_sort_key(key):
+        """Sort key values as JSON types: datetimes become ISO strings"""
+        return [value.isoformat() if isinstance(value, datetime) else value for value in key]
+
+    @staticmethod
+    def _parse_sort_key(key):
+        """Sort key read from a cursor: [rank,] last_update, id"""
+        *rank, last_update, job_id = key
+        if not isinstance(job_id, int) or not all(isinstance(value, (int, float)) for value in rank):
+            raise ValueError("Invalid cursor key")
+        if last_update is not None:
+            if not isinstance(last_update, str):
+                raise ValueError("Invalid cursor key")
+            # Raises ValueError for a malformed timestamp
+            last_update = datetime.fromisoformat(last_update)
+        return [*rank, last_update, job_id]
+
+    def _cached_job_count(self, count_query, filters) -> int:
+        """Number of jobs matching the filters, counted at most JOB_COUNT_CACHE_SECONDS ago"""
+        timeout = current_app.config.get('JOB_COUNT_CACHE_SECONDS', 60)
+        cache_key = ('job_count', _job_count_generation, *filters)
+        total = cache_service.get(*cache_key)
+        if total is None:
+            total = count_query.order_by(None).count()
+            if timeout > 0:
+                cache_service.set(cache_key[0], total, timeout, *cache_key[1:])
+        return total
     
     def create_job(self, company, title, description=None, url=None,
                    office_location=None, country=None, job_mode=None):
@@ -220,10 +445,12 @@ class JobService(BaseService):
             # Extract skills from the description
             if description:
                 self.logger.debug(f"Extracting skills from job description for job ID: {job.id}")
-                skill_success, skills = self.extract_job_skills(job.id, job_data['description'])
+                status = self.schedule_skill_extraction(job.id, job_data['description'])
 
-                if skill_success:
-                    self.logger.info(f"Skills extracted successfully for job {job.id}: {len(skills)} skills found")
+                if status == SkillExtractionStatus.PENDING.value:
+                    self.logger.info(f"Skill extraction queued for job {job.id}")
+                elif status == SkillExtractionStatus.DONE.value:
+                    self.logger.info(f"Skills extracted successfully for job {job.id}")
                 else:
                     self.logger.warning(f"Skill extraction failed for job {job.id}")
             else:
@@ -360,15 +587,9 @@ class JobService(BaseService):
             query = JobApplication.query
             
             # Apply search filter
+            rank = None
             if search_query and search_query.strip():
-                search_pattern = f'%{search_query.strip()}%'
-                query = query.filter(
-                    db.or_(
-                        JobApplication.company.ilike(search_pattern),
-                        JobApplication.title.ilike(search_pattern),
-                        JobApplication.description.ilike(search_pattern)
-                    )
-                )
+                query, rank = self._apply_search(query, search_query.strip())
             
             # Apply status filter
             if status_filter and status_filter.strip():
@@ -382,6 +603,9 @@ class JobService(BaseService):
             if country_filter and country_filter.strip():
                 query = query.filter(JobApplication.country == country_filter.strip())
             
+            # Best search matches first, then by last update
+            if rank is not None:
+                query = query.order_by(rank)
             jobs = query.order_by(JobApplication.last_update.desc()).all()
             self.logger.info(f"Filter returned {len(jobs)} job applications")
             return jobs
@@ -390,17 +614,60 @@ class JobService(BaseService):
             self.logger.error(f"Error filtering jobs: {str(e)}", exc_info=True)
             return []
     
+    def _apply_search(self, query, search_query, ranked=True):
+        """
+        Restrict a job query to jobs matching a search box query
+
+        Uses the full-text index when available: bare words match as
+        prefixes, "quoted words" as phrases, in the company, title,
+        description or log notes. Otherwise, or for terms like "C++" the
+        index cannot tell apart, every word or phrase must appear in one of
+        them (LIKE filters).
+
+        Args:
+            query: Job application query
+            search_query: Search box text
+            ranked: Whether to compute the rank column (not needed to count matches)
+
+        Returns:
+            tuple: (query, rank column to order by, or None when unranked)
+        """
+        hits = self.search_service.job_hits(search_query, ranked=ranked)
+        if hits is not None:
+            return query.join(hits, hits.c.job_id == JobApplication.id), hits.c.rank if ranked else None
+
+        for term in search_terms(search_query):
+            search_pattern = f'%{term}%'
+            query = query.filter(
+                db.or_(
+                    JobApplication.company.ilike(search_pattern),
+                    JobApplication.title.ilike(search_pattern),
+                    JobApplication.description.ilike(search_pattern),
+                    JobApplication.logs.any(JobLog.note.ilike(search_pattern))
+                )
+            )
+        return query, None
+
+    def get_search_snippets(self, search_query, job_ids) -> Dict[int, Any]:
+        """
+        Highlighted excerpts of the given jobs around the words matching a search
+
+        Returns:
+            dict: Job ID -> HTML-safe excerpt (empty without the full-text index)
+        """
+        return self.search_service.job_snippets(search_query, job_ids)
+
     def get_job_statistics(self):
         """
-        Get job application statistics
-        
+        Get job application statistics, counted with GROUP BY queries
+
         Returns:
             dict: Statistics including counts, percentages, and top countries
         """
         try:
             self.logger.debug("Calculating job statistics")
-            all_jobs = self.get_all_jobs()
-            total_jobs = len(all_jobs)
+            status_counts = self._count_by(JobApplication.status)
+            total_jobs = sum(status_counts.values())
             
             if total_jobs == 0:
                 self.logger.info("No jobs found for statistics calculation")
@@ -413,22 +680,8 @@ class JobService(BaseService):
                     'top_countries': []
                 }
             
-            status_counts = {}
-            job_mode_counts = {}
-            country_counts = {}
-            
-            for job in all_jobs:
-                # Count by status
-                status = job.status
-                status_counts[status] = status_counts.get(status, 0) + 1
-                
-                # Count by job mode
-                if job.job_mode:
-                    job_mode_counts[job.job_mode] = job_mode_counts.get(job.job_mode, 0) + 1
-                
-                # Count by country
-                if job.country:
-                    country_counts[job.country] = country_counts.get(job.country, 0) + 1
+            job_mode_counts = self._count_by(JobApplication.job_mode)
+            country_counts = self._count_by(JobApplication.country)
             
             # Calculate percentages for status
             status_percentages = {}
@@ -460,6 +713,30 @@ class JobService(BaseService):
                 'country_counts': {},
                 'top_countries': []
             }
+
+    @staticmethod
+    def _count_by(column) -> Dict[str, int]:
+        """Number of jobs per non-empty value of an indexed column, largest first"""
+        count = db.func.count()
+        rows = (db.session.query(column, count)
+                .filter(column.isnot(None), column != '')
+                .group_by(column)
+                .order_by(count.desc(), column)
+                .all())
+        return dict(rows)
+
+    def get_countries(self) -> List[str]:
+        """Distinct countries of the job applications, sorted"""
+        try:
+            rows = (db.session.query(JobApplication.country)
+                    .filter(JobApplication.country.isnot(None), JobApplication.country != '')
+                    .distinct()
+                    .order_by(JobApplication.country)
+                    .all())
+            return [country for (country,) in rows]
+        except Exception as e:
+            self.logger.error(f"Error getting countries: {str(e)}", exc_info=True)
+            return []
     
     def scrape_job_data(self, url):
         """
@@ -552,6 +829,66 @@ class JobService(BaseService):
             
         return True, job_skill, None
 
+    def sync_job_skills(self, job_id, skill_ids):
+        """
+        Make skill_ids exactly the skills linked to a job, in one transaction
+
+        :param job_id: ID of the job
+        :param skill_ids: IDs of the skills the job should be linked to
+        :return: tuple (success, (links added, links removed), error)
+        """
+        success, counts, error = self.safe_execute(self._sync_job_skill_links, job_id, skill_ids)
+        if not success:
+            self.logger.error(f"Failed to sync skills of job {job_id}: {error}")
+        return success, counts, error
+
+    def _sync_job_skill_links(self, job_id, skill_ids):
+        """Diff the job's links against skill_ids in one query and apply the difference (no commit)"""
+        desired = set(skill_ids)
+        current = {skill_id for (skill_id,) in
+                   db.session.query(JobSkill.skill_id).filter(JobSkill.job_id == job_id)}
+
+        stale = current - desired
+        if stale:
+            JobSkill.query.filter(
+                JobSkill.job_id == job_id,
+                JobSkill.skill_id.in_(stale)
+            ).delete(synchronize_session=False)
+
+        missing = desired - current
+        if missing:
+            db.session.execute(JobSkill.insert_ignoring_duplicates(),
+                               [{'job_id': job_id, 'skill_id': skill_id} for skill_id in missing])
+
+        return len(missing), len(stale)
+
+    def schedule_skill_extraction(self, job_id, job_description):
+        """
+        Extract skills for a job, in the background when a worker pool is configured
+
+        :param job_id: ID of the job
+        :param job_description: Description of the job
+        :return: SkillExtractionStatus value, or None if there is no description
+        """
+        if not job_description:
+            self.logger.debug(f"No job description provided for job {job_id}, skipping skill extraction")
+            return None
+
+        if extraction_executor.enabled:
+            # Only sections missing from the cache are sent to the pool; an
+            # unchanged description is served without a round trip at all
+            sections = self.skill_service.split_sections(job_description)
+            cached = self.skill_service.lookup_sections(sections)
+            uncached = [section for section in dict.fromkeys(sections) if section not in cached]
+
+            if uncached:
+                self._set_skill_extraction_status(job_id, SkillExtractionStatus.PENDING)
+                if extraction_executor.submit(job_id, job_description, uncached):
+                    return SkillExtractionStatus.PENDING.value
+
+        success, _ = self.extract_job_skills(job_id, job_description)
+        return SkillExtractionStatus.DONE.value if success else SkillExtractionStatus.FAILED.value
+
     def extract_job_skills(self, job_id, job_description):
         """
         Extract skills from the job description and store them in the JobSkill table.
@@ -568,55 +905,134 @@ class JobService(BaseService):
         try:
             # Extract skills
             extraction_result = self.skill_service.process_job_description(job_description)
-
-            if extraction_result.success:
-                skill_ids = []
-                matched_skills = []
-
-                for skill in extraction_result.normalized_skills:
-                    skill_ids.append(skill.id)
-                    matched_skills.append(skill.name)
-
-                self.logger.debug(f"Matched skills for job {job_id}: {matched_skills}")
-
-                # create skills that do not yet exist
-                new_skills = []
-                for skill_name in extraction_result.unmatched_skills:
-                    success, skill, error = self.skill_service.create_skill(skill_name)
-
-                    if success:
-                        self.logger.info(f"Created new skill with name {skill_name}")
-                        skill_ids.append(skill.id)
-                        new_skills.append(skill_name)
-                    else:
-                        self.logger.error(f"Error creating skill {skill_name}: {error}")
-
-                if new_skills:
-                    self.logger.info(f"Created new skills for job {job_id}: {new_skills}")
-
-                # Link skills to the job
-                linked_skills = 0
-                for skill_id in skill_ids:
-                    success, _, error = self.create_job_skill(job_id, skill_id)
-                    if success:
-                        linked_skills += 1
-                    else:
-                        self.logger.warning(f"Failed to link skill {skill_id} to job {job_id}: {error}")
-                
-                self.logger.info(f"Skill extraction completed for job {job_id}: "
-                               f"{len(matched_skills)} matched, {len(new_skills)} created, "
-                               f"{linked_skills} linked")
-
-                return True, extraction_result.normalized_skills
-            else:
-                self.logger.warning(f"Skill extraction failed for job {job_id}: "
-                                  f"{getattr(extraction_result, 'error', 'Unknown error')}")
-                return False, None
+            return self._store_job_skills(job_id, extraction_result)
         
         except Exception as e:
             self.logger.error(f"Error extracting skills for job {job_id}: {str(e)}", exc_info=True)
+            self._set_skill_extraction_status(job_id, SkillExtractionStatus.FAILED)
+            return False, None
+
+    def apply_extraction_result(self, job_id, job_description, section_results):
+        """
+        Store skills extracted by a background worker
+
+        :param job_id: ID of the job
+        :param job_description: Description the worker extracted from
+        :param section_results: ExtractedSkillsResult per section text the worker annotated
+        """
+        def _worker_results(texts):
+            # Sections evicted from the cache since scheduling are extracted here
+            missing = [text for text in texts if text not in section_results]
+            if missing:
+                section_results.update(zip(missing, self.skill_service.extractor.extract_skills_from_texts(missing)))
+            return [section_results[text] for text in texts]
+
+        # Cached even if the job changed meanwhile: other postings may share these sections
+        self.skill_service.extraction_cache.put_many(section_results.items())
+
+        job = self.get_job_by_id(job_id)
+        if not job:
+            self.logger.warning(f"Job {job_id} no longer exists, dropping extracted skills")
+            return False, None
+
+        # A newer edit has queued its own extraction; this result is stale
+        if job.description != job_description:
+            self.logger.debug(f"Description of job {job_id} changed since extraction was queued, skipping")
+            return False, None
+
+        try:
+            # Merges the worker's sections with the cached ones and caches the new results
+            extraction_result = self.skill_service.extract_skills_batch(
+                [job_description], extract_uncached=_worker_results
+            )[0]
+            processed_result = self.skill_service.process_extracted_skills(extraction_result)
+            return self._store_job_skills(job_id, processed_result)
+        except Exception as e:
+            self.logger.error(f"Error storing extracted skills for job {job_id}: {str(e)}", exc_info=True)
+            self._set_skill_extraction_status(job_id, SkillExtractionStatus.FAILED)
+            return False, None
+
+    def get_skill_extraction_status(self, job_id):
+        """
+        Get the skill extraction state of a job
+
+        :param job_id: ID of the job
+        :return: dict with status and linked skill count, or None if the job does not exist
+        """
+        job = self.get_job_by_id(job_id)
+        if not job:
+            return None
+
+        return {
+            'job_id': job_id,
+            'status': job.skill_extraction_status,
+            'ready': job.skill_extraction_status == SkillExtractionStatus.DONE.value,
+            'skills_count': JobSkill.query.filter_by(job_id=job_id).count()
+        }
+
+    def _store_job_skills(self, job_id, extraction_result):
+        """Create unmatched skills and link all processed skills to the job"""
+        if extraction_result.success:
+            skill_ids = []
+            matched_skills = []
+
+            for skill in extraction_result.normalized_skills:
+                skill_ids.append(skill.id)
+                matched_skills.append(skill.name)
+
+            self.logger.debug(f"Matched skills for job {job_id}: {matched_skills}")
+
+            # create skills that do not yet exist
+            new_skills = []
+            if extraction_result.unmatched_skills:
+                success, created, error = self.skill_service.create_skills(extraction_result.unmatched_skills)
+                if success:
+                    for skill_name, skill in created.items():
+                        if skill.id not in skill_ids:
+                            skill_ids.append(skill.id)
+                            new_skills.append(skill_name)
+                else:
+                    self.logger.error(f"Error creating skills {extraction_result.unmatched_skills}: {error}")
+
+            if new_skills:
+                self.logger.info(f"Created new skills for job {job_id}: {new_skills}")
+
+            # Replace the job's links (stale ones included) and mark it done in one transaction
+            def _link_skills():
+                counts = self._sync_job_skill_links(job_id, skill_ids)
+                self._update_skill_extraction_status(job_id, SkillExtractionStatus.DONE)
+                return counts
+
+            success, counts, error = self.safe_execute(_link_skills)
+            if not success:
+                self.logger.error(f"Failed to link skills to job {job_id}: {error}")
+                self._set_skill_extraction_status(job_id, SkillExtractionStatus.FAILED)
+                return False, None
+
+            self.logger.info(f"Skill extraction completed for job {job_id}: "
+                           f"{len(matched_skills)} matched, {len(new_skills)} created, "
+                           f"{counts[0]} linked, {counts[1]} unlinked")
+            return True, extraction_result.normalized_skills
+        else:
+            self.logger.warning(f"Skill extraction failed for job {job_id}: "
+                              f"{getattr(extraction_result, 'error', 'Unknown error')}")
+            self._set_skill_extraction_status(job_id, SkillExtractionStatus.FAILED)
             return False, None
 
+    def _set_skill_extraction_status(self, job_id, status):
+        """Record the skill extraction state without touching last_update"""
+        success, _, error = self.safe_execute(self._update_skill_extraction_status, job_id, status)
+        if not success:
+            self.logger.error(f"Failed to set skill extraction status for job {job_id}: {error}")
+
+    @staticmethod
+    def _update_skill_extraction_status(job_id, status):
+        """Set the skill extraction state (no commit)"""
+        return JobApplication.query.filter_by(id=job_id).update(
+            {'skill_extraction_status': status.value, 'last_update': JobApplication.last_update},
+            synchronize_session='fetch'
+        )
+
     def get_job_skills(self, job_id, get_blacklisted=False):
         """Get skills for a specific job"""
         self.logger.debug(f"Fetching skills for job ID: {job_id}")
@@ -738,3 +1154,11 @@ class JobService(BaseService):
                 matched_skills_by_category[category] = matched_skills
         
         return matched_skills_by_category, missing_skills_by_category
+
+
+@event.listens_for(Session, 'after_flush')
+def _bump_job_count_generation(session, flush_context):
+    global _job_count_generation
+    if any(isinstance(instance, (JobApplication, JobLog))
+           for instance in (*session.new, *session.dirty, *session.deleted)):
+        _job_count_generation += 1
@@ -4,6 +4,7 @@ Log service for handling job log business logic
 from datetime import datetime, timezone
 from models import JobLog, JobApplication, ApplicationStatus, db
 from .base_service import BaseService
+from .search_service import SearchService
 
 
 class LogService(BaseService):
@@ -250,20 +251,24 @@ class LogService(BaseService):
     
     def search_logs(self, search_term, job_id=None):
         """
-        Search logs by content
+        Search logs by content, through the full-text index when available
         
         Args:
-            search_term: Term to search for
+            search_term: Term to search for (words match as prefixes, "quoted words" as phrases)
             job_id: Optional job ID filter
             
         Returns:
             List of JobLog instances matching the search
         """
         try:
-            search_pattern = f'%{search_term}%'
-            query = JobLog.query.filter(
-                JobLog.note.ilike(search_pattern)
-            )
+            hits = SearchService().log_hits(search_term)
+            if hits is not None:
+                query = JobLog.query.join(hits, hits.c.log_id == JobLog.id)
+            else:
+                search_pattern = f'%{search_term}%'
+                query = JobLog.query.filter(
+                    JobLog.note.ilike(search_pattern)
+                )
             
             if job_id:
                 query = query.filter(JobLog.job_id == job_id)
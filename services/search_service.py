@@ -0,0 +1,179 @@
+"""
+Full-text search over job applications and log notes
+
+Uses the SQLite FTS5 tables of models.search: searches are index lookups
+ranked with bm25, and snippets show the matched words. When the tables are
+not available (another engine, or a SQLite build without FTS5), or the query
+relies on symbols the index drops, the callers fall back to LIKE filters.
+"""
+import re
+from typing import Dict, Iterable, List, Optional
+
+from markupsafe import Markup, escape
+from sqlalchemy import Float, Integer, bindparam, text
+
+from models import db
+from models.search import search_index_available
+
+from .base_service import BaseService
+
+# A quoted phrase (closing quote optional while typing) or a bare word
+_QUERY_PART = re.compile(r'"([^"]*)"?|(\S+)')
+_TOKEN = re.compile(r'\w+')
+# Dropped by the index tokenizer, yet they tell skills apart: "C++" and "C#" would both search for "c"
+_UNINDEXED_SYMBOL = re.compile(r'[+#]')
+# A dot inside a word ("node.js", "asp.net") joins the parts of one name
+_DOTTED_WORD = re.compile(r'\w\.\w')
+
+# bm25 weights of the job_search columns: company, title, description
+JOB_COLUMN_WEIGHTS = (5.0, 10.0, 1.0)
+# Relative weight of log note matches when ranking jobs
+NOTE_WEIGHT = 0.5
+
+SNIPPET_TOKENS = 24
+# Jobs per IN clause when building snippets
+SNIPPET_CHUNK_SIZE = 500
+# Placed around matched words by snippet(), replaced by <mark> after escaping the text
+_MARK_START, _MARK_END = '\x02', '\x03'
+
+
+def match_expression(search_query: Optional[str]) -> Optional[str]:
+    """
+    FTS5 MATCH expression for a search box query
+
+    Every part must match: a bare word as a prefix ("kube" finds Kubernetes),
+    a "quoted phrase" as consecutive words. Punctuation splits words as the
+    index tokenizer does, so "node.js" matches exactly the phrase "node js".
+
+    Returns:
+        The expression, or None if the query has no word to search for or
+        contains a '+' or '#' the index cannot match (search with LIKE then)
+    """
+    parts = []
+    for phrase, word in _QUERY_PART.findall(search_query or ''):
+        if _UNINDEXED_SYMBOL.search(phrase or word):
+            return None
+        tokens = _TOKEN.findall(phrase or word)
+        if not tokens:
+            continue
+        exact = phrase or _DOTTED_WORD.search(word)
+        parts.append(f'"{" ".join(tokens)}"' if exact else f'"{" ".join(tokens)}"*')
+    return ' AND '.join(parts) or None
+
+
+def search_terms(search_query: Optional[str]) -> List[str]:
+    """Words and "quoted phrases" of a search box query, for LIKE filters"""
+    terms = []
+    for phrase, word in _QUERY_PART.findall(search_query or ''):
+        term = (phrase or word).strip()
+        if term:
+            terms.append(term)
+    return terms
+
+
+def _highlight(snippet: str) -> Markup:
+    return Markup(str(escape(snippet)).replace(_MARK_START, '<mark>').replace(_MARK_END, '</mark>'))
+
+
+class SearchService(BaseService):
+    """Full-text search of jobs and log notes"""
+
+    @property
+    def available(self) -> bool:
+        """Whether the FTS5 search tables can be used"""
+        return search_index_available(db.engine)
+
+    def job_hits(self, search_query: Optional[str], ranked: bool = True):
+        """
+        Jobs whose company, title, description or log notes match the query
+
+        bm25 scores are negative, so summing them ranks jobs matching in
+        several places first. Scoring every match costs more than finding
+        them, so counts should use ranked=False.
+
+        Returns:
+            A subquery of (job_id, rank) to join on, lower ranks first, or only
+            (job_id) when not ranked; None when full-text search cannot handle
+            the query
+        """
+        expression = match_expression(search_query)
+        if expression is None or not self.available:
+            return None
+
+        if not ranked:
+            return text("""
+                SELECT rowid AS job_id FROM job_search WHERE job_search MATCH :match
+                UNION
+                SELECT job_id FROM job_log_search WHERE job_log_search MATCH :match
+            """).bindparams(match=expression).columns(job_id=Integer).subquery('job_search_hits')
+
+        return text(f"""
+            SELECT job_id, SUM(rank) AS rank FROM (
+                SELECT rowid AS job_id, bm25(job_search, {', '.join(map(str, JOB_COLUMN_WEIGHTS))}) AS rank
+                FROM job_search WHERE job_search MATCH :match
+                UNION ALL
+                SELECT job_id, {NOTE_WEIGHT} * bm25(job_log_search) AS rank
+                FROM job_log_search WHERE job_log_search MATCH :match
+            ) GROUP BY job_id
+        """).bindparams(match=expression).columns(job_id=Integer, rank=Float).subquery('job_search_hits')
+
+    def log_hits(self, search_term: Optional[str]):
+        """
+        Log entries whose note matches the query
+
+        Returns:
+            A subquery of (log_id, rank) to join on, or None when full-text
+            search cannot handle the query
+        """
+        expression = match_expression(search_term)
+        if expression is None or not self.available:
+            return None
+
+        return text(
+            "SELECT rowid AS log_id, bm25(job_log_search) AS rank FROM job_log_search WHERE job_log_search MATCH :match"
+        ).bindparams(match=expression).columns(log_id=Integer, rank=Float).subquery('job_log_search_hits')
+
+    def job_snippets(self, search_query: Optional[str], job_ids: Iterable[int]) -> Dict[int, Markup]:
+        """
+        Highlighted excerpts of the given jobs around the words matching the query
+
+        The excerpt is taken from the description, or from the best matching
+        log note when the description has no match.
+
+        Returns:
+            dict: Job ID -> HTML-safe excerpt, for jobs with a match in either
+        """
+        expression = match_expression(search_query)
+        job_ids = list(job_ids)
+        if expression is None or not job_ids or not self.available:
+            return {}
+
+        snippet_args = f"'{_MARK_START}', '{_MARK_END}', '…', {SNIPPET_TOKENS}"
+        description_snippets = text(f"""
+            SELECT rowid, snippet(job_search, 2, {snippet_args}) FROM job_search
+            WHERE job_search MATCH :match AND rowid IN :job_ids
+        """).bindparams(bindparam('job_ids', expanding=True))
+        note_snippets = text(f"""
+            SELECT job_id, snippet(job_log_search, 0, {snippet_args}) FROM job_log_search
+            WHERE job_log_search MATCH :match AND job_id IN :job_ids
+            ORDER BY rank
+        """).bindparams(bindparam('job_ids', expanding=True))
+
+        snippets = {}
+        try:
+            for start in range(0, len(job_ids), SNIPPET_CHUNK_SIZE):
+                chunk = job_ids[start:start + SNIPPET_CHUNK_SIZE]
+                rows = db.session.execute(description_snippets, {'match': expression, 'job_ids': chunk})
+                # Title or company matches leave the description unmarked
+                snippets.update((job_id, _highlight(snippet)) for job_id, snippet in rows if _MARK_START in snippet)
+
+                remaining = [job_id for job_id in chunk if job_id not in snippets]
+                if remaining:
+                    rows = db.session.execute(note_snippets, {'match': expression, 'job_ids': remaining})
+                    for job_id, snippet in rows:
+                        snippets.setdefault(job_id, _highlight(snippet))
+            return snippets
+
+        except Exception as e:
+            self.logger.error(f"Error building search snippets: {str(e)}")
+            return {}
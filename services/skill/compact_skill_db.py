@@ -0,0 +1,282 @@
+"""
+Compact, memory-mapped copy of SkillNER's SKILL_DB
+
+skillNer keeps SKILL_DB as a dict of dicts (tens of thousands of skills,
+each with nested surface-form dicts and lists), a private copy of Python
+objects in every process that loads SkillNER. This
+module stores the same data once on disk as an interned string table plus
+fixed-width attribute arrays and serves it through a read-only Mapping
+backed by mmap. The pages belong to the OS page cache, so every worker on
+the host shares one copy and the per-process resident set shrinks.
+
+Records are exposed with SKILL_DB's field names (including skillNer's
+"high_surfce_forms" spelling), so SkillNER's matchers and scoring read
+them unchanged.
+
+File layout: b"SKDB", a 4-byte header length, a JSON header (format,
+source hash and the offset/length/typecode of every section), then the
+8-byte aligned sections.
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+from array import array
+from collections.abc import Mapping
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Dict, Iterator, Optional
+
+import srsly
+
+MAGIC = b'SKDB'
+FORMAT = 1
+_HEADER_LENGTH = struct.Struct('<I')
+
+# Fields of a SKILL_DB record this format stores
+FIELDS = ('skill_name', 'skill_type', 'skill_len', 'high_surfce_forms', 'low_surface_forms', 'match_on_tokens')
+SURFACE_FORMS = ('full', 'abv')
+
+# File skillNer's general_params loads SKILL_DB from (and saves a download to), in the working directory
+SKILLNER_SKILL_DB_FILE = 'skill_db_relax_20.json'
+
+
+def skill_db_fingerprint(skills_db: Mapping, source_path: Optional[str] = None) -> str:
+    """
+    Identity of a SKILL_DB's content (for compact copies, the identity of their source)
+
+    Given the file the dict was loaded from, the skillNer version and the
+    file's size and mtime stand for the content, so checking a compact copy
+    or snapshot never serializes the dict. Otherwise the content is hashed.
+    """
+    if isinstance(skills_db, CompactSkillDB):
+        return skills_db.source_hash
+    if source_path:
+        try:
+            stat = os.stat(source_path)
+            return f"skillNer-{_skillner_version()}:{stat.st_size}:{stat.st_mtime_ns}"
+        except OSError:
+            pass
+    return hashlib.sha256(srsly.json_dumps(skills_db, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def _skillner_version() -> str:
+    try:
+        return version('skillNer')
+    except PackageNotFoundError:
+        return 'unknown'
+
+
+class _StringTable:
+    """Interns strings while building, assigning each distinct string one index"""
+
+    def __init__(self):
+        self.index: Dict[str, int] = {}
+        self.data = bytearray()
+        self.offsets = array('I', [0])
+
+    def add(self, value: str) -> int:
+        position = self.index.get(value)
+        if position is None:
+            position = self.index[value] = len(self.offsets) - 1
+            self.data += value.encode('utf-8')
+            self.offsets.append(len(self.data))
+        return position
+
+
+class CompactSkillDB(Mapping):
+    """Read-only SKILL_DB backed by a memory-mapped file"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mmap[:4] != MAGIC:
+            raise ValueError(f"{path} is not a compact skill database")
+        (header_length,) = _HEADER_LENGTH.unpack_from(self._mmap, 4)
+        header = json.loads(self._mmap[8:8 + header_length])
+        if header.get('format') != FORMAT:
+            raise ValueError(f"{path} has format {header.get('format')}, expected {FORMAT}")
+
+        self.source_hash: str = header['source_hash']
+        self._view = memoryview(self._mmap)
+        self._sections = {
+            name: self._view[offset:offset + length].cast(typecode)
+            for name, (offset, length, typecode) in header['sections'].items()
+        }
+        self._count = len(self._sections['key'])
+
+    # =============================================================================
+    # Building
+    # =============================================================================
+
+    @staticmethod
+    def build(path: str, skills_db: Mapping, source_hash: Optional[str] = None) -> None:
+        """
+        Write a compact copy of a SKILL_DB dict
+
+        Raises:
+            ValueError: if a record has fields this format does not store
+        """
+        strings = _StringTable()
+        sections = {
+            'key': array('I'), 'name': array('I'), 'type': array('I'), 'full': array('I'),
+            'abv': array('i'), 'skill_len': array('H'), 'match_on_tokens': array('B'),
+            'low_start': array('I', [0]), 'low_forms': array('I'),
+        }
+
+        for key, record in skills_db.items():
+            unknown = set(record) - set(FIELDS) or set(record['high_surfce_forms']) - set(SURFACE_FORMS)
+            if unknown:
+                raise ValueError(f"Skill {key} has unsupported fields: {', '.join(sorted(unknown))}")
+
+            surface_forms = record['high_surfce_forms']
+            sections['key'].append(strings.add(key))
+            sections['name'].append(strings.add(record['skill_name']))
+            sections['type'].append(strings.add(record['skill_type']))
+            sections['full'].append(strings.add(surface_forms['full']))
+            sections['abv'].append(strings.add(surface_forms['abv']) if 'abv' in surface_forms else -1)
+            sections['skill_len'].append(record['skill_len'])
+            sections['match_on_tokens'].append(1 if record['match_on_tokens'] else 0)
+            sections['low_forms'].extend(strings.add(form) for form in record['low_surface_forms'])
+            sections['low_start'].append(len(sections['low_forms']))
+
+        keys = [key for key in skills_db]
+        sections['key_order'] = array('I', sorted(range(len(keys)), key=keys.__getitem__))
+        sections['string_offsets'] = strings.offsets
+        sections['string_data'] = array('B', bytes(strings.data))
+
+        # Section offsets depend on the header length, so lay out the body first
+        body = bytearray()
+        layout = {}
+        for name, values in sections.items():
+            body += b'\0' * (-len(body) % 8)
+            layout[name] = [len(body), len(values) * values.itemsize, values.typecode]
+            body += values.tobytes()
+
+        header = {'format': FORMAT, 'source_hash': source_hash or skill_db_fingerprint(skills_db), 'sections': {}}
+        # Absolute offsets change the header's own length; grow the reserved space until they fit
+        base = 8
+        while True:
+            header['sections'] = {name: [base + offset, length, typecode]
+                                  for name, (offset, length, typecode) in layout.items()}
+            header_bytes = json.dumps(header).encode('utf-8')
+            if 8 + len(header_bytes) <= base:
+                break
+            base = 8 + len(header_bytes) + 16
+            base += -base % 8
+        header_bytes = header_bytes.ljust(base - 8)
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(MAGIC + _HEADER_LENGTH.pack(len(header_bytes)) + header_bytes)
+            f.write(body)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def open_or_build(cls, path: str, skills_db: Mapping, source_hash: Optional[str] = None) -> 'CompactSkillDB':
+        """
+        Open the compact copy at path, rebuilding it if it is missing or from another SKILL_DB
+
+        Args:
+            source_hash: skill_db_fingerprint of skills_db, if already known
+        """
+        source_hash = source_hash or skill_db_fingerprint(skills_db)
+        if os.path.exists(path):
+            try:
+                compact = cls(path)
+                if compact.source_hash == source_hash:
+                    return compact
+                compact.close()
+            except (OSError, ValueError, KeyError):
+                pass
+
+        cls.build(path, skills_db, source_hash)
+        return cls(path)
+
+    def close(self) -> None:
+        for section in self._sections.values():
+            section.release()
+        self._sections = {}
+        self._view.release()
+        self._mmap.close()
+
+    # =============================================================================
+    # Mapping interface
+    # =============================================================================
+
+    def _string(self, position: int) -> str:
+        offsets = self._sections['string_offsets']
+        return bytes(self._sections['string_data'][offsets[position]:offsets[position + 1]]).decode('utf-8')
+
+    def _find(self, key: str) -> int:
+        """Record index of a key (binary search over the sorted key order), or -1"""
+        order, keys = self._sections['key_order'], self._sections['key']
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            candidate = self._string(keys[order[middle]])
+            if candidate < key:
+                low = middle + 1
+            elif candidate > key:
+                high = middle
+            else:
+                return order[middle]
+        return -1
+
+    def __getitem__(self, key: str) -> 'CompactSkillRecord':
+        index = self._find(key) if isinstance(key, str) else -1
+        if index < 0:
+            raise KeyError(key)
+        return CompactSkillRecord(self, index)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._find(key) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        keys = self._sections['key']
+        return (self._string(keys[index]) for index in range(self._count))
+
+    def __len__(self) -> int:
+        return self._count
+
+
+class CompactSkillRecord(Mapping):
+    """One SKILL_DB record, decoded field by field on access"""
+
+    __slots__ = ('_db', '_index')
+
+    def __init__(self, db: CompactSkillDB, index: int):
+        self._db = db
+        self._index = index
+
+    def __getitem__(self, field: str) -> Any:
+        sections, index = self._db._sections, self._index
+        if field == 'skill_name':
+            return self._db._string(sections['name'][index])
+        if field == 'skill_type':
+            return self._db._string(sections['type'][index])
+        if field == 'skill_len':
+            return sections['skill_len'][index]
+        if field == 'match_on_tokens':
+            return bool(sections['match_on_tokens'][index])
+        if field == 'high_surfce_forms':
+            surface_forms = {'full': self._db._string(sections['full'][index])}
+            if sections['abv'][index] >= 0:
+                surface_forms['abv'] = self._db._string(sections['abv'][index])
+            return surface_forms
+        if field == 'low_surface_forms':
+            start, end = sections['low_start'][index], sections['low_start'][index + 1]
+            return [self._db._string(position) for position in sections['low_forms'][start:end]]
+        raise KeyError(field)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(FIELDS)
+
+    def __len__(self) -> int:
+        return len(FIELDS)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {field: self[field] for field in FIELDS}
@@ -0,0 +1,277 @@
+"""
+Persistent cache of raw extraction results
+
+SkillNER annotation is by far the most expensive step of skill processing,
+and most saves of a job leave its description untouched. Results are stored
+in the database keyed by a hash of the cleaned text and the extraction
+config version, so an unchanged description is never annotated twice, even
+across restarts. With section chunking each '#### ' section is cached on its
+own, so an edit to one section leaves the others cached. Entries are evicted
+least-recently-used once the table grows past its maximum size.
+
+Lookups only read: the hits they record are written with the next store, in
+its transaction, so a lookup never commits or rolls back the caller's session.
+"""
+import hashlib
+import json
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from flask import current_app
+from sqlalchemy import bindparam, update
+from sqlalchemy.exc import SQLAlchemyError
+
+from models import SkillExtractionCacheEntry, db
+from configurations.skill_config import SkillExtractionConfig
+from dtos.skill_dtos import ExtractedSkillsResult
+from utils.text_processing import TextProcessor
+from services.skill.extractor_backends import get_backend_class
+
+from ..base_service import BaseService
+
+DEFAULT_MAX_ENTRIES = 5000
+# Keys per IN clause when looking up several texts
+LOOKUP_CHUNK_SIZE = 500
+
+
+class ExtractionCacheService(BaseService):
+    """Database-backed LRU cache of extracted skill lists"""
+
+    def __init__(self, config: SkillExtractionConfig):
+        super().__init__()
+        self.config_version = config.version()
+        self.backend_cacheable = get_backend_class(config.EXTRACTOR_BACKEND).cacheable
+        self._hits = 0
+        self._misses = 0
+        self._counter_lock = threading.Lock()
+        # Hits not written yet: key -> (hit count, last use)
+        self._touched: Dict[str, Tuple[int, datetime]] = {}
+        # Upper bound of the table size, counted again once it passes max_entries (None: not counted yet)
+        self._size_bound: Optional[int] = None
+        self._bound_version: Optional[str] = None
+
+    @property
+    def max_entries(self) -> int:
+        """Maximum number of cached texts, i.e. description sections (0 disables the cache)"""
+        try:
+            return int(current_app.config.get('SKILL_EXTRACTION_CACHE_SIZE', DEFAULT_MAX_ENTRIES))
+        except RuntimeError:
+            return DEFAULT_MAX_ENTRIES
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend_cacheable and self.max_entries > 0
+
+    def make_key(self, text: str) -> Optional[str]:
+        """Hash the cleaned text together with the config version"""
+        cleaned_text = TextProcessor.clean_text(text)
+        if not cleaned_text:
+            return None
+        payload = f"{self.config_version}\n{cleaned_text}".encode('utf-8')
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, text: str) -> Optional[ExtractedSkillsResult]:
+        """
+        Look up the extraction result for a text
+
+        Args:
+            text: Raw description text
+
+        Returns:
+            ExtractedSkillsResult on a hit, None on a miss
+        """
+        return self.get_many([text]).get(text)
+
+    def get_many(self, texts: Iterable[str]) -> Dict[str, ExtractedSkillsResult]:
+        """
+        Look up the extraction results of several texts in one query
+
+        Args:
+            texts: Raw description texts
+
+        Returns:
+            dict: Text -> ExtractedSkillsResult, for hits only
+        """
+        if not self.enabled:
+            return {}
+
+        texts_by_key: Dict[str, List[str]] = {}
+        for text in texts:
+            key = self.make_key(text)
+            if key is not None:
+                texts_by_key.setdefault(key, []).append(text)
+        if not texts_by_key:
+            return {}
+
+        keys = list(texts_by_key)
+        query = db.session.query(SkillExtractionCacheEntry.content_hash, SkillExtractionCacheEntry.skills)
+        try:
+            rows = []
+            for start in range(0, len(keys), LOOKUP_CHUNK_SIZE):
+                chunk = keys[start:start + LOOKUP_CHUNK_SIZE]
+                rows += query.filter(SkillExtractionCacheEntry.content_hash.in_(chunk)).all()
+            found = {key: json.loads(skills) for key, skills in rows}
+        except (SQLAlchemyError, ValueError) as e:
+            self.logger.warning(f"Extraction cache lookup failed: {e}")
+            self._count(hits=0, misses=len(keys))
+            return {}
+
+        now = datetime.now(timezone.utc)
+        with self._counter_lock:
+            for key in found:
+                count, _ = self._touched.get(key, (0, now))
+                self._touched[key] = (count + 1, now)
+        self._count(hits=len(found), misses=len(keys) - len(found))
+
+        return {
+            text: ExtractedSkillsResult(skills=list(skills), total_skills=len(skills), success=True)
+            for key, skills in found.items()
+            for text in texts_by_key[key]
+        }
+
+    def put(self, text: str, result: ExtractedSkillsResult) -> bool:
+        """
+        Store a successful extraction result for a text
+
+        Args:
+            text: Raw description text the result was extracted from
+            result: Extraction result; failed results are not cached
+
+        Returns:
+            bool: True if the result was stored
+        """
+        return self.put_many([(text, result)]) > 0
+
+    def put_many(self, items: Iterable[Tuple[str, ExtractedSkillsResult]]) -> int:
+        """
+        Store several (text, result) pairs in one transaction
+
+        Returns:
+            int: Number of results stored
+        """
+        if not self.enabled:
+            return 0
+
+        entries = {}
+        for text, result in items:
+            key = self.make_key(text) if result.success else None
+            if key is not None:
+                entries[key] = result.skills
+        if not entries:
+            return 0
+
+        with self._counter_lock:
+            touched, self._touched = self._touched, {}
+
+        def _store():
+            now = datetime.now(timezone.utc)
+            # Hits recorded by lookups since the last store, so eviction sees them
+            touched_rows = [
+                {'key': key, 'hits': count, 'used_at': used_at}
+                for key, (count, used_at) in touched.items() if key not in entries
+            ]
+            if touched_rows:
+                table = SkillExtractionCacheEntry.__table__
+                db.session.execute(
+                    update(table)
+                    .where(table.c.content_hash == bindparam('key'))
+                    .values(hit_count=table.c.hit_count + bindparam('hits'), last_used_at=bindparam('used_at')),
+                    touched_rows
+                )
+            for key, skills in entries.items():
+                db.session.merge(SkillExtractionCacheEntry(
+                    content_hash=key,
+                    config_version=self.config_version,
+                    skills=json.dumps(skills),
+                    hit_count=0,
+                    last_used_at=now
+                ))
+            db.session.flush()
+            self._evict(len(entries))
+
+        success, _, error = self.safe_execute(_store)
+        if not success:
+            self.logger.warning(f"Failed to cache extraction results: {error}")
+            return 0
+        return len(entries)
+
+    def _evict(self, added: int) -> None:
+        """
+        Drop entries from older config versions, then the least recently used overflow
+
+        The table is only counted when this process may have filled it: at its
+        first store (or the first after a config version change), then whenever
+        its own inserts since the last count could have pushed the table past
+        max_entries.
+        """
+        if self._size_bound is not None and self._bound_version == self.config_version:
+            self._size_bound += added
+            if self._size_bound <= self.max_entries:
+                return
+
+        SkillExtractionCacheEntry.query.filter(
+            SkillExtractionCacheEntry.config_version != self.config_version
+        ).delete(synchronize_session=False)
+
+        size = SkillExtractionCacheEntry.query.count()
+        overflow = size - self.max_entries
+        self._size_bound = min(size, self.max_entries)
+        self._bound_version = self.config_version
+        if overflow <= 0:
+            return
+
+        oldest = (db.session.query(SkillExtractionCacheEntry.content_hash)
+                  .order_by(SkillExtractionCacheEntry.last_used_at)
+                  .limit(overflow))
+        SkillExtractionCacheEntry.query.filter(
+            SkillExtractionCacheEntry.content_hash.in_(oldest.scalar_subquery())
+        ).delete(synchronize_session=False)
+        self.logger.debug(f"Evicted {overflow} extraction cache entries")
+
+    def clear(self) -> int:
+        """Remove every cached result and reset the counters"""
+        success, deleted, error = self.safe_execute(
+            lambda: SkillExtractionCacheEntry.query.delete(synchronize_session=False)
+        )
+        if not success:
+            self.logger.error(f"Failed to clear extraction cache: {error}")
+            return 0
+
+        with self._counter_lock:
+            self._hits = 0
+            self._misses = 0
+            self._touched = {}
+        self._size_bound = None
+        return deleted
+
+    @property
+    def hits(self) -> int:
+        """Cache hits in this process"""
+        with self._counter_lock:
+            return self._hits
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process and the current cache size"""
+        with self._counter_lock:
+            hits, misses = self._hits, self._misses
+
+        try:
+            size = SkillExtractionCacheEntry.query.count()
+        except SQLAlchemyError:
+            size = None
+
+        lookups = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / lookups, 3) if lookups else 0.0,
+            'size': size,
+            'max_entries': self.max_entries,
+            'config_version': self.config_version,
+        }
+
+    def _count(self, hits: int, misses: int) -> None:
+        with self._counter_lock:
+            self._hits += hits
+            self._misses += misses
@@ -0,0 +1,148 @@
+"""
+Background skill extraction for saved jobs
+
+SkillNER annotation is CPU-bound and takes seconds per posting, so running
+it inside a request holds the web worker (and the GIL) for that long. When
+SKILL_EXTRACTION_WORKERS > 0 the annotation runs in a pool of worker
+processes that each keep a loaded SkillExtractor; the result is written back
+by a single writer thread so database writes stay serialized.
+"""
+import atexit
+import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, Future
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional
+
+from configurations.skill_config import SkillExtractionConfig
+from dtos.skill_dtos import ExtractedSkillsResult
+from services.skill.extractor_backends import get_backend_class
+from services.skill import extraction_worker
+
+logger = logging.getLogger(__name__)
+
+
+class SkillExtractionExecutor:
+    """Runs skill extraction for saved jobs in a pool of worker processes"""
+
+    def __init__(self, app=None):
+        self.app = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._workers = 0
+        if app:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Start the worker pool if the app is configured for background extraction"""
+        workers = app.config.get('SKILL_EXTRACTION_WORKERS', 0)
+        if workers <= 0 or self._pool is not None:
+            return
+
+        # Worker processes would each load their own models, which the sidecar exists to avoid
+        if app.config.get('SKILL_EXTRACTION_SIDECAR'):
+            logger.info("Skill extraction sidecar configured, not starting worker processes")
+            return
+
+        # Catalog matching takes milliseconds and must see catalog edits immediately
+        if not get_backend_class(SkillExtractionConfig.EXTRACTOR_BACKEND).cacheable:
+            logger.info("Catalog skill extractor in use, extracting inline without worker processes")
+            return
+
+        self.app = app
+        self._workers = workers
+        self._pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=extraction_worker.get_pool_context(),
+            initializer=extraction_worker.init_worker
+        )
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='skill-writer')
+        atexit.register(self.shutdown)
+        logger.info(f"Skill extraction executor started with {workers} worker process(es)")
+
+    @property
+    def enabled(self) -> bool:
+        """Whether jobs can be handed to the worker pool"""
+        return self._pool is not None
+
+    @property
+    def max_workers(self) -> int:
+        """Number of worker processes (0 when the pool is not running)"""
+        return self._workers if self._pool is not None else 0
+
+    def submit(self, job_id: int, description: str, texts: List[str]) -> bool:
+        """
+        Queue skill extraction for a job
+
+        Args:
+            job_id: ID of the job
+            description: Full description, to detect edits made while queued
+            texts: Parts of the description to annotate (its uncached sections)
+
+        Returns:
+            bool: True if queued; False if the caller should extract inline
+        """
+        if not self.enabled:
+            return False
+
+        try:
+            future = self._pool.submit(extraction_worker.extract_skills_many, (job_id, texts))
+        except (BrokenProcessPool, RuntimeError) as e:
+            logger.error(f"Skill extraction pool unavailable, falling back to inline extraction: {e}")
+            return False
+
+        future.add_done_callback(
+            lambda f: self._writer.submit(self._store_result, job_id, description, texts, f)
+        )
+        return True
+
+    def map(self, texts: List[str]) -> Optional[List[ExtractedSkillsResult]]:
+        """
+        Extract several texts in parallel across the worker processes and wait for them
+
+        Returns:
+            Results in input order, or None if the caller should extract inline
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            return [result for _, result in self._pool.map(extraction_worker.extract_skills, enumerate(texts))]
+        except (BrokenProcessPool, RuntimeError) as e:
+            logger.error(f"Skill extraction pool unavailable, falling back to inline extraction: {e}")
+            return None
+
+    def _store_result(self, job_id: int, description: str, texts: List[str], future: Future) -> None:
+        """Write a finished extraction back to the database (runs on the writer thread)"""
+        try:
+            _, results = future.result()
+        except Exception as e:
+            results = [
+                ExtractedSkillsResult(
+                    skills=[],
+                    total_skills=0,
+                    success=False,
+                    error=f"Extraction worker failed: {str(e)}"
+                )
+                for _ in texts
+            ]
+
+        from services.job_service import JobService
+
+        with self.app.app_context():
+            try:
+                JobService().apply_extraction_result(job_id, description, dict(zip(texts, results)))
+            except Exception as e:
+                logger.error(f"Error storing extracted skills for job {job_id}: {str(e)}", exc_info=True)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker pool and writer thread"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=not wait)
+            self._pool = None
+        if self._writer is not None:
+            self._writer.shutdown(wait=wait)
+            self._writer = None
+
+
+# Global executor instance
+extraction_executor = SkillExtractionExecutor()
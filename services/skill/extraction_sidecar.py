@@ -0,0 +1,231 @@
+"""
+Shared skill extraction sidecar
+
+Each web worker that loads SkillExtractor holds its own copy of the spaCy
+model and SkillNER matchers. With SKILL_EXTRACTION_SIDECAR set to a Unix
+socket path, workers instead forward extraction to one sidecar process
+(started with `flask skills sidecar`) that owns the only loaded copy.
+Normalization and categorization stay in the web worker, which has the
+database session.
+
+Wire format: every message is a 4-byte big-endian length followed by a
+msgpack map. Requests carry an "op" (extract, reload or ping); responses
+carry "ok" and either the result or an "error".
+"""
+import logging
+import os
+import socket
+import socketserver
+import struct
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+import srsly
+
+from dtos.skill_dtos import ExtractedSkillsResult
+from services.skill.extractor_backends import CatalogPhraseBackend
+
+logger = logging.getLogger(__name__)
+
+_HEADER = struct.Struct('>I')
+MAX_FRAME_BYTES = 64 * 1024 * 1024
+
+
+class SidecarError(Exception):
+    """Raised when the sidecar cannot be reached or rejects a request"""
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1 << 20))
+        if not chunk:
+            raise ConnectionError("Connection closed mid-frame")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def send_frame(sock: socket.socket, message: Dict[str, Any]) -> None:
+    payload = srsly.msgpack_dumps(message)
+    sock.sendall(_HEADER.pack(len(payload)) + payload)
+
+
+def recv_frame(sock: socket.socket) -> Optional[Dict[str, Any]]:
+    """Read one message, or None if the peer closed the connection cleanly"""
+    header = sock.recv(_HEADER.size)
+    if not header:
+        return None
+    header += _recv_exact(sock, _HEADER.size - len(header))
+
+    (size,) = _HEADER.unpack(header)
+    if size > MAX_FRAME_BYTES:
+        raise ValueError(f"Frame of {size} bytes exceeds the {MAX_FRAME_BYTES} byte limit")
+    return srsly.msgpack_loads(_recv_exact(sock, size))
+
+
+def _result_to_dict(result: ExtractedSkillsResult) -> Dict[str, Any]:
+    return {
+        'skills': result.skills,
+        'success': result.success,
+        'error': result.error,
+        'stage_timings': result.stage_timings,
+        'text_length': result.text_length,
+        'candidate_count': result.candidate_count,
+        'prefilter_dropped_chars': result.prefilter_dropped_chars,
+    }
+
+
+def _result_from_dict(data: Dict[str, Any]) -> ExtractedSkillsResult:
+    return ExtractedSkillsResult(
+        skills=data['skills'],
+        total_skills=len(data['skills']),
+        success=data['success'],
+        error=data.get('error'),
+        stage_timings=data.get('stage_timings') or {},
+        text_length=data.get('text_length', 0),
+        candidate_count=data.get('candidate_count', 0),
+        prefilter_dropped_chars=data.get('prefilter_dropped_chars', 0)
+    )
+
+
+# =============================================================================
+# Server
+# =============================================================================
+
+class _SidecarHandler(socketserver.BaseRequestHandler):
+    """Serves requests on one client connection until it closes"""
+
+    def handle(self):
+        while True:
+            try:
+                request = recv_frame(self.request)
+            except (ConnectionError, ValueError) as e:
+                logger.warning(f"Dropping sidecar client: {e}")
+                return
+            if request is None:
+                return
+
+            try:
+                response = {'ok': True, **self.server.dispatch(request)}
+            except Exception as e:
+                logger.error(f"Sidecar request failed: {e}", exc_info=True)
+                response = {'ok': False, 'error': str(e)}
+
+            try:
+                send_frame(self.request, response)
+            except OSError:
+                return
+
+
+class ExtractionSidecarServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server around a single loaded extractor"""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, extractor, reload_vocabulary=None):
+        self.socket_path = socket_path
+        self.extractor = extractor
+        self._reload_vocabulary = reload_vocabulary or extractor.reload_vocabulary
+        # One model, one caller at a time: annotation is CPU-bound and not thread-safe
+        self._extract_lock = threading.Lock()
+
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        super().__init__(socket_path, _SidecarHandler)
+        os.chmod(socket_path, 0o660)
+
+    def dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        op = request.get('op')
+        if op == 'extract':
+            texts = request.get('texts') or []
+            with self._extract_lock:
+                results = self.extractor.extract_skills_from_texts(texts)
+            return {'results': [_result_to_dict(result) for result in results]}
+        if op == 'reload':
+            with self._extract_lock:
+                self._reload_vocabulary()
+            return {}
+        if op == 'ping':
+            return {'pid': os.getpid(), 'backend': getattr(getattr(self.extractor, 'backend', None), 'name', None)}
+        raise ValueError(f"Unknown sidecar op '{op}'")
+
+    def server_close(self):
+        super().server_close()
+        try:
+            os.remove(self.socket_path)
+        except FileNotFoundError:
+            pass
+
+
+# =============================================================================
+# Client
+# =============================================================================
+
+class SidecarExtractorClient:
+    """Drop-in for SkillExtractor that forwards extraction to the sidecar"""
+
+    def __init__(self, socket_path: str, timeout: float = 60.0):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._backend: Optional[str] = None  # backend name reported by the sidecar, once known
+
+    def _call(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(self.timeout)
+                sock.connect(self.socket_path)
+                send_frame(sock, request)
+                response = recv_frame(sock)
+        except (OSError, ValueError) as e:
+            raise SidecarError(f"Extraction sidecar at {self.socket_path} unavailable: {e}")
+
+        if response is None:
+            raise SidecarError("Extraction sidecar closed the connection")
+        if not response.get('ok'):
+            raise SidecarError(f"Extraction sidecar error: {response.get('error')}")
+        return response
+
+    def extract_skills_from_texts(self, texts: List[str]) -> List[ExtractedSkillsResult]:
+        """Extract several texts in one round trip; an unreachable sidecar fails every text"""
+        try:
+            response = self._call({'op': 'extract', 'texts': list(texts)})
+        except SidecarError as e:
+            return [ExtractedSkillsResult(skills=[], total_skills=0, success=False, error=str(e)) for _ in texts]
+        return [_result_from_dict(data) for data in response['results']]
+
+    def extract_skills_from_text(self, text: str) -> ExtractedSkillsResult:
+        return self.extract_skills_from_texts([text])[0]
+
+    def ping(self) -> bool:
+        try:
+            self._backend = self._call({'op': 'ping'}).get('backend') or ''
+            return True
+        except SidecarError:
+            return False
+
+    @property
+    def follows_catalog(self) -> bool:
+        """
+        Whether the sidecar's vocabulary is the skill catalog, so skill edits must reach it
+
+        Raises:
+            SidecarError: If the sidecar has not answered yet and cannot be reached
+        """
+        if self._backend is None:
+            self._backend = self._call({'op': 'ping'}).get('backend') or ''
+        return self._backend == CatalogPhraseBackend.name
+
+    # The sidecar reloads its whole vocabulary; single-skill updates are not worth a protocol op.
+    # Fixed vocabularies (SkillNER's SKILL_DB) ignore skill edits, so nothing is sent for them.
+
+    def add_skill(self, name: str, variants: Iterable[str] = ()) -> None:
+        if self.follows_catalog:
+            self.reload_vocabulary()
+
+    def remove_skill(self, name: str) -> None:
+        if self.follows_catalog:
+            self.reload_vocabulary()
+
+    def reload_vocabulary(self) -> None:
+        self._call({'op': 'reload'})
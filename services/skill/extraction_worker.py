@@ -0,0 +1,70 @@
+"""
+Process-pool workers for skill extraction
+
+Each worker process loads its own SkillExtractor once (in the pool
+initializer) and reuses it for every task, so the model load cost is paid
+once per worker instead of once per document. Only plain strings cross the
+process boundary; normalization against the skill table stays in the parent,
+which owns the database session.
+"""
+import multiprocessing
+from typing import Any, List, Optional, Tuple
+
+from configurations.skill_config import SkillExtractionConfig
+from dtos.skill_dtos import ExtractedSkillsResult
+from services.skill.extractor_backends import CatalogPhraseBackend, CatalogTerm, load_catalog_terms
+from services.skill.skill_extractor import SkillExtractor
+
+_worker_extractor: Optional[SkillExtractor] = None
+
+
+def init_worker(catalog_terms: Optional[List[CatalogTerm]] = None) -> None:
+    """Pool initializer: load the NLP models into this worker process
+
+    Workers have no database access, so the catalog backend is built from
+    terms read by the parent (see pool_initargs).
+    """
+    global _worker_extractor
+    config = SkillExtractionConfig()
+    backend = CatalogPhraseBackend(config, catalog_terms) if catalog_terms is not None else None
+    _worker_extractor = SkillExtractor(config, backend=backend)
+
+
+def pool_initargs() -> Tuple:
+    """Arguments for init_worker, read in the parent (needs an app context)"""
+    if SkillExtractionConfig.EXTRACTOR_BACKEND == CatalogPhraseBackend.name:
+        return (load_catalog_terms(),)
+    return ()
+
+
+def extract_skills(item: Tuple[Any, str]) -> Tuple[Any, ExtractedSkillsResult]:
+    """Extract raw skills for one (key, text) pair, returning (key, result)"""
+    key, text = item
+    if _worker_extractor is None:
+        return key, ExtractedSkillsResult(
+            skills=[],
+            total_skills=0,
+            success=False,
+            error="Extraction worker not initialized"
+        )
+    return key, _worker_extractor.extract_skills_from_text(text)
+
+
+def extract_skills_many(item: Tuple[Any, List[str]]) -> Tuple[Any, List[ExtractedSkillsResult]]:
+    """Extract raw skills for several texts (e.g. the uncached sections of one job), returning (key, results)"""
+    key, texts = item
+    if _worker_extractor is None:
+        return key, [
+            ExtractedSkillsResult(skills=[], total_skills=0, success=False, error="Extraction worker not initialized")
+            for _ in texts
+        ]
+    return key, _worker_extractor.extract_skills_from_texts(texts)
+
+
+def get_pool_context():
+    """Multiprocessing context for extraction pools
+
+    Spawn rather than fork so workers don't inherit the parent's database
+    connections, logging handlers or background threads.
+    """
+    return multiprocessing.get_context("spawn")
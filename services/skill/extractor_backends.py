@@ -0,0 +1,256 @@
+"""
+Matching backends for SkillExtractor
+
+A backend turns cleaned text into candidate skill names; SkillExtractor then
+applies the noise filter and length rules. The backend is chosen with
+SkillExtractionConfig.EXTRACTOR_BACKEND:
+
+- skillner: SkillNER over its generic SKILL_DB (needs en_core_web_lg)
+- catalog:  spaCy PhraseMatcher over our own Skill and SkillVariant tables,
+            using only a blank English tokenizer
+"""
+import logging
+import os
+import time
+from typing import ClassVar, Dict, Iterable, List, Optional, Sequence, Tuple, Type
+
+import spacy
+from spacy.matcher import PhraseMatcher
+from spacy.util import filter_spans
+
+from configurations.skill_config import SkillExtractionConfig
+from exceptions.skill_exceptions import ModelNotLoadedError
+from services.skill.compact_skill_db import SKILLNER_SKILL_DB_FILE, CompactSkillDB, skill_db_fingerprint
+from services.skill.nlp_snapshot import SkillNerSnapshot
+from services.skill.pruned_model import load_model
+
+logger = logging.getLogger(__name__)
+
+COMPACT_SKILL_DB_FILE = 'skill_db.bin'
+
+# (canonical skill name, variant names)
+CatalogTerm = Tuple[str, Sequence[str]]
+
+
+class ExtractorBackend:
+    """Base class for skill matching backends"""
+
+    name: ClassVar[str] = ''
+    # Whether results depend only on the text and config (and may be cached)
+    cacheable: ClassVar[bool] = True
+    # Whether the vocabulary is SkillNER's SKILL_DB, which token_dist.json describes
+    uses_skill_db: ClassVar[bool] = False
+
+    def __init__(self, config: SkillExtractionConfig):
+        self.config = config
+
+    def find_candidates(self, cleaned_text: str) -> List[str]:
+        """Return candidate skill names found in the text, in match order"""
+        raise NotImplementedError
+
+    def find_candidates_batch(self, cleaned_texts: Sequence[str]) -> List[List[str]]:
+        """Candidates for several texts; backends that can batch their NLP work override this"""
+        return [self.find_candidates(text) for text in cleaned_texts]
+
+    def add_skill(self, name: str, variants: Iterable[str] = ()) -> None:
+        """Add or replace a skill in the backend vocabulary"""
+
+    def remove_skill(self, name: str) -> None:
+        """Remove a skill from the backend vocabulary"""
+
+    def reload(self) -> None:
+        """Rebuild the vocabulary from its source"""
+
+
+class SkillNerBackend(ExtractorBackend):
+    """SkillNER annotation over its bundled SKILL_DB"""
+
+    name = 'skillner'
+    uses_skill_db = True
+
+    def __init__(self, config: SkillExtractionConfig, use_snapshot: bool = True):
+        super().__init__(config)
+        self.use_snapshot = use_snapshot and bool(config.NLP_SNAPSHOT_DIR)
+        # How the matchers were obtained: "built", "restored" or "built+saved"
+        self.matcher_source = 'built'
+        self.load_seconds: Dict[str, float] = {}
+
+        started = time.perf_counter()
+        self.nlp = self._load_nlp_model()
+        self.load_seconds['model'] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        self.skill_extractor = self._load_skill_ner()
+        self.load_seconds['matchers'] = time.perf_counter() - started
+        logger.info(f"SkillNER ready: model {self.load_seconds['model']:.2f}s, "
+                    f"matchers {self.load_seconds['matchers']:.2f}s ({self.matcher_source})")
+
+    def _load_nlp_model(self):
+        """Load spaCy model"""
+        try:
+            return load_model(self.config.SPACY_MODEL)
+        except OSError:
+            raise ModelNotLoadedError(
+                f"SpaCy model '{self.config.SPACY_MODEL}' not found. "
+                f"Please download it using: python -m spacy download {self.config.SPACY_MODEL}"
+            )
+
+    def _load_skill_ner(self):
+        """Load SkillNER extractor"""
+        try:
+            # Imported here: skillNer builds SKILL_DB at import time, which is
+            # too slow to pay on every app start
+            from skillNer.skill_extractor_class import SkillExtractor as SkillNER
+            from skillNer import general_params
+
+            skills_db = self._load_skill_db(general_params)
+
+            snapshot = None
+            if self.use_snapshot:
+                snapshot = SkillNerSnapshot(self.config.NLP_SNAPSHOT_DIR, self.nlp, skills_db,
+                                            skill_db_fingerprint(skills_db, SKILLNER_SKILL_DB_FILE))
+                matchers = snapshot.load()
+                if matchers is not None:
+                    self.matcher_source = 'restored'
+                    return snapshot.restore_skill_ner(SkillNER, matchers)
+
+            skill_ner = SkillNER(self.nlp, skills_db, PhraseMatcher)
+            if snapshot is not None and snapshot.supported and snapshot.save(skill_ner.matchers):
+                self.matcher_source = 'built+saved'
+            return skill_ner
+        except Exception as e:
+            raise ModelNotLoadedError(f"Failed to load SkillNER: {str(e)}")
+
+    def _load_skill_db(self, general_params):
+        """SKILL_DB, as its memory-mapped compact copy when enabled"""
+        if not (self.config.COMPACT_SKILL_DB and self.config.NLP_SNAPSHOT_DIR):
+            return general_params.SKILL_DB
+        if isinstance(general_params.SKILL_DB, CompactSkillDB):
+            return general_params.SKILL_DB
+
+        path = os.path.join(self.config.NLP_SNAPSHOT_DIR, COMPACT_SKILL_DB_FILE)
+        try:
+            # Keyed on skillNer's source file, so an up-to-date copy opens without touching the dict
+            source_hash = skill_db_fingerprint(general_params.SKILL_DB, SKILLNER_SKILL_DB_FILE)
+            skills_db = CompactSkillDB.open_or_build(path, general_params.SKILL_DB, source_hash)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Using the in-memory SKILL_DB, compact copy unavailable: {e}")
+            return general_params.SKILL_DB
+
+        # Drop skillNer's reference so the parsed JSON dict can be freed
+        general_params.SKILL_DB = skills_db
+        return skills_db
+
+    def find_candidates(self, cleaned_text: str) -> List[str]:
+        annotations = self.skill_extractor.annotate(cleaned_text)
+        results = annotations.get('results') or {}
+
+        candidates = []
+        for group in ('full_matches', 'ngram_scored'):
+            for match in results.get(group) or []:
+                skill_name = match.get('doc_node_value')
+                if skill_name:
+                    candidates.append(skill_name.strip())
+        return candidates
+
+
+class CatalogPhraseBackend(ExtractorBackend):
+    """
+    Phrase matching against the curated skill catalog
+
+    Skill names and variants are matched case-insensitively, except short
+    names (such as "Go" or "R") which only match with their exact casing.
+    Matches resolve to the canonical skill name, and overlapping matches keep
+    the longest span.
+    """
+
+    name = 'catalog'
+    # Results change whenever the catalog does, so they are never cached
+    cacheable = False
+
+    def __init__(self, config: SkillExtractionConfig, terms: Optional[Iterable[CatalogTerm]] = None):
+        super().__init__(config)
+        self.nlp = spacy.blank('en')
+        self._terms: Dict[str, Tuple[str, ...]] = {}
+        self._build(load_catalog_terms() if terms is None else terms)
+
+    def _build(self, terms: Iterable[CatalogTerm]) -> None:
+        """Build both matchers from scratch and swap them in"""
+        self._lower_matcher = PhraseMatcher(self.nlp.vocab, attr='LOWER')
+        self._exact_matcher = PhraseMatcher(self.nlp.vocab, attr='ORTH')
+        self._terms = {}
+        for name, variants in terms:
+            self.add_skill(name, variants)
+
+    def _is_case_sensitive(self, term: str) -> bool:
+        return len(term) <= 2 or term in self.config.ALLOWED_SHORT_SKILLS
+
+    def add_skill(self, name: str, variants: Iterable[str] = ()) -> None:
+        self.remove_skill(name)
+
+        surface_forms = tuple(dict.fromkeys(t.strip() for t in (name, *variants) if t and t.strip()))
+        lower = [self.nlp.make_doc(t) for t in surface_forms if not self._is_case_sensitive(t)]
+        exact = [self.nlp.make_doc(t) for t in surface_forms if self._is_case_sensitive(t)]
+        if lower:
+            self._lower_matcher.add(name, lower)
+        if exact:
+            self._exact_matcher.add(name, exact)
+        self._terms[name] = surface_forms
+
+    def remove_skill(self, name: str) -> None:
+        if self._terms.pop(name, None) is None:
+            return
+        for matcher in (self._lower_matcher, self._exact_matcher):
+            if name in matcher:
+                matcher.remove(name)
+
+    def reload(self) -> None:
+        self._build(load_catalog_terms())
+
+    @property
+    def vocabulary_size(self) -> int:
+        """Number of skills in the matcher"""
+        return len(self._terms)
+
+    def find_candidates(self, cleaned_text: str) -> List[str]:
+        return self._match(self.nlp.make_doc(cleaned_text))
+
+    def find_candidates_batch(self, cleaned_texts: Sequence[str]) -> List[List[str]]:
+        return [self._match(doc) for doc in self.nlp.pipe(cleaned_texts, batch_size=self.config.PIPE_BATCH_SIZE)]
+
+    def _match(self, doc) -> List[str]:
+        spans = (self._lower_matcher(doc, as_spans=True)
+                 + self._exact_matcher(doc, as_spans=True))
+
+        # dict keeps first-seen order while dropping repeated skills
+        return list(dict.fromkeys(span.label_ for span in filter_spans(spans)))
+
+
+BACKENDS: Dict[str, Type[ExtractorBackend]] = {
+    backend.name: backend for backend in (SkillNerBackend, CatalogPhraseBackend)
+}
+
+
+def get_backend_class(name: str) -> Type[ExtractorBackend]:
+    """Look up a backend class by its config name"""
+    try:
+        return BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown skill extractor backend '{name}'. Choose from: {', '.join(BACKENDS)}")
+
+
+def create_backend(config: SkillExtractionConfig, **kwargs) -> ExtractorBackend:
+    """Build the backend selected in the config"""
+    return get_backend_class(config.EXTRACTOR_BACKEND)(config, **kwargs)
+
+
+def load_catalog_terms() -> List[CatalogTerm]:
+    """Read skill names and their variants from the database (needs an app context)"""
+    from models import Skill, SkillVariant, db
+
+    variants: Dict[int, List[str]] = {}
+    for skill_id, variant_name in db.session.query(SkillVariant.skill_id, SkillVariant.variant_name):
+        variants.setdefault(skill_id, []).append(variant_name)
+
+    return [(name, variants.get(skill_id, []))
+            for skill_id, name in db.session.query(Skill.id, Skill.name).order_by(Skill.id)]
@@ -0,0 +1,137 @@
+"""
+Character-trigram index for fuzzy skill name matching
+
+Exact lookups miss near-duplicates such as "Postgres SQL", "PostgreSQL 14"
+or "Node JS", which would otherwise become new skills. Names are reduced to
+a key (lowercase, trailing version numbers and separators removed) and
+indexed by the trigrams of that key; a query returns the indexed name with
+the highest trigram Jaccard similarity above a threshold.
+
+Queries stay sublinear through prefix filtering: a name with similarity
+>= t shares at least ceil(t * n) of the query's n trigrams, so it must
+appear in the posting list of one of the n - ceil(t * n) + 1 rarest query
+trigrams. Only those candidates are scored.
+"""
+import math
+import re
+from array import array
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+_VERSION_SUFFIX_RE = re.compile(r'(?:\s+v?\d+(?:\.\d+)*x?)+$')
+_SEPARATORS_RE = re.compile(r'[^a-z0-9+#]+')
+
+# Removed entries are dropped from the posting lists once they make up this share
+_COMPACT_RATIO = 0.25
+_COMPACT_MIN = 1024
+
+
+def fuzzy_key(name: str) -> str:
+    """Comparison key: "PostgreSQL 14" -> "postgresql", "Node.js" -> "nodejs" """
+    name = name.lower().strip()
+    name = _VERSION_SUFFIX_RE.sub('', name) or name
+    return _SEPARATORS_RE.sub('', name)
+
+
+def trigrams(key: str) -> FrozenSet[str]:
+    padded = f"$${key}$"
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+class TrigramIndex:
+    """Inverted trigram index over skill names, updated incrementally"""
+
+    def __init__(self, names: Iterable[str] = (), threshold: float = 0.75, min_length: int = 4):
+        self.threshold = threshold
+        # Shorter keys ("C", "Go", "SQL") have too few trigrams to compare safely
+        self.min_length = min_length
+
+        # Names sharing a key ("node.js", "nodejs") share an entry; None once all are removed
+        self._names: List[Optional[List[str]]] = []
+        self._keys: List[str] = []
+        self._sizes = array('H')
+        self._by_key: Dict[str, int] = {}
+        self._postings: Dict[str, array] = {}
+        self._removed = 0
+
+        for name in names:
+            self.add(name)
+
+    def __len__(self) -> int:
+        return len(self._by_key)
+
+    def add(self, name: str) -> None:
+        """Index a name"""
+        key = fuzzy_key(name)
+        if len(key) < self.min_length:
+            return
+
+        entry = self._by_key.get(key)
+        if entry is not None:
+            if name not in self._names[entry]:
+                self._names[entry].append(name)
+            return
+
+        entry = len(self._names)
+        grams = trigrams(key)
+        self._names.append([name])
+        self._keys.append(key)
+        self._sizes.append(min(len(grams), 0xFFFF))
+        self._by_key[key] = entry
+        for gram in grams:
+            self._postings.setdefault(gram, array('I')).append(entry)
+
+    def remove(self, name: str) -> None:
+        """Drop a name (its entry goes once no other name shares the key)"""
+        key = fuzzy_key(name)
+        entry = self._by_key.get(key)
+        if entry is None or name not in self._names[entry]:
+            return
+
+        self._names[entry].remove(name)
+        if self._names[entry]:
+            return
+        del self._by_key[key]
+        self._names[entry] = None
+        self._removed += 1
+        if self._removed >= _COMPACT_MIN and self._removed > len(self._names) * _COMPACT_RATIO:
+            self._compact()
+
+    def _compact(self) -> None:
+        names = [name for names in self._names if names for name in names]
+        self.__init__(names, self.threshold, self.min_length)
+
+    def best_match(self, name: str) -> Optional[Tuple[str, float]]:
+        """Indexed name most similar to name, with its similarity, if above the threshold"""
+        key = fuzzy_key(name)
+        if len(key) < self.min_length:
+            return None
+
+        entry = self._by_key.get(key)
+        if entry is not None:
+            return self._names[entry][0], 1.0
+
+        grams = trigrams(key)
+        size = len(grams)
+        min_overlap = math.ceil(self.threshold * size)
+        rarest = sorted(grams, key=lambda gram: len(self._postings.get(gram, ())))
+        candidates = set()
+        for gram in rarest[:size - min_overlap + 1]:
+            candidates.update(self._postings.get(gram, ()))
+
+        best_entry, best_score = None, 0.0
+        for entry in candidates:
+            if not self._names[entry]:
+                continue
+            # Similarity >= t is impossible unless the sizes are within a factor t
+            other_size = self._sizes[entry]
+            if other_size < self.threshold * size or other_size * self.threshold > size:
+                continue
+            overlap = len(grams & trigrams(self._keys[entry]))
+            score = overlap / (size + other_size - overlap)
+            if score > best_score or (score == best_score and best_entry is not None
+                                      and len(self._keys[entry]) < len(self._keys[best_entry])):
+                best_entry, best_score = entry, score
+
+        if best_entry is None or best_score < self.threshold:
+            return None
+        return self._names[best_entry][0], best_score
@@ -0,0 +1,101 @@
+"""
+On-disk snapshot of the skill lookup's source rows
+
+SkillLookupService is built from every Skill and SkillVariant row. The rows
+it reads are saved as msgpack next to the NLP snapshot, tagged with the
+database, the skill catalog version (see models/catalog_version.py) and the
+row count and highest ID of both tables, so a new process starting on an
+unchanged catalog skips the two table scans. The counts catch a database
+recreated under the same URL, whose catalog version starts over.
+
+Writes that bypass the ORM do not bump the catalog version, so an explicit
+refresh always reads the database and overwrites the snapshot.
+"""
+import logging
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import srsly
+from sqlalchemy import func
+
+from dtos.skill_dtos import SkillRecord
+from models import Skill, SkillVariant, db
+
+logger = logging.getLogger(__name__)
+
+# Bump when the file layout changes
+SNAPSHOT_FORMAT = 1
+SNAPSHOT_FILE = 'skill_lookup.msgpack'
+
+
+class SkillLookupSnapshot:
+    """Save and restore the skill records and variant names the lookup is built from"""
+
+    def __init__(self, directory: str):
+        self.path = os.path.join(directory, SNAPSHOT_FILE)
+
+    @staticmethod
+    def _database() -> Optional[str]:
+        """The database the rows come from, or None for one that does not outlive the process"""
+        url = db.engine.url
+        if url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:'):
+            return None
+        return url.render_as_string(hide_password=True)
+
+    def manifest(self, version: int) -> Optional[Dict[str, Any]]:
+        """Everything the saved rows depend on, or None if snapshots do not apply"""
+        database = self._database()
+        if database is None:
+            return None
+        skills = db.session.query(func.count(Skill.id), func.max(Skill.id)).one()
+        variants = db.session.query(func.count(SkillVariant.id), func.max(SkillVariant.id)).one()
+        return {
+            'format': SNAPSHOT_FORMAT,
+            'database': database,
+            'catalog_version': version,
+            'skills': list(skills),
+            'variants': list(variants),
+        }
+
+    def load(self, version: int) -> Optional[Tuple[Dict[int, SkillRecord], List[Tuple[str, int]]]]:
+        """Records by ID and (variant name, skill ID) pairs, or None if there is no up-to-date snapshot"""
+        if not os.path.exists(self.path):
+            return None
+
+        try:
+            manifest = self.manifest(version)
+            if manifest is None:
+                return None
+            data = srsly.read_msgpack(self.path)
+            if data.get('manifest') != manifest:
+                logger.info("Skill lookup snapshot is out of date, reading the catalog")
+                return None
+
+            records = {row[0]: SkillRecord(*row) for row in data['records']}
+            return records, [tuple(variant) for variant in data['variants']]
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable skill lookup snapshot {self.path}: {e}")
+            return None
+
+    def save(self, version: int, records: Dict[int, SkillRecord], variants: List[Tuple[str, int]]) -> bool:
+        """Write the rows atomically so concurrent workers never read a partial file"""
+        try:
+            manifest = self.manifest(version)
+            if manifest is None:
+                return False
+            data = {
+                'manifest': manifest,
+                'records': [[record.id, record.name, record.category_id, record.is_blacklisted]
+                            for record in records.values()],
+                'variants': [list(variant) for variant in variants],
+            }
+
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            srsly.write_msgpack(tmp_path, data)
+            os.replace(tmp_path, self.path)
+            return True
+
+        except Exception as e:
+            logger.warning(f"Failed to write skill lookup snapshot {self.path}: {e}")
+            return False
@@ -0,0 +1,128 @@
+"""
+On-disk snapshot of SkillNER's phrase matchers
+
+Building SkillNER tokenizes every surface form in SKILL_DB into five
+PhraseMatchers, which dominates its start-up time. The matchers only hold
+hashed token sequences, so they are saved once as msgpack and restored
+straight into new matchers on later starts. The snapshot is tagged with the
+skillNer, spaCy and model versions and a fingerprint of SKILL_DB (see
+skill_db_fingerprint), and is rebuilt whenever any of them changes.
+"""
+import logging
+import os
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Dict, Optional
+
+import srsly
+from spacy.matcher import PhraseMatcher
+from spacy.matcher.phrasematcher import unpickle_matcher
+
+from services.skill.compact_skill_db import skill_db_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Bump when the file layout changes
+SNAPSHOT_FORMAT = 1
+SNAPSHOT_FILE = 'skillner_matchers.msgpack'
+
+# Restoring bypasses SkillNER.__init__, so only versions whose constructor we mirror
+SUPPORTED_SKILLNER_VERSIONS = ('1.0.',)
+
+
+def _package_version(name: str) -> str:
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return 'unknown'
+
+
+class SkillNerSnapshot:
+    """Save and restore the PhraseMatchers of a SkillNER extractor"""
+
+    def __init__(self, directory: str, nlp, skills_db: Dict[str, Any], skill_db_hash: Optional[str] = None):
+        self.path = os.path.join(directory, SNAPSHOT_FILE)
+        self.nlp = nlp
+        self.skills_db = skills_db
+        # skill_db_fingerprint of skills_db, computed from it when not given
+        self.skill_db_hash = skill_db_hash
+        self._manifest: Optional[Dict[str, Any]] = None
+
+    @property
+    def manifest(self) -> Dict[str, Any]:
+        """Everything the saved matchers depend on"""
+        if self._manifest is None:
+            skill_db_hash = self.skill_db_hash or skill_db_fingerprint(self.skills_db)
+            self._manifest = {
+                'format': SNAPSHOT_FORMAT,
+                'skillner': _package_version('skillNer'),
+                'spacy': _package_version('spacy'),
+                'model': f"{self.nlp.meta.get('name')}-{self.nlp.meta.get('version')}",
+                'skill_db': skill_db_hash,
+            }
+        return self._manifest
+
+    @property
+    def supported(self) -> bool:
+        """Whether this skillNer version can be restored from a snapshot"""
+        return self.manifest['skillner'].startswith(SUPPORTED_SKILLNER_VERSIONS)
+
+    def load(self) -> Optional[Dict[str, PhraseMatcher]]:
+        """Restore the matchers, or None if there is no up-to-date snapshot"""
+        if not self.supported or not os.path.exists(self.path):
+            return None
+
+        try:
+            data = srsly.read_msgpack(self.path)
+            if data.get('manifest') != self.manifest:
+                logger.info("NLP snapshot is out of date, rebuilding matchers")
+                return None
+
+            return {
+                name: unpickle_matcher(
+                    self.nlp.vocab,
+                    {key: [tuple(spec) for spec in specs] for key, specs in matcher['specs'].items()},
+                    {},
+                    matcher['attr']
+                )
+                for name, matcher in data['matchers'].items()
+            }
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable NLP snapshot {self.path}: {e}")
+            return None
+
+    def save(self, matchers: Dict[str, PhraseMatcher]) -> bool:
+        """Write the matchers atomically so concurrent workers never read a partial file"""
+        try:
+            data = {'manifest': self.manifest, 'matchers': {}}
+            for name, matcher in matchers.items():
+                # (vocab, {key: {token hash tuples}}, callbacks, attr)
+                _, specs, _, attr = matcher.__reduce__()[1]
+                data['matchers'][name] = {
+                    'attr': attr,
+                    'specs': {key: [list(spec) for spec in key_specs] for key, key_specs in specs.items()},
+                }
+
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            srsly.write_msgpack(tmp_path, data)
+            os.replace(tmp_path, self.path)
+            return True
+
+        except Exception as e:
+            logger.warning(f"Failed to write NLP snapshot {self.path}: {e}")
+            return False
+
+    def restore_skill_ner(self, skill_ner_class, matchers: Dict[str, PhraseMatcher]):
+        """Create a SkillNER extractor around restored matchers (mirrors SkillNER.__init__)"""
+        from skillNer.matcher_class import SkillsGetter
+        from skillNer.utils import Utils
+
+        extractor = skill_ner_class.__new__(skill_ner_class)
+        extractor.tranlsator_func = False
+        extractor.nlp = self.nlp
+        extractor.skills_db = self.skills_db
+        extractor.phraseMatcher = PhraseMatcher
+        extractor.matchers = matchers
+        extractor.skill_getters = SkillsGetter(self.nlp)
+        extractor.utils = Utils(self.nlp, self.skills_db)
+        return extractor
@@ -0,0 +1,109 @@
+"""
+Per-stage timing and size histograms for the skill processing pipeline
+
+Every processed description records how long each stage took (clean,
+match, noise_filter, normalize, categorize, plus cache_lookup and
+cache_store when the extraction cache is enabled) and how much data flowed
+through it. Figures are per process: each web worker keeps its own registry.
+"""
+import bisect
+import threading
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+# Bucket upper bounds
+TIMING_BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+SIZE_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 25000, 50000)
+
+
+class Histogram:
+    """Fixed-bucket histogram with count, sum, min and max"""
+
+    def __init__(self, buckets: Iterable[float]):
+        self.bounds = tuple(sorted(buckets))
+        self.bucket_counts = [0] * (len(self.bounds) + 1)  # last bucket is +Inf
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-th observation"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for bound, bucket_count in zip(self.bounds, self.bucket_counts):
+            cumulative += bucket_count
+            if cumulative >= rank:
+                return bound
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        cumulative = 0
+        buckets = {}
+        for bound, bucket_count in zip(self.bounds, self.bucket_counts):
+            cumulative += bucket_count
+            buckets[str(bound)] = cumulative
+        buckets['+Inf'] = self.count
+
+        return {
+            'count': self.count,
+            'sum': round(self.total, 3),
+            'mean': round(self.total / self.count, 3) if self.count else None,
+            'min': self.min,
+            'max': self.max,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'buckets': buckets,
+        }
+
+
+class PipelineMetrics:
+    """Thread-safe registry of stage timing and counter histograms"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stages: Dict[str, Histogram] = {}
+            self._counters: Dict[str, Histogram] = {}
+            self._runs = {'success': 0, 'failed': 0}
+
+    def record(self, stage_timings: Mapping[str, float], counters: Mapping[str, int], success: bool) -> None:
+        """Add one pipeline run (timings in milliseconds)"""
+        with self._lock:
+            self._runs['success' if success else 'failed'] += 1
+            for stage, elapsed_ms in stage_timings.items():
+                self._stages.setdefault(stage, Histogram(TIMING_BUCKETS_MS)).observe(elapsed_ms)
+            if stage_timings:
+                self._stages.setdefault('total', Histogram(TIMING_BUCKETS_MS)).observe(sum(stage_timings.values()))
+            for name, value in counters.items():
+                self._counters.setdefault(name, Histogram(SIZE_BUCKETS)).observe(value)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current histograms, plus the stage with the largest share of total time"""
+        with self._lock:
+            stages = {name: histogram.snapshot() for name, histogram in self._stages.items()}
+            counters = {name: histogram.snapshot() for name, histogram in self._counters.items()}
+            runs = dict(self._runs)
+
+        stage_sums = {name: data['sum'] for name, data in stages.items() if name != 'total'}
+        return {
+            'runs': runs,
+            'stages': stages,
+            'counters': counters,
+            'dominant_stage': max(stage_sums, key=stage_sums.get) if stage_sums else None,
+        }
+
+
+# Global registry
+pipeline_metrics = PipelineMetrics()
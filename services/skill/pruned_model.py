@@ -0,0 +1,144 @@
+"""
+Derived spaCy model with pruned, memory-mapped word vectors
+
+en_core_web_lg spends most of its memory and load time on a vector table
+of several hundred thousand words, while job descriptions and SkillNER's
+vocabulary touch a small fraction of them. build_pruned_model() writes a
+derived model directory that:
+
+* keeps vector rows only for our vocabulary (token_dist.json, the skill
+  tables) and the model's most frequent words; every other word is
+  remapped to its nearest kept row, as spaCy's Vocab.prune_vectors does,
+  so lookups still return a close vector
+* drops the pipeline components SkillNER does not use (it only needs
+  lemmas, which come from the tagger, attribute ruler and lemmatizer)
+
+load_model() opens such a directory with the vector table memory-mapped
+instead of read into memory; any other model name is loaded with
+spacy.load as before. Point SKILL_SPACY_MODEL at the directory to use it.
+"""
+import logging
+import os
+import re
+import time
+from typing import Any, Dict, Iterable, Set
+
+import numpy
+import spacy
+import srsly
+from spacy.vectors import Vectors
+
+logger = logging.getLogger(__name__)
+
+# Components SkillNER's lemmatized matching depends on
+SKILL_NER_COMPONENTS = ('tok2vec', 'tagger', 'attribute_ruler', 'lemmatizer')
+
+# meta.json key marking a model written by build_pruned_model
+PRUNED_META_KEY = 'pruned_vectors'
+
+_WORD_RE = re.compile(r"[^\s/,()]+")
+
+
+def collect_vocabulary(token_dist_path: str = None, terms: Iterable[str] = ()) -> Set[str]:
+    """Lowercased words of token_dist.json and of the given skill names and variants"""
+    vocabulary = set()
+    if token_dist_path and os.path.exists(token_dist_path):
+        vocabulary.update(token.lower() for token in srsly.read_json(token_dist_path))
+    for term in terms:
+        vocabulary.update(word.lower() for word in _WORD_RE.findall(term or ''))
+    return vocabulary
+
+
+def build_pruned_model(source: str, output_dir: str, vocabulary: Iterable[str],
+                       keep_top: int = 20000, keep_components: Iterable[str] = SKILL_NER_COMPONENTS,
+                       remap: bool = True) -> Dict[str, Any]:
+    """
+    Write a copy of a spaCy model with pruned vectors and only the needed components
+
+    Args:
+        source: model package name or directory
+        output_dir: directory the derived model is written to
+        vocabulary: words (any case) whose vector rows are kept
+        keep_top: also keep the first rows of the table, which spaCy's
+            English models store most frequent first
+        keep_components: pipeline components to keep; the rest are removed
+        remap: point discarded words at their nearest kept row (slow on
+            large tables, but keeps tagging close to the source model)
+
+    Returns:
+        Statistics about the pruned table
+    """
+    nlp = spacy.load(source)
+    removed = [name for name in nlp.component_names if name not in set(keep_components)]
+    for name in removed:
+        nlp.remove_pipe(name)
+
+    vectors = nlp.vocab.vectors
+    strings = nlp.vocab.strings
+    words = {word.lower() for word in vocabulary}
+
+    keep_rows = set(range(min(keep_top, vectors.shape[0])))
+    for key, row in vectors.key2row.items():
+        if row not in keep_rows and key in strings and strings[key].lower() in words:
+            keep_rows.add(row)
+
+    kept_rows = sorted(keep_rows)
+    new_row = {old: new for new, old in enumerate(kept_rows)}
+    pruned = Vectors(strings=strings, data=numpy.ascontiguousarray(vectors.data[kept_rows]),
+                     name=vectors.name)
+
+    tossed_keys, tossed_rows = [], []
+    for key, row in vectors.key2row.items():
+        if row in new_row:
+            pruned.add(key, row=new_row[row])
+        else:
+            tossed_keys.append(key)
+            tossed_rows.append(row)
+
+    remapped = 0
+    if remap and tossed_keys and kept_rows:
+        started = time.perf_counter()
+        queries = numpy.ascontiguousarray(vectors.data[tossed_rows])
+        _, nearest_rows, _ = pruned.most_similar(queries, batch_size=1024, n=1)
+        for key, nearest in zip(tossed_keys, nearest_rows[:, 0]):
+            pruned.add(key, row=int(nearest))
+        remapped = len(tossed_keys)
+        logger.info(f"Remapped {remapped} words to their nearest kept vector in {time.perf_counter() - started:.1f}s")
+
+    stats = {
+        'source': f"{nlp.meta.get('name')}-{nlp.meta.get('version')}",
+        'rows_before': int(vectors.shape[0]),
+        'rows_after': int(pruned.shape[0]),
+        'keys': len(pruned.key2row),
+        'vocabulary_rows': len(keep_rows) - min(keep_top, vectors.shape[0]),
+        'remapped_keys': remapped,
+        'dropped_keys': len(tossed_keys) - remapped,
+        'removed_components': removed,
+    }
+
+    nlp.vocab.vectors = pruned
+    nlp.meta['name'] = f"{nlp.meta.get('name')}_pruned"
+    nlp.meta[PRUNED_META_KEY] = stats
+    nlp.to_disk(output_dir)
+    return stats
+
+
+def is_pruned_model(name: str) -> bool:
+    """Whether a model name is a directory written by build_pruned_model"""
+    meta_path = os.path.join(name, 'meta.json')
+    return os.path.isfile(meta_path) and PRUNED_META_KEY in srsly.read_json(meta_path)
+
+
+def load_model(name: str):
+    """Load a spaCy model, memory-mapping the vector table of pruned models"""
+    if not is_pruned_model(name):
+        return spacy.load(name)
+
+    nlp = spacy.load(name, exclude=['vectors'])
+    vocab_dir = os.path.join(name, 'vocab')
+    vectors = Vectors(strings=nlp.vocab.strings, name=nlp.vocab.vectors.name)
+    # Keys, key2row and settings come from disk; the table itself is mapped read-only
+    vectors.from_disk(vocab_dir, exclude=['strings', 'vectors'])
+    vectors.data = numpy.load(os.path.join(vocab_dir, 'vectors'), mmap_mode='r')
+    nlp.vocab.vectors = vectors
+    return nlp
@@ -0,0 +1,100 @@
+"""
+Requirements-section targeting
+
+Descriptions converted by the scraper carry '#### ' section headers. In the
+"requirements" extraction scope each section is classified by its header
+keywords and layout, and only the ones likely to list skills are annotated:
+
+- a header naming requirements, qualifications, skills, the role... marks
+  a skills section
+- a header naming benefits, the company, EEO statements, how to apply...
+  marks boilerplate
+- other sections count as skills sections when they are laid out as a list
+  and the description has an explicit skills section, and are otherwise
+  kept unless they are boilerplate
+
+When nothing is selected (e.g. a description without headers) the full
+text is used, so targeting never makes a description skill-less.
+"""
+import re
+from functools import lru_cache
+from typing import Iterable, List, Optional, Pattern, Sequence, Tuple
+
+from configurations.skill_config import SkillExtractionConfig
+
+SCOPE_FULL = 'full'
+SCOPE_REQUIREMENTS = 'requirements'
+EXTRACTION_SCOPES = (SCOPE_FULL, SCOPE_REQUIREMENTS)
+
+SECTION_SKILLS = 'skills'
+SECTION_BOILERPLATE = 'boilerplate'
+SECTION_UNKNOWN = 'unknown'
+
+_HEADER_RE = re.compile(r'^\s*#### (.+)$', re.MULTILINE)
+_LIST_ITEM_RE = re.compile(r'^\s*(?:[-*•]|\d+[.)])\s+\S', re.MULTILINE)
+
+
+def validate_scope(scope: str) -> str:
+    """Return the scope, raising ValueError if it is unknown"""
+    if scope not in EXTRACTION_SCOPES:
+        raise ValueError(f"Unknown extraction scope '{scope}'. Choose from: {', '.join(EXTRACTION_SCOPES)}")
+    return scope
+
+
+def _keyword_re(keywords: Iterable[str]) -> Optional[Pattern[str]]:
+    alternation = '|'.join(re.escape(k) for k in sorted(set(keywords), key=len, reverse=True))
+    return re.compile(rf"\b(?:{alternation})", re.IGNORECASE) if alternation else None
+
+
+class SectionClassifier:
+    """Classifies description sections as skills, boilerplate or unknown"""
+
+    def __init__(self, skill_keywords: Iterable[str], boilerplate_keywords: Iterable[str]):
+        self._skill_re = _keyword_re(skill_keywords)
+        self._boilerplate_re = _keyword_re(boilerplate_keywords)
+
+    @classmethod
+    def from_config(cls, config: SkillExtractionConfig) -> 'SectionClassifier':
+        """Shared classifier for an extraction config"""
+        return _cached_classifier(tuple(config.SKILL_SECTION_KEYWORDS), tuple(config.BOILERPLATE_SECTION_KEYWORDS))
+
+    @staticmethod
+    def header(section: str) -> Optional[str]:
+        """The section's header text, if it starts with one"""
+        match = _HEADER_RE.match(section)
+        return match.group(1).strip() if match else None
+
+    @staticmethod
+    def is_list(section: str) -> bool:
+        """Whether the section is laid out as a list (two or more items)"""
+        return len(_LIST_ITEM_RE.findall(section)) >= 2
+
+    def classify(self, section: str) -> str:
+        header = self.header(section)
+        if not header:
+            return SECTION_UNKNOWN
+        # Boilerplate first: "experience" also appears in headers like "Employee experience & benefits"
+        if self._boilerplate_re is not None and self._boilerplate_re.search(header):
+            return SECTION_BOILERPLATE
+        if self._skill_re is not None and self._skill_re.search(header):
+            return SECTION_SKILLS
+        return SECTION_UNKNOWN
+
+    def select(self, sections: Sequence[str]) -> List[str]:
+        """The sections worth annotating, in order; all of them if none qualify"""
+        labels = [self.classify(section) for section in sections]
+
+        if SECTION_SKILLS in labels:
+            selected = [
+                section for section, label in zip(sections, labels)
+                if label == SECTION_SKILLS or (label == SECTION_UNKNOWN and self.is_list(section))
+            ]
+        else:
+            selected = [section for section, label in zip(sections, labels) if label != SECTION_BOILERPLATE]
+
+        return selected or list(sections)
+
+
+@lru_cache(maxsize=4)
+def _cached_classifier(skill_keywords: Tuple[str, ...], boilerplate_keywords: Tuple[str, ...]) -> SectionClassifier:
+    return SectionClassifier(skill_keywords, boilerplate_keywords)
@@ -1,5 +1,7 @@
+from dataclasses import replace
 from typing import List, Dict
-from models import SkillCategory, Skill
+from dtos.skill_dtos import SkillRecord
+from models import SkillCategory, Skill, db
 from .category_service import CategoryService
 
 from exceptions.skill_exceptions import SkillServiceError
@@ -7,16 +9,25 @@ from exceptions.skill_exceptions import SkillServiceError
 class SkillCategorizer:
     """Handles skill categorization logic"""
     
-    def categorize_skills(self, skills: List[Skill]) -> Dict[str, List[Skill]]:
+    def categorize_skills(self, skills: List[SkillRecord]) -> Dict[str, List[SkillRecord]]:
         """Categorize skills by their categories"""
         try:
             categorized_skills = {}
 
             category_service = CategoryService()
             all_categories = {cat.id: cat for cat in category_service.get_all_categories()}
+
+            # Records are snapshots; read the current categories in one query
+            current_categories = dict(
+                db.session.query(Skill.id, Skill.category_id).filter(Skill.id.in_([s.id for s in skills]))
+            ) if skills else {}
             
             # Categorize skills
             for skill in skills:
+                category_id = current_categories.get(skill.id, skill.category_id)
+                if category_id != skill.category_id:
+                    skill = replace(skill, category_id=category_id)
+
                 if skill.category_id:
                     category = all_categories.get(skill.category_id)
                 
@@ -1,108 +1,168 @@
-import spacy
-from spacy.matcher import PhraseMatcher
-from skillNer.skill_extractor_class import SkillExtractor as SkillNER
-from skillNer.general_params import SKILL_DB
+import time
+from typing import Dict, Iterable, List, Optional, Sequence
 
 from configurations.skill_config import SkillExtractionConfig
-from exceptions.skill_exceptions import ModelNotLoadedError
 from dtos.skill_dtos import ExtractedSkillsResult
-from utils.text_processing import TextProcessor
+from utils.text_processing import TextProcessor, NoiseFilter
+from services.skill.extractor_backends import ExtractorBackend, create_backend
+from services.skill.token_prefilter import TokenPrefilter
 
 class SkillExtractor:
     """Handles NLP-based skill extraction from text"""
     
-    def __init__(self, config: SkillExtractionConfig):
+    def __init__(self, config: SkillExtractionConfig, noise_filter: Optional[NoiseFilter] = None,
+                 backend: Optional[ExtractorBackend] = None):
         self.config = config
-        self.nlp = self._load_nlp_model()
-        self.skill_extractor = self._load_skill_ner()
-    
-    def _load_nlp_model(self):
-        """Load spaCy model"""
-        try:
-            return spacy.load(self.config.SPACY_MODEL)
-        except OSError:
-            raise ModelNotLoadedError(
-                f"SpaCy model '{self.config.SPACY_MODEL}' not found. "
-                f"Please download it using: python -m spacy download {self.config.SPACY_MODEL}"
-            )
-    
-    def _load_skill_ner(self):
-        """Load SkillNER extractor"""
-        try:
-            return SkillNER(self.nlp, SKILL_DB, PhraseMatcher)
-        except Exception as e:
-            raise ModelNotLoadedError(f"Failed to load SkillNER: {str(e)}")
-        
-    def _process_match_group(self, matches, extracted_skills):
-        """Process a group of matches and add valid skills to the list"""
-        if not matches:
-            return
-         
-        for match in matches:
-            if 'doc_node_value' in match:
-                skill_name = match['doc_node_value']
-                if not skill_name:
-                    continue
-                
-                skill_clean = skill_name.strip()
-                if TextProcessor.is_noise_skill(  
-                    skill_clean,  
-                    noise_patterns=self.config.NOISE_PATTERNS,  
-                    common_words=self.config.COMMON_WORDS,  
-                ):
-                    continue
-
-                if skill_clean and (
-                    len(skill_clean) > self.config.MIN_SKILL_LENGTH
-                    or skill_clean in self.config.ALLOWED_SHORT_SKILLS
-                ):
-                    extracted_skills.append(skill_clean)
+        self.noise_filter = noise_filter or NoiseFilter.from_config(config)
+        self.backend = backend or create_backend(config)
+        self.prefilter: Optional[TokenPrefilter] = (
+            TokenPrefilter.from_config(config) if config.TOKEN_PREFILTER and self.backend.uses_skill_db else None
+        )
+
+    def _filter_candidates(self, candidates: List[str]) -> List[str]:
+        """Drop noise and too-short names from the backend's candidates"""
+        return [
+            skill for skill in self.noise_filter.filter(candidates)
+            if len(skill) > self.config.MIN_SKILL_LENGTH or skill in self.config.ALLOWED_SHORT_SKILLS
+        ]
+
+    # Vocabulary updates are no-ops for backends with a fixed skill database
+
+    def add_skill(self, name: str, variants: Iterable[str] = ()) -> None:
+        self.backend.add_skill(name, variants)
+
+    def remove_skill(self, name: str) -> None:
+        self.backend.remove_skill(name)
+
+    def reload_vocabulary(self) -> None:
+        self.backend.reload()
     
     def extract_skills_from_text(self, text: str) -> ExtractedSkillsResult:
-        """Extract skills from text using SkillNER"""
-        if not text or not text.strip():
-            return ExtractedSkillsResult(
-                skills=[],
-                total_skills=0,
-                success=False,
-                error="No text provided"
-            )
-        
-        try:
-            # Clean the text
-            cleaned_text = TextProcessor.clean_text(text)
-            
-            if not cleaned_text:
-                return ExtractedSkillsResult(
+        """Extract skills from text using the configured backend"""
+        return self.extract_skills_from_texts([text])[0]
+
+    def extract_skills_from_texts(self, texts: Sequence[str]) -> List[ExtractedSkillsResult]:
+        """Extract skills from several texts, matching them in one backend batch"""
+        results: List[Optional[ExtractedSkillsResult]] = [None] * len(texts)
+
+        # Clean every text first; only the non-empty ones go to the backend
+        pending = []  # (index, cleaned text, stage timings, prefilter dropped chars)
+        for index, text in enumerate(texts):
+            if not text or not text.strip():
+                results[index] = ExtractedSkillsResult(
                     skills=[],
                     total_skills=0,
                     success=False,
-                    error="Text is empty after cleaning"
+                    error="No text provided"
                 )
-            
-            # Extract skills using SkillNER
-            annotations = self.skill_extractor.annotate(cleaned_text)
-            extracted_skills = []
-            results = annotations.get('results') or {}
-
-            full_matches = results.get('full_matches', [])
-            if full_matches:
-                self._process_match_group(full_matches, extracted_skills)
-
-            ngram_scored = results.get('ngram_scored', [])
-            if ngram_scored:
-                self._process_match_group(ngram_scored, extracted_skills)
-
-            return ExtractedSkillsResult(
-                skills=extracted_skills,
-                total_skills=len(extracted_skills),
-                success=True
-            )
-            
+                continue
+
+            stage_timings = {}
+            dropped_chars = 0
+            try:
+                matched_text = text
+                if self.prefilter is not None:
+                    started = time.perf_counter()
+                    matched_text, dropped_chars = self.prefilter.filter(text)
+                    stage_timings['prefilter'] = (time.perf_counter() - started) * 1000
+
+                    # Nothing that could be a skill: a valid, empty result
+                    if not matched_text:
+                        results[index] = ExtractedSkillsResult(
+                            skills=[],
+                            total_skills=0,
+                            success=True,
+                            stage_timings=stage_timings,
+                            text_length=len(text),
+                            prefilter_dropped_chars=dropped_chars
+                        )
+                        continue
+
+                started = time.perf_counter()
+                cleaned_text = TextProcessor.clean_text(matched_text)
+                stage_timings['clean'] = (time.perf_counter() - started) * 1000
+            except Exception as e:
+                results[index] = self._failed_result(text, f"Skill extraction failed: {str(e)}", stage_timings)
+                continue
+
+            if not cleaned_text:
+                results[index] = self._failed_result(text, "Text is empty after cleaning", stage_timings)
+                continue
+            pending.append((index, cleaned_text, stage_timings, dropped_chars))
+
+        if not pending:
+            return results
+
+        try:
+            # Find candidates with the configured backend, then drop noise
+            started = time.perf_counter()
+            batch_candidates = self.backend.find_candidates_batch([cleaned for _, cleaned, _, _ in pending])
+            # The batch is matched as a whole, so each text is charged an equal share
+            match_ms = (time.perf_counter() - started) * 1000 / len(pending)
+
+            for (index, _, stage_timings, dropped_chars), candidates in zip(pending, batch_candidates):
+                stage_timings['match'] = match_ms
+
+                started = time.perf_counter()
+                extracted_skills = self._filter_candidates(candidates)
+                stage_timings['noise_filter'] = (time.perf_counter() - started) * 1000
+
+                results[index] = ExtractedSkillsResult(
+                    skills=extracted_skills,
+                    total_skills=len(extracted_skills),
+                    success=True,
+                    stage_timings=stage_timings,
+                    text_length=len(texts[index]),
+                    candidate_count=len(candidates),
+                    prefilter_dropped_chars=dropped_chars
+                )
+
         except Exception as e:
-            return ExtractedSkillsResult(
-                skills=[],
-                total_skills=0,
-                success=False,
-                error=f"Skill extraction failed: {str(e)}"
-            )
+            for index, _, stage_timings, _ in pending:
+                results[index] = self._failed_result(
+                    texts[index], f"Skill extraction failed: {str(e)}", stage_timings
+                )
+
+        return results
+
+    @staticmethod
+    def _failed_result(text: str, error: str, stage_timings: Dict[str, float]) -> ExtractedSkillsResult:
+        return ExtractedSkillsResult(
+            skills=[],
+            total_skills=0,
+            success=False,
+            error=error,
+            stage_timings=stage_timings,
+            text_length=len(text)
+        )
+
+
+def merge_section_results(text: str, section_results: Sequence[ExtractedSkillsResult]) -> ExtractedSkillsResult:
+    """
+    Combine the results of a description's sections into one result
+
+    Skills keep the order of their first appearance, section by section, so
+    the merged list does not depend on which sections came from the cache.
+    Sections that failed (e.g. nothing left after cleaning) are skipped
+    unless every section failed.
+    """
+    succeeded = [result for result in section_results if result.success]
+    if not succeeded:
+        error = section_results[0].error if section_results else "No text provided"
+        return ExtractedSkillsResult(skills=[], total_skills=0, success=False, error=error, text_length=len(text))
+
+    skills = list(dict.fromkeys(skill for result in succeeded for skill in result.skills))
+    stage_timings: Dict[str, float] = {}
+    for result in section_results:
+        for stage, elapsed_ms in result.stage_timings.items():
+            stage_timings[stage] = stage_timings.get(stage, 0.0) + elapsed_ms
+
+    return ExtractedSkillsResult(
+        skills=skills,
+        total_skills=len(skills),
+        success=True,
+        stage_timings=stage_timings,
+        text_length=len(text),
+        candidate_count=sum(result.candidate_count for result in succeeded),
+        prefilter_dropped_chars=sum(result.prefilter_dropped_chars for result in section_results)
+    )
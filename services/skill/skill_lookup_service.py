@@ -1,52 +1,125 @@
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional, Set, Tuple
 import logging
+import time
 from flask import current_app
 from sqlalchemy.exc import SQLAlchemyError
 from types import MappingProxyType
 
-from models import Skill, SkillVariant, db
+from configurations.skill_config import SkillExtractionConfig
+from dtos.skill_dtos import SkillRecord
+from models import Skill, SkillCatalogVersion, SkillVariant, db
+from services.skill.fuzzy_index import TrigramIndex
+from services.skill.lookup_snapshot import SkillLookupSnapshot
 
 logger = logging.getLogger(__name__)
 
 class SkillLookupService:
-    """Service for skill lookup and caching"""
+    """
+    Service for skill lookup and caching
+
+    The lookup holds SkillRecord snapshots rather than ORM instances, so
+    results can outlive the session that built them. Its lowercase names are
+    also kept in a trigram index for fuzzy matching, and the keys of each
+    skill in a reverse index, so per-skill updates never scan the lookup.
+    Given a snapshot directory, the first build restores the rows from disk
+    when the catalog has not changed since they were saved.
+    """
     
-    def __init__(self):
-        self._skill_lookup: Dict[str, Skill] = {}
+    def __init__(self, snapshot_dir: Optional[str] = None):
+        self._skill_lookup: Dict[str, SkillRecord] = {}
+        self._keys_by_skill: Dict[int, Set[str]] = {}
+        self._fuzzy_index: Optional[TrigramIndex] = None
+        self._built = False
+        # Catalog version the lookup reflects (see models/catalog_version.py)
+        self.version = 0
+        self._snapshot = SkillLookupSnapshot(snapshot_dir) if snapshot_dir else None
+        # How the rows were obtained: "database", "restored" or "database+saved"
+        self.source = 'database'
+        self.load_seconds = 0.0
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
-        self._build_lookup()
+        self._build_lookup(use_snapshot=True)
     
-    def _build_lookup(self):
-        """Build lookup dictionary from database"""
+    def _build_lookup(self, use_snapshot: bool = False):
+        """Build lookup dictionary from database (or its snapshot)"""
         try:
-            new_lookup: Dict[str, Skill] = {}
-
-            # Read-only ops; avoid nested transactions  
-            with db.session.no_autoflush:           
-                # Add canonical skills
-                skills = Skill.query.all()
-                for skill in skills:
-                    new_lookup[skill.name.lower()] = skill
-                    # Keep original case for exact matches
-                    if skill.name.lower() != skill.name:
-                        new_lookup[skill.name] = skill  
-                
-                # Add variants
-                variants = SkillVariant.query.join(Skill).all()
-                for variant in variants:
-                    new_lookup[variant.variant_name.lower()] = variant.skill 
-                    # Keep original case
-                    if variant.variant_name.lower() != variant.variant_name:
-                        new_lookup[variant.variant_name] = variant.skill
+            started = time.perf_counter()
+            # Read first: writes committed meanwhile are picked up by the next sync
+            version = SkillCatalogVersion.current()
+            source, rows = 'database', None
+            if use_snapshot and self._snapshot is not None:
+                rows = self._snapshot.load(version)
+                if rows is not None:
+                    source = 'restored'
+            if rows is None:
+                rows = self._load_records()
+                if self._snapshot is not None and self._snapshot.save(version, *rows):
+                    source = 'database+saved'
+
+            new_lookup: Dict[str, SkillRecord] = {}
+            self._index(new_lookup, *rows)
+            fuzzy_index = self._build_fuzzy_index(new_lookup)
+            keys_by_skill: Dict[int, Set[str]] = {}
+            for key, record in new_lookup.items():
+                keys_by_skill.setdefault(record.id, set()).add(key)
 
             # Atomic swap  
             self._skill_lookup = new_lookup
+            self._keys_by_skill = keys_by_skill
+            self._fuzzy_index = fuzzy_index
+            self.version = version
+            self._built = True
+            self.source = source
+            self.load_seconds = time.perf_counter() - started
+            self.logger.info(f"Skill lookup ready: {len(new_lookup)} names in {self.load_seconds:.2f}s ({source})")
 
         except SQLAlchemyError as e:  
             current_app.logger.warning("Failed to build skill lookup: %s", e, exc_info=True)  
             self._skill_lookup = {}
+            self._keys_by_skill = {}
+
+    @staticmethod
+    def _load_records(skill_ids: Optional[Iterable[int]] = None):
+        """Skill records by ID and (variant name, skill ID) pairs, for all or some skills"""
+        # Plain column rows: no ORM instances or identity map entries to build
+        skills = db.session.query(Skill.id, Skill.name, Skill.category_id, Skill.is_blacklisted)
+        variants = db.session.query(SkillVariant.variant_name, SkillVariant.skill_id)
+        if skill_ids is not None:
+            skills = skills.filter(Skill.id.in_(skill_ids))
+            variants = variants.filter(SkillVariant.skill_id.in_(skill_ids))
+
+        records = {row.id: SkillRecord(row.id, row.name, row.category_id, bool(row.is_blacklisted)) for row in skills}
+        return records, variants.all()
+
+    @staticmethod
+    def _index(lookup: Dict[str, SkillRecord], records: Dict[int, SkillRecord], variants):
+        # Add canonical skills
+        for record in records.values():
+            lookup[record.name.lower()] = record
+            # Keep original case for exact matches
+            if record.name.lower() != record.name:
+                lookup[record.name] = record
+
+        # Add variants
+        for variant_name, skill_id in variants:
+            record = records.get(skill_id)
+            if record is None:
+                continue
+            lookup[variant_name.lower()] = record
+            # Keep original case
+            if variant_name.lower() != variant_name:
+                lookup[variant_name] = record
     
-    def find_skill(self, name: str) -> Optional[Skill]:
+    @staticmethod
+    def _build_fuzzy_index(lookup: Dict[str, SkillRecord]) -> Optional[TrigramIndex]:
+        if not SkillExtractionConfig.FUZZY_MATCHING:
+            return None
+        return TrigramIndex(
+            (key for key in lookup if key == key.lower()),
+            threshold=SkillExtractionConfig.FUZZY_MATCH_THRESHOLD,
+            min_length=SkillExtractionConfig.FUZZY_MIN_LENGTH,
+        )
+
+    def find_skill(self, name: str) -> Optional[SkillRecord]:
         """Find a skill by name (case-insensitive)"""
         # Try exact match first
         if not name:
@@ -61,12 +134,115 @@ class SkillLookupService:
             return self._skill_lookup[key]
         
         return None
+
+    def find_similar(self, name: str) -> Optional[Tuple[SkillRecord, float]]:
+        """Most similar skill to a name with no exact match, and its similarity, if any is close enough"""
+        if not name or self._fuzzy_index is None:
+            return None
+
+        match = self._fuzzy_index.best_match(name)
+        if match is None:
+            return None
+        record = self._skill_lookup.get(match[0])
+        return (record, match[1]) if record is not None else None
     
     def refresh(self):
-        """Refresh the lookup cache"""
+        """Refresh the lookup cache from the database, replacing its snapshot"""
         self._build_lookup()
+
+    # =============================================================================
+    # Incremental updates (the caller has committed the change)
+    # =============================================================================
+
+    def add(self, skill: Skill, names: Optional[Iterable[str]] = None):
+        """
+        Index a skill under its name and variants, or only under the given names
+
+        As in a full build, variants take precedence over another skill's
+        canonical name.
+        """
+        record = SkillRecord.from_skill(skill)
+        if names is None:
+            self._set(record.name, record, overwrite=False)
+            names = [variant.variant_name for variant in skill.variants]
+        for name in names:
+            self._set(name, record, overwrite=True)
+
+    def remove(self, names: Iterable[str], skill_id: Optional[int] = None):
+        """Drop names from the lookup (only those pointing at skill_id, if given)"""
+        for name in names:
+            for key in {name, name.lower()}:
+                skill = self._skill_lookup.get(key)
+                if skill is not None and (skill_id is None or skill.id == skill_id):
+                    self._delete(key)
+
+    def rename(self, skill: Skill, old_name: str):
+        """Move a skill from its old canonical name to its current one"""
+        self.remove([old_name], skill.id)
+        self.update(skill)
+        self._set(skill.name, SkillRecord.from_skill(skill), overwrite=False)
+
+    def update(self, skill: Skill):
+        """Refresh the record of a skill under every name it is indexed by"""
+        record = SkillRecord.from_skill(skill)
+        for key in self._keys_by_skill.get(skill.id, ()):
+            self._skill_lookup[key] = record
+
+    def records_for(self, skill_ids: Iterable[int]) -> Dict[int, SkillRecord]:
+        """Current records of the given skills that are in the lookup"""
+        records = {}
+        for skill_id in set(skill_ids):
+            keys = self._keys_by_skill.get(skill_id)
+            if keys:
+                records[skill_id] = self._skill_lookup[next(iter(keys))]
+        return records
+
+    def reload_skills(self, skill_ids: Iterable[int], version: int):
+        """Re-read some skills (dropping deleted ones) and mark the lookup as at version"""
+        skill_ids = set(skill_ids)
+        if skill_ids:
+            records, variants = self._load_records(skill_ids)
+            for skill_id in skill_ids:
+                for key in list(self._keys_by_skill.get(skill_id, ())):
+                    self._delete(key)
+            for record in records.values():
+                self._set(record.name, record, overwrite=False)
+            for variant_name, skill_id in variants:
+                if skill_id in records:
+                    self._set(variant_name, records[skill_id], overwrite=True)
+        self.version = version
+
+    def _set(self, name: str, skill: SkillRecord, overwrite: bool):
+        for key in {name, name.lower()}:
+            current = self._skill_lookup.get(key)
+            if overwrite or current is None or current.id == skill.id:
+                self._skill_lookup[key] = skill
+                if current is not None and current.id != skill.id:
+                    self._unlink(current.id, key)
+                self._keys_by_skill.setdefault(skill.id, set()).add(key)
+                if current is None and key == key.lower() and self._fuzzy_index is not None:
+                    self._fuzzy_index.add(key)
+
+    def _delete(self, key: str):
+        record = self._skill_lookup.pop(key)
+        self._unlink(record.id, key)
+        if key == key.lower() and self._fuzzy_index is not None:
+            self._fuzzy_index.remove(key)
     
+    def _unlink(self, skill_id: int, key: str):
+        """Drop a key from a skill's entry in the reverse index"""
+        keys = self._keys_by_skill.get(skill_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_skill[skill_id]
+
+    @property
+    def is_built(self) -> bool:
+        """Whether the lookup has been loaded from the database"""
+        return self._built
+
     @property
-    def lookup_dict(self) -> Dict[str, Skill]:
+    def lookup_dict(self) -> Dict[str, SkillRecord]:
         """Get the current lookup dictionary"""
         return self._skill_lookup.copy()
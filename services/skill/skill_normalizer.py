@@ -1,16 +1,22 @@
-from typing import List
+import time
+from typing import List, Optional, Tuple
 
 from configurations.skill_config import SkillExtractionConfig
-from dtos.skill_dtos import NormalizedSkillsResult
+from dtos.skill_dtos import NormalizedSkillsResult, SurfaceFormOutcome
 from services.skill.skill_lookup_service import SkillLookupService
-from utils.text_processing import TextProcessor
+from services.skill.surface_memo import SurfaceFormMemo
+from utils.text_processing import NoiseFilter
 
 class SkillNormalizer:
     """Handles skill normalization and filtering"""
     
-    def __init__(self, lookup_service: SkillLookupService, config: SkillExtractionConfig):
+    def __init__(self, lookup_service: SkillLookupService, config: SkillExtractionConfig,
+                 noise_filter: Optional[NoiseFilter] = None, memo: Optional[SurfaceFormMemo] = None):
         self.lookup_service = lookup_service
         self.config = config
+        self.noise_filter = noise_filter or NoiseFilter.from_config(config)
+        # Outcomes of raw strings seen before (see services/skill/surface_memo.py)
+        self.memo = memo
     
     def normalize_skills(self, raw_skills: List[str]) -> NormalizedSkillsResult:
         """Normalize and filter extracted skills"""
@@ -25,40 +31,44 @@ class SkillNormalizer:
         try:
             normalized_skills = []
             unmatched_skills = []
+            fuzzy_matches = {}
+            fuzzy_ms = 0.0
             seen_skill_ids = set()
-            
-            for skill in raw_skills:
-                # Clean and validate
-                skill = skill.strip()
-                if not skill:
+
+            surfaces = [skill.strip() for skill in raw_skills]
+            outcomes = self.memo.get_many(surfaces) if self.memo is not None else {}
+            memo_hits = sum(surface in outcomes for surface in surfaces)
+
+            for surface in surfaces:
+                outcome = outcomes.get(surface)
+                if outcome is None:
+                    outcome, elapsed_ms = self._resolve(surface)
+                    fuzzy_ms += elapsed_ms
+                    outcomes[surface] = outcome
+                    if self.memo is not None:
+                        self.memo.put(surface, outcome)
+
+                # Empty names count as noise
+                if outcome.noise:
                     continue
-                
-                # Check for noise
-                if TextProcessor.is_noise_skill(skill, self.config.NOISE_PATTERNS, self.config.COMMON_WORDS):
+                if outcome.skill is None:
+                    unmatched_skills.append(outcome.name)
                     continue
-                
-                # Normalize casing - preserve known patterns or use title case
-                # This could be improved with a dictionary of known skill casings
-                if skill.upper() in ['IOS', 'SQL', 'HTML', 'CSS', 'XML', 'JSON', 'API', 'REST', 'MYSQL', 'NOSQL']:
-                    skill = skill.upper()
-                elif not any(c.isupper() for c in skill[1:]):  # If not mixed case
-                    skill = skill.title()
-                
-                # else preserve existing casing for things like "JavaScript", "TypeScript", etc.                
-                # Try to match with canonical skills
-                canonical_skill = self.lookup_service.find_skill(skill)
-                if canonical_skill:
-                    # Avoid duplicates
-                    if canonical_skill.id not in seen_skill_ids:
-                        normalized_skills.append(canonical_skill)
-                        seen_skill_ids.add(canonical_skill.id)
-                else:
-                    unmatched_skills.append(skill)
+
+                if outcome.fuzzy:
+                    fuzzy_matches[outcome.name] = outcome.skill.name
+                # Avoid duplicates
+                if outcome.skill.id not in seen_skill_ids:
+                    normalized_skills.append(outcome.skill)
+                    seen_skill_ids.add(outcome.skill.id)
             
             return NormalizedSkillsResult(
                 normalized_skills=normalized_skills,
                 unmatched_skills=unmatched_skills,
-                success=True
+                success=True,
+                fuzzy_matches=fuzzy_matches,
+                fuzzy_ms=fuzzy_ms,
+                memo_hits=memo_hits
             )
             
         except Exception as e:
@@ -67,4 +77,32 @@ class SkillNormalizer:
                 unmatched_skills=[],
                 success=False,
                 error=f"Normalization failed: {str(e)}"
-            )
\ No newline at end of file
+            )
+
+    def _resolve(self, surface: str) -> Tuple[SurfaceFormOutcome, float]:
+        """Outcome of one stripped raw skill, and the milliseconds spent fuzzy matching it"""
+        if self.noise_filter.is_noise(surface):
+            return SurfaceFormOutcome(surface, noise=True), 0.0
+
+        skill = surface
+        # Normalize casing - preserve known patterns or use title case
+        # This could be improved with a dictionary of known skill casings
+        if skill.upper() in ['IOS', 'SQL', 'HTML', 'CSS', 'XML', 'JSON', 'API', 'REST', 'MYSQL', 'NOSQL']:
+            skill = skill.upper()
+        elif not any(c.isupper() for c in skill[1:]):  # If not mixed case
+            skill = skill.title()
+
+        # else preserve existing casing for things like "JavaScript", "TypeScript", etc.
+        # Try to match with canonical skills
+        canonical_skill = self.lookup_service.find_skill(skill)
+        if canonical_skill is not None or not self.config.FUZZY_MATCHING:
+            return SurfaceFormOutcome(skill, canonical_skill), 0.0
+
+        # Near-duplicates such as "Postgres SQL" or "Node JS"
+        started = time.perf_counter()
+        match = self.lookup_service.find_similar(skill)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if match:
+            return SurfaceFormOutcome(skill, match[0], fuzzy=True), elapsed_ms
+        return SurfaceFormOutcome(skill), elapsed_ms
+
@@ -0,0 +1,265 @@
+"""
+Bulk re-extraction of job skills
+
+Re-runs the extraction pipeline over every job application (e.g. after the
+noise patterns or the skill table change) and syncs the JobSkill links to
+the new result. Description sections already in the extraction cache for the
+current config version skip annotation, so only new or edited sections are
+annotated. Progress is checkpointed after every batch so an interrupted run
+resumes where it stopped.
+"""
+import json
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from models import JobApplication, JobSkill, SkillExtractionStatus, db
+from dtos.skill_dtos import ExtractedSkillsResult
+
+from ..base_service import BaseService
+from services.skill import extraction_worker
+from services.skill.skill_service import get_skill_service
+
+
+class SkillReextractionService(BaseService):
+    """Re-extract skills for all jobs in resumable batches"""
+
+    def __init__(self, checkpoint_path: str, batch_size: int = 200, n_process: int = 1):
+        super().__init__()
+        self.checkpoint_path = checkpoint_path
+        self.batch_size = max(1, batch_size)
+        self.n_process = max(1, n_process)
+        self.skill_service = get_skill_service()
+
+    def run(self, resume: bool = True,
+            progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Re-extract skills for every job with an ID above the checkpoint
+
+        Args:
+            resume: Continue from the saved checkpoint if there is one
+            progress: Optional callback receiving the stats after each batch
+
+        Returns:
+            dict: Run statistics (jobs processed, links added/removed, throughput)
+        """
+        stats = self._load_checkpoint() if resume else None
+        if stats:
+            self.logger.info(f"Resuming skill re-extraction after job {stats['last_job_id']}")
+        else:
+            stats = {
+                'last_job_id': 0,
+                'jobs_processed': 0,
+                'jobs_failed': 0,
+                'links_added': 0,
+                'links_removed': 0,
+                'skills_created': 0,
+            }
+        stats.setdefault('cache_hits', 0)
+
+        # The skill table may have changed since this process built its lookup
+        self.skill_service.refresh_cache()
+
+        started = time.perf_counter()
+        processed_this_run = 0
+
+        with self._extraction_map() as extract_batch:
+            for batch in self._iter_job_batches(stats['last_job_id']):
+                results = self._extract_batch(batch, extract_batch, stats)
+
+                self._apply_batch(results, stats)
+
+                stats['last_job_id'] = batch[-1][0]
+                self._save_checkpoint(stats)
+
+                processed_this_run += len(batch)
+                elapsed = time.perf_counter() - started
+                stats['elapsed_seconds'] = round(elapsed, 2)
+                stats['jobs_per_second'] = round(processed_this_run / elapsed, 2) if elapsed > 0 else 0.0
+
+                if progress:
+                    progress(stats)
+
+        self._clear_checkpoint()
+        stats.setdefault('elapsed_seconds', round(time.perf_counter() - started, 2))
+        stats.setdefault('jobs_per_second', 0.0)
+        self.logger.info(f"Skill re-extraction finished: {stats}")
+        return stats
+
+    # =============================================================================
+    # Batching and extraction
+    # =============================================================================
+
+    def _iter_job_batches(self, after_id: int) -> Iterator[List[Tuple[int, str]]]:
+        """Yield (job_id, description) batches in ID order, starting after after_id"""
+        last_id = after_id
+        while True:
+            rows = (db.session.query(JobApplication.id, JobApplication.description)
+                    .filter(JobApplication.id > last_id)
+                    .order_by(JobApplication.id)
+                    .limit(self.batch_size)
+                    .all())
+            if not rows:
+                return
+            last_id = rows[-1].id
+            yield [(row.id, row.description or '') for row in rows]
+
+    def _extract_batch(self, batch: List[Tuple[int, str]], extract_batch: Callable,
+                       stats: Dict[str, Any]) -> List[Tuple[int, Optional[ExtractedSkillsResult]]]:
+        """Extract a batch, only sending sections missing from the cache to the extractor"""
+        cache = self.skill_service.extraction_cache
+        hits_before = cache.hits
+
+        texts = [text for _, text in batch if text]
+        extracted = iter(self.skill_service.extract_skills_batch(texts, extract_uncached=extract_batch))
+        stats['cache_hits'] += cache.hits - hits_before
+
+        # No description: the job should have no extracted skills
+        return [(job_id, next(extracted) if text else None) for job_id, text in batch]
+
+    @contextmanager
+    def _extraction_map(self):
+        """Yield a function mapping a list of texts to their ExtractedSkillsResults"""
+        if self.n_process == 1:
+            yield self.skill_service.extractor.extract_skills_from_texts
+            return
+
+        with ProcessPoolExecutor(max_workers=self.n_process,
+                                 mp_context=extraction_worker.get_pool_context(),
+                                 initializer=extraction_worker.init_worker,
+                                 initargs=extraction_worker.pool_initargs()) as pool:
+            def _extract_in_pool(texts):
+                chunksize = max(1, len(texts) // (self.n_process * 4))
+                return [result for _, result in
+                        pool.map(extraction_worker.extract_skills, enumerate(texts), chunksize=chunksize)]
+
+            yield _extract_in_pool
+
+    # =============================================================================
+    # Writing results
+    # =============================================================================
+
+    def _apply_batch(self, results: List[Tuple[int, Optional[ExtractedSkillsResult]]],
+                     stats: Dict[str, Any]) -> None:
+        """Resolve extracted skills to IDs, sync the batch's JobSkill rows and extraction statuses"""
+        desired: Dict[int, Set[int]] = {}
+        failed: List[int] = []
+
+        for job_id, result in results:
+            if result is None:
+                # No description: the job should have no extracted skills
+                desired[job_id] = set()
+            elif not result.success:
+                stats['jobs_failed'] += 1
+                self.logger.warning(f"Skill extraction failed for job {job_id}: {result.error}")
+                failed.append(job_id)
+                continue
+            else:
+                desired[job_id] = self._resolve_skill_ids(result.skills, stats)
+            stats['jobs_processed'] += 1
+
+        self._set_extraction_status(failed, SkillExtractionStatus.FAILED)
+        if not desired:
+            db.session.commit()
+            return
+        self._set_extraction_status(list(desired), SkillExtractionStatus.DONE)
+
+        current: Dict[int, Set[int]] = defaultdict(set)
+        existing = db.session.query(JobSkill.job_id, JobSkill.skill_id).filter(
+            JobSkill.job_id.in_(list(desired.keys()))
+        ).all()
+        for job_id, skill_id in existing:
+            current[job_id].add(skill_id)
+
+        to_add = []
+        for job_id, skill_ids in desired.items():
+            to_add.extend({'job_id': job_id, 'skill_id': skill_id}
+                          for skill_id in skill_ids - current[job_id])
+            stale = current[job_id] - skill_ids
+            if stale:
+                JobSkill.query.filter(
+                    JobSkill.job_id == job_id,
+                    JobSkill.skill_id.in_(stale)
+                ).delete(synchronize_session=False)
+                stats['links_removed'] += len(stale)
+
+        if to_add:
+            db.session.execute(JobSkill.insert_ignoring_duplicates(), to_add)
+            stats['links_added'] += len(to_add)
+
+        db.session.commit()
+        self.skill_service.surface_memo.persist()
+
+    @staticmethod
+    def _set_extraction_status(job_ids: List[int], status: SkillExtractionStatus) -> None:
+        """Set the skill extraction state of jobs without touching last_update (no commit)"""
+        if job_ids:
+            JobApplication.query.filter(JobApplication.id.in_(job_ids)).update(
+                {'skill_extraction_status': status.value, 'last_update': JobApplication.last_update},
+                synchronize_session=False
+            )
+
+    def _resolve_skill_ids(self, raw_skills: List[str], stats: Dict[str, Any]) -> Set[int]:
+        """Normalize raw skill names to skill IDs, creating unknown skills"""
+        if not raw_skills:
+            return set()
+
+        normalization = self.skill_service.normalizer.normalize_skills(raw_skills)
+        if not normalization.success:
+            return set()
+
+        skill_ids = {skill.id for skill in normalization.normalized_skills}
+        new_names = []
+        for skill_name in normalization.unmatched_skills:
+            existing = self.skill_service.normalize_skill_name(skill_name)
+            if existing:
+                skill_ids.add(existing.id)
+            else:
+                new_names.append(skill_name)
+
+        if new_names:
+            success, created, error = self.skill_service.create_skills(new_names)
+            if success:
+                # Every name missed the lookup, so each distinct skill is new
+                created_ids = {skill.id for skill in created.values()}
+                skill_ids.update(created_ids)
+                stats['skills_created'] += len(created_ids)
+            else:
+                self.logger.error(f"Error creating skills {new_names}: {error}")
+
+        return skill_ids
+
+    # =============================================================================
+    # Checkpointing
+    # =============================================================================
+
+    def _load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """Load saved progress, if any"""
+        if not os.path.exists(self.checkpoint_path):
+            return None
+        try:
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable checkpoint {self.checkpoint_path}: {e}")
+            return None
+
+    def _save_checkpoint(self, stats: Dict[str, Any]) -> None:
+        """Atomically persist progress so a crash never leaves a partial file"""
+        directory = os.path.dirname(self.checkpoint_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(stats, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def _clear_checkpoint(self) -> None:
+        """Remove the checkpoint once a run completes"""
+        try:
+            os.remove(self.checkpoint_path)
+        except FileNotFoundError:
+            pass
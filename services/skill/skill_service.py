@@ -1,20 +1,30 @@
-from typing import List, Optional, Tuple, Dict
+from typing import Callable, List, Optional, Sequence, Tuple, Dict, Any
+from flask import current_app
 from sqlalchemy import func
 from sqlalchemy.orm import joinedload
 from sqlalchemy.exc import SQLAlchemyError
 import threading
+import time
 
-from models import Skill, SkillCategory, SkillVariant, JobSkill, db
+from models import Skill, SkillCatalogChange, SkillCatalogVersion, SkillCategory, SkillVariant, JobSkill, db
 from utils.forms import sanitize_input
+from utils.text_processing import NoiseFilter, TextProcessor
 
 from configurations.skill_config import SkillExtractionConfig
-from dtos.skill_dtos import ProcessedSkillsResult
+from dtos.skill_dtos import ExtractedSkillsResult, ProcessedSkillsResult, SkillRecord
 
 from ..base_service import BaseService
 from services.skill.skill_lookup_service import SkillLookupService
-from services.skill.skill_extractor import SkillExtractor
+from services.skill.skill_extractor import SkillExtractor, merge_section_results
 from services.skill.skill_normalizer import SkillNormalizer
 from services.skill.skill_categorizer import SkillCategorizer
+from services.skill.category_service import get_category_service
+from services.skill.extraction_cache import ExtractionCacheService
+from services.skill.extraction_sidecar import SidecarError, SidecarExtractorClient
+from services.skill.pipeline_metrics import pipeline_metrics
+from services.skill.extraction_executor import extraction_executor
+from services.skill.section_targeting import SCOPE_FULL, SCOPE_REQUIREMENTS, SectionClassifier, validate_scope
+from services.skill.surface_memo import SurfaceFormMemo
 
 class SkillService(BaseService):
     """Main skill service using SQLAlchemy ORM models directly"""
@@ -22,20 +32,203 @@ class SkillService(BaseService):
     def __init__(self):
         super().__init__()
         self.config = SkillExtractionConfig()
-        self.lookup_service = SkillLookupService()
-        self.extractor = SkillExtractor(self.config)
-        self.normalizer = SkillNormalizer(self.lookup_service, self.config)
+        self.lookup_service = SkillLookupService(self.config.NLP_SNAPSHOT_DIR)
+        self.noise_filter = NoiseFilter.from_config(self.config)
+        self.section_classifier = SectionClassifier.from_config(self.config)
+        self.surface_memo = SurfaceFormMemo(self.lookup_service, self.config)
+        self.normalizer = SkillNormalizer(self.lookup_service, self.config, self.noise_filter, self.surface_memo)
         self.categorizer = SkillCategorizer()
+        self.extraction_cache = ExtractionCacheService(self.config)
+
+        # The NLP extractor takes tens of seconds to load, so it is built on
+        # first use (or by the warm-up thread) instead of here
+        self._extractor: Optional[SkillExtractor] = None
+        self._extractor_error: Optional[str] = None
+        self._extractor_lock = threading.Lock()
+
+        # With a sidecar configured, extraction is forwarded to it and no models load here
+        self.sidecar_path: Optional[str] = current_app.config.get('SKILL_EXTRACTION_SIDECAR')
+        self.sidecar_timeout: float = current_app.config.get('SKILL_EXTRACTION_SIDECAR_TIMEOUT', 60.0)
+
+    @property
+    def extractor(self) -> SkillExtractor:
+        """Get the NLP extractor, loading it if needed (blocks while loading)"""
+        if self._extractor is None:
+            with self._extractor_lock:
+                if self._extractor is None:
+                    try:
+                        if self.sidecar_path:
+                            self._extractor = SidecarExtractorClient(self.sidecar_path, self.sidecar_timeout)
+                        else:
+                            self._extractor = SkillExtractor(self.config, self.noise_filter)
+                        self._extractor_error = None
+                    except Exception as e:
+                        self._extractor_error = str(e)
+                        raise
+        return self._extractor
+
+    @property
+    def is_extractor_loaded(self) -> bool:
+        """Whether the NLP models are loaded and ready (or the sidecar answers)"""
+        if self.sidecar_path:
+            return self.extractor.ping()
+        return self._extractor is not None
+
+    @property
+    def extractor_error(self) -> Optional[str]:
+        """Error from the last failed model load, if any"""
+        return self._extractor_error
     
     # =============================================================================
     # Main Processing Methods
     # =============================================================================
     
-    def process_job_description(self, job_description: str) -> ProcessedSkillsResult:
-        """Complete skill processing pipeline for job descriptions"""
+    def process_job_description(self, job_description: str, scope: Optional[str] = None) -> ProcessedSkillsResult:
+        """Complete skill processing pipeline for job descriptions (scope: "full" or "requirements")"""
         try:
             # Step 1: Extract skills from text
-            extraction_result = self.extractor.extract_skills_from_text(job_description)
+            extraction_result = self.extract_skills(job_description, scope=scope)
+        except Exception as e:
+            return ProcessedSkillsResult(
+                extracted_skills=[],
+                normalized_skills=[],
+                unmatched_skills=[],
+                categorized_skills={},
+                total_skills=0,
+                success=False,
+                error=f"Processing failed: {str(e)}"
+            )
+
+        return self.process_extracted_skills(extraction_result)
+
+    def process_job_descriptions(self, job_descriptions: Sequence[str],
+                                 scope: Optional[str] = None) -> List[ProcessedSkillsResult]:
+        """Skill processing pipeline for several descriptions, extracting uncached ones in one batch"""
+        try:
+            extraction_results = self.extract_skills_batch(job_descriptions, scope=scope)
+        except Exception as e:
+            return [
+                ProcessedSkillsResult(
+                    extracted_skills=[],
+                    normalized_skills=[],
+                    unmatched_skills=[],
+                    categorized_skills={},
+                    total_skills=0,
+                    success=False,
+                    error=f"Processing failed: {str(e)}"
+                )
+                for _ in job_descriptions
+            ]
+
+        return [self.process_extracted_skills(result) for result in extraction_results]
+
+    def extract_skills(self, text: str, scope: Optional[str] = None) -> ExtractedSkillsResult:
+        """Extract raw skills from text, reusing the cached result for unchanged text"""
+        return self.extract_skills_batch([text], scope=scope)[0]
+
+    def extract_skills_batch(self, texts: Sequence[str],
+                             extract_uncached: Optional[Callable[[List[str]], List[ExtractedSkillsResult]]] = None,
+                             scope: Optional[str] = None) -> List[ExtractedSkillsResult]:
+        """
+        Extract raw skills from several texts
+
+        Each text is split into its sections; sections found in the cache are
+        reused and the rest go to the extractor together, in parallel across
+        the worker pool when there is one. Section results are then merged
+        back into one result per text.
+
+        Args:
+            texts: Descriptions to extract from
+            extract_uncached: Optional function extracting a list of texts
+                (defaults to the worker pool or the in-process extractor)
+            scope: "full", or "requirements" to only annotate skill-bearing
+                sections (defaults to SkillExtractionConfig.EXTRACTION_SCOPE)
+        """
+        text_sections = [self.split_sections(text, scope) for text in texts]
+        # Identical sections (boilerplate shared between postings) are extracted once
+        sections = list(dict.fromkeys(section for parts in text_sections for section in parts))
+
+        started = time.perf_counter()
+        section_results = self.lookup_sections(sections)
+        lookup_ms = (time.perf_counter() - started) * 1000 / max(1, len(sections))
+
+        missed = [section for section in sections if section not in section_results]
+        if missed:
+            extracted = (extract_uncached or self._extract_uncached)(missed)
+
+            started = time.perf_counter()
+            self.extraction_cache.put_many(zip(missed, extracted))
+            store_ms = (time.perf_counter() - started) * 1000 / len(missed)
+            for section, result in zip(missed, extracted):
+                if self.extraction_cache.enabled:
+                    result.stage_timings['cache_lookup'] = lookup_ms
+                    result.stage_timings['cache_store'] = store_ms
+                section_results[section] = result
+
+        return [
+            merge_section_results(text, [section_results[section] for section in parts])
+            for text, parts in zip(texts, text_sections)
+        ]
+
+    def split_sections(self, text: str, scope: Optional[str] = None) -> List[str]:
+        """Units a description is extracted and cached in: its '#### ' sections, or the whole text"""
+        scope = validate_scope(scope or self.config.EXTRACTION_SCOPE)
+        if scope == SCOPE_FULL and not self.config.SECTION_CHUNKING:
+            return [text]
+
+        sections = TextProcessor.split_sections(text) or [text]
+        if scope == SCOPE_REQUIREMENTS:
+            sections = self.section_classifier.select(sections)
+        return sections if self.config.SECTION_CHUNKING else ['\n\n'.join(sections)]
+
+    def lookup_sections(self, sections: Sequence[str]) -> Dict[str, ExtractedSkillsResult]:
+        """Cached extraction results for the given sections (hits only)"""
+        if not self.extraction_cache.enabled:
+            return {}
+
+        started = time.perf_counter()
+        hits = self.extraction_cache.get_many(sections)
+        lookup_ms = (time.perf_counter() - started) * 1000 / max(1, len(sections))
+        for section, cached_result in hits.items():
+            cached_result.stage_timings['cache_lookup'] = lookup_ms
+            cached_result.text_length = len(section)
+        return hits
+
+    def _extract_uncached(self, texts: List[str]) -> List[ExtractedSkillsResult]:
+        """Annotate texts across the worker pool when that parallelizes anything, else in process"""
+        if len(texts) > 1 and extraction_executor.max_workers > 1:
+            results = extraction_executor.map(texts)
+            if results is not None:
+                return results
+        return self.extractor.extract_skills_from_texts(texts)
+
+    def process_extracted_skills(self, extraction_result: ExtractedSkillsResult) -> ProcessedSkillsResult:
+        """Normalize and categorize raw skills extracted from text (here or by a worker process)"""
+        stage_timings = dict(extraction_result.stage_timings)
+        result = self._normalize_and_categorize(extraction_result, stage_timings)
+
+        started = time.perf_counter()
+        if self.surface_memo.persist():
+            stage_timings['memo_store'] = (time.perf_counter() - started) * 1000
+
+        result.stage_timings = {stage: round(elapsed_ms, 3) for stage, elapsed_ms in stage_timings.items()}
+        result.counters = {
+            'text_length': extraction_result.text_length,
+            'candidates': extraction_result.candidate_count,
+            'prefilter_dropped_chars': extraction_result.prefilter_dropped_chars,
+            'extracted': len(extraction_result.skills),
+            'normalized': len(result.normalized_skills),
+            'unmatched': len(result.unmatched_skills),
+            'fuzzy_matched': len(result.fuzzy_matches),
+            'memo_hits': result.memo_hits,
+        }
+        pipeline_metrics.record(result.stage_timings, result.counters, result.success)
+        return result
+
+    def _normalize_and_categorize(self, extraction_result: ExtractedSkillsResult,
+                                  stage_timings: Dict[str, float]) -> ProcessedSkillsResult:
+        """Steps 2 and 3 of the pipeline, adding their durations to stage_timings"""
+        try:
             if not extraction_result.success:
                 return ProcessedSkillsResult(
                     extracted_skills=[],
@@ -46,9 +239,24 @@ class SkillService(BaseService):
                     success=False,
                     error=extraction_result.error
                 )
+
+            # Nothing found is a valid outcome, not a normalization failure
+            if not extraction_result.skills:
+                return ProcessedSkillsResult(
+                    extracted_skills=[],
+                    normalized_skills=[],
+                    unmatched_skills=[],
+                    categorized_skills={},
+                    total_skills=0,
+                    success=True
+                )
             
             # Step 2: Normalize extracted skills
+            started = time.perf_counter()
             normalization_result = self.normalizer.normalize_skills(extraction_result.skills)
+            # Fuzzy lookups are reported as their own stage
+            stage_timings['normalize'] = (time.perf_counter() - started) * 1000 - normalization_result.fuzzy_ms
+            stage_timings['fuzzy_match'] = normalization_result.fuzzy_ms
             if not normalization_result.success:
                 return ProcessedSkillsResult(
                     extracted_skills=extraction_result.skills,
@@ -61,7 +269,9 @@ class SkillService(BaseService):
                 )
             
             # Step 3: Categorize normalized skills
+            started = time.perf_counter()
             categorized_skills = self.categorizer.categorize_skills(normalization_result.normalized_skills)
+            stage_timings['categorize'] = (time.perf_counter() - started) * 1000
             
             return ProcessedSkillsResult(
                 extracted_skills=extraction_result.skills,
@@ -69,7 +279,9 @@ class SkillService(BaseService):
                 unmatched_skills=normalization_result.unmatched_skills,
                 categorized_skills=categorized_skills,
                 total_skills=len(normalization_result.normalized_skills)+len(normalization_result.unmatched_skills),
-                success=True
+                success=True,
+                fuzzy_matches=normalization_result.fuzzy_matches,
+                memo_hits=normalization_result.memo_hits
             )
             
         except Exception as e:
@@ -99,6 +311,18 @@ class SkillService(BaseService):
             self.logger.error("Database error getting skill by ID %s: %s", skill_id, e, exc_info=True)  
             return None
     
+    def get_skills_by_ids(self, skill_ids: Sequence[int]) -> List[Skill]:
+        """Get skills by ID with a single IN query, in the order of the IDs"""
+        if not skill_ids:
+            return []
+        try:
+            skills = {skill.id: skill for skill in Skill.query.filter(Skill.id.in_(set(skill_ids))).all()}
+            return [skills[skill_id] for skill_id in dict.fromkeys(skill_ids) if skill_id in skills]
+
+        except SQLAlchemyError as e:
+            self.logger.error(f"Database error getting {len(skill_ids)} skills by ID: {e}", exc_info=True)
+            return []
+
     def get_skill_by_name(self, skill_name: str) -> Optional[Skill]:
         """Get skill by name"""
         result = self.filter_by(Skill, order_by=None, **{"name": skill_name})
@@ -223,8 +447,9 @@ class SkillService(BaseService):
             db.session.add(skill)
             db.session.commit()
             
-            # Refresh lookup cache
-            self.lookup_service.refresh()
+            # Update lookup cache
+            self.lookup_service.add(skill)
+            self._sync_extractor_vocabulary(added=skill)
             
             return True, skill, None
             
@@ -234,6 +459,45 @@ class SkillService(BaseService):
         except Exception as e:
             db.session.rollback()
             return False, None, f"Validation error: {str(e)}"
+
+    def create_skills(self, names: Sequence[str], category: Optional[int] = None) -> Tuple[bool, Dict[str, Skill], Optional[str]]:
+        """
+        Create every skill that does not exist yet in one transaction
+
+        Returns:
+            (success, skill for each given name - existing or new, error)
+        """
+        sanitized = {name: sanitize_input(name) for name in names if name and name.strip()}
+        sanitized = {name: clean for name, clean in sanitized.items() if clean}
+        if not sanitized:
+            return True, {}, None
+
+        try:
+            existing = {
+                skill.name: skill
+                for skill in Skill.query.filter(Skill.name.in_(set(sanitized.values()))).all()
+            }
+            # Names differing only in case become one skill, as the lookup is case-insensitive
+            new_skills: Dict[str, Skill] = {}
+            for clean in sanitized.values():
+                if clean not in existing and clean.lower() not in new_skills:
+                    new_skills[clean.lower()] = Skill(name=clean, category_id=category, is_blacklisted=False)
+            if new_skills:
+                db.session.add_all(new_skills.values())
+                db.session.commit()
+
+                for skill in new_skills.values():
+                    self.lookup_service.add(skill)
+                self._sync_extractor_skills(list(new_skills.values()))
+
+            return True, {
+                name: existing.get(clean) or new_skills[clean.lower()] for name, clean in sanitized.items()
+            }, None
+
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            self.logger.error(f"Database error creating {len(sanitized)} skills: {e}", exc_info=True)
+            return False, {}, f"Database error: {str(e)}"
     
     def update_skill(self, skill_id: int, **kwargs) -> Tuple[bool, Optional[Skill], Optional[str]]:
         """Update a skill"""
@@ -242,6 +506,7 @@ class SkillService(BaseService):
             if not skill:
                 return False, None, "Skill not found"
             
+            old_name = skill.name
             proposed_name = kwargs.get('name')  
             if proposed_name:  
                 proposed_name = sanitize_input(proposed_name)
@@ -267,8 +532,12 @@ class SkillService(BaseService):
             
             db.session.commit()
             
-            # Refresh lookup cache
-            self.lookup_service.refresh()
+            # Update lookup cache
+            if skill.name != old_name:
+                self.lookup_service.rename(skill, old_name)
+                self._sync_extractor_vocabulary(added=skill, removed_name=old_name)
+            else:
+                self.lookup_service.update(skill)
             
             return True, skill, None
             
@@ -288,11 +557,14 @@ class SkillService(BaseService):
             if not skill:
                 return False, False, "Skill not found"
             
+            skill_name = skill.name
+            lookup_names = [skill_name] + [variant.variant_name for variant in skill.variants]
             db.session.delete(skill)
             db.session.commit()
             
-            # Refresh lookup cache
-            self.lookup_service.refresh()
+            # Update lookup cache
+            self.lookup_service.remove(lookup_names, skill_id)
+            self._sync_extractor_vocabulary(removed_name=skill_name)
             
             return True, True, None
             
@@ -311,13 +583,100 @@ class SkillService(BaseService):
     def refresh_cache(self):
         """Refresh all caches"""
         self.lookup_service.refresh()
+        if self._extractor is not None:
+            self._extractor.reload_vocabulary()
+
+    def sync_catalog(self) -> bool:
+        """
+        Catch up with skill catalog writes made by any process
+
+        One primary-key read when nothing changed; otherwise only the skills
+        logged since the lookup's version are re-read (everything, if the
+        change log does not cover them).
+
+        Returns:
+            Whether the caches were updated
+        """
+        current = SkillCatalogVersion.current()
+        since = self.lookup_service.version
+        if current == since:
+            return False
+
+        skill_ids = SkillCatalogChange.skill_ids_between(since, current)
+        # A sidecar's vocabulary is updated by the process that made the change
+        sync_extractor = self._extractor is not None and not isinstance(self._extractor, SidecarExtractorClient)
+
+        if skill_ids is None:
+            self.logger.info(f"Skill catalog moved from version {since} to {current}, rebuilding the lookup")
+            self.lookup_service.refresh()
+            self.surface_memo.clear_memory()
+            if sync_extractor:
+                self._extractor.reload_vocabulary()
+        else:
+            self.logger.debug(f"Skill catalog moved from version {since} to {current}: {len(skill_ids)} skills changed")
+            previous = self.lookup_service.records_for(skill_ids)
+            self.lookup_service.reload_skills(skill_ids, current)
+            # The writer removed stale stored outcomes; which names changed is not known here
+            self.surface_memo.invalidate(skill_ids, unmatched=True)
+            if sync_extractor:
+                skills = {skill.id: skill for skill in self.get_skills_by_ids(list(skill_ids))}
+                for skill_id in skill_ids:
+                    old = previous.get(skill_id)
+                    self._sync_extractor_vocabulary(added=skills.get(skill_id),
+                                                    removed_name=old.name if old is not None else None)
+
+        get_category_service()._invalidate_cache()
+        return True
+
+    def apply_variant_change(self, skill: Skill, added: Optional[str] = None, removed: Optional[str] = None):
+        """Update the caches after a variant of a skill was added or deleted (and committed)"""
+        if removed:
+            self.lookup_service.remove([removed], skill.id)
+        if added:
+            self.lookup_service.add(skill, [added])
+        self._sync_extractor_vocabulary(added=skill)
+
+    def _sync_extractor_skills(self, skills: List[Skill]):
+        """Add several new skills to a loaded extractor's vocabulary"""
+        if self._extractor is None:
+            return
+        # The sidecar reloads its whole vocabulary per change; do it once
+        if len(skills) > 1 and isinstance(self._extractor, SidecarExtractorClient):
+            try:
+                if self._extractor.follows_catalog:
+                    self._extractor.reload_vocabulary()
+            except Exception as e:
+                self.logger.warning(f"Failed to reload the sidecar vocabulary: {e}")
+            return
+        for skill in skills:
+            self._sync_extractor_vocabulary(added=skill)
+
+    def _sync_extractor_vocabulary(self, added: Optional[Skill] = None, removed_name: Optional[str] = None):
+        """Apply a single skill change to a loaded extractor's vocabulary"""
+        if self._extractor is None:
+            return
+
+        # Called after the change is committed, so failures are logged rather than raised
+        try:
+            if removed_name:
+                self._extractor.remove_skill(removed_name)
+            if added is not None:
+                self._extractor.add_skill(added.name, [v.variant_name for v in added.variants])
+        except SidecarError as e:
+            self.logger.warning(f"Extraction sidecar vocabulary not updated: {e}")
+        except Exception as e:
+            self.logger.warning(f"Failed to update extractor vocabulary, reloading it: {e}")
+            try:
+                self._extractor.reload_vocabulary()
+            except Exception as e:
+                self.logger.warning(f"Failed to reload the extractor vocabulary: {e}")
     
-    def normalize_skill_name(self, extracted_name: str) -> Optional[Skill]:
-        """Given an extracted skill name, return the canonical skill object"""
+    def normalize_skill_name(self, extracted_name: str) -> Optional[SkillRecord]:
+        """Given an extracted skill name, return the canonical skill record"""
         return self.lookup_service.find_skill(extracted_name)
     
-    def normalize_extracted_skills(self, raw_skills_list: List[str]) -> Tuple[List[Skill], List[str]]:
-        """Take a list of raw skill names and return normalized Skill objects"""
+    def normalize_extracted_skills(self, raw_skills_list: List[str]) -> Tuple[List[SkillRecord], List[str]]:
+        """Take a list of raw skill names and return normalized skill records"""
         result = self.normalizer.normalize_skills(raw_skills_list)
         if result.success:
             return result.normalized_skills, result.unmatched_skills
@@ -365,6 +724,7 @@ class SkillService(BaseService):
 # Singleton instance if you need global access
 _skill_service_instance = None
 _lock = threading.Lock()
+_catalog_lock = threading.Lock()
 
 def get_skill_service() -> SkillService:
     """Get or create the singleton SkillService instance"""
@@ -373,4 +733,49 @@ def get_skill_service() -> SkillService:
         with _lock:
             if _skill_service_instance is None:
                 _skill_service_instance = SkillService()
-    return _skill_service_instance
\ No newline at end of file
+    return _skill_service_instance
+
+_next_catalog_check = 0.0
+
+def sync_skill_catalog(interval: float) -> None:
+    """Apply other processes' catalog writes, checking at most once per interval seconds"""
+    global _next_catalog_check
+    service = _skill_service_instance
+    # Nothing cached yet: the service will load the current catalog when first used
+    if service is None or not service.lookup_service.is_built:
+        return
+
+    now = time.monotonic()
+    if now < _next_catalog_check or not _catalog_lock.acquire(blocking=False):
+        return
+    try:
+        _next_catalog_check = now + interval
+        service.sync_catalog()
+    except SQLAlchemyError as e:
+        current_app.logger.warning("Skill catalog sync failed: %s", e)
+    finally:
+        _catalog_lock.release()
+
+def start_skill_warmup(app) -> threading.Thread:
+    """Load the skill service and NLP models in a background thread"""
+    def _warm_up():
+        with app.app_context():
+            started = time.perf_counter()
+            try:
+                get_skill_service().extractor
+                app.logger.info("Skill extraction models warmed up in %.1fs", time.perf_counter() - started)
+            except Exception as e:
+                app.logger.error("Skill extraction warm-up failed: %s", e, exc_info=True)
+
+    thread = threading.Thread(target=_warm_up, name="skill-warmup", daemon=True)
+    thread.start()
+    return thread
+
+def get_skill_readiness() -> Dict[str, Any]:
+    """Report whether the skill lookup and NLP models are loaded in this process"""
+    service = _skill_service_instance
+    return {
+        'model': service is not None and service.is_extractor_loaded,
+        'lookup': service is not None and service.lookup_service.is_built,
+        'error': service.extractor_error if service is not None else None,
+    }
\ No newline at end of file
@@ -0,0 +1,327 @@
+"""
+Memo of raw extracted skill strings to their normalization outcome
+
+The same raw strings ("python", "Python 3", "AWS") recur across thousands of
+postings. Their outcome (a skill, noise, or unmatched) is kept in an
+in-memory LRU, so normalizing them costs one dict hit instead of the casing
+rules, the noise check and the lookups, and persisted to the
+skill_surface_forms table so a new process starts warm.
+
+Invalidation is selective. A flush that writes a Skill or SkillVariant
+deletes, in the same transaction, the rows (and this process's entries) that
+point at the touched skills or whose fuzzy key equals a touched name, i.e.
+strings the new name now matches exactly or up to spacing, punctuation or a
+version number. Other processes drop their entries for the changed skills
+when they sync the catalog (SkillService.sync_catalog). A string that would
+only fuzzy-match a new skill through a misspelling keeps its outcome until
+`flask skills memo --clear`.
+"""
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, event, insert, or_
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from configurations.skill_config import SkillExtractionConfig
+from dtos.skill_dtos import SurfaceFormOutcome
+from models import Skill, SkillSurfaceForm, SkillVariant, db
+from services.skill.fuzzy_index import fuzzy_key
+from services.skill.skill_lookup_service import SkillLookupService
+
+from ..base_service import BaseService
+
+# Bump when SkillNormalizer's casing rules change so stored outcomes are not reused
+MEMO_VERSION = 1
+
+MAX_SURFACE_LENGTH = 255
+# Surfaces per IN clause when replacing stored rows
+PERSIST_CHUNK_SIZE = 500
+
+# Live memos, invalidated by the flush listeners below
+_memos: 'weakref.WeakSet[SurfaceFormMemo]' = weakref.WeakSet()
+
+
+def memo_version(config: SkillExtractionConfig) -> str:
+    """Fingerprint of every setting that affects normalization outcomes"""
+    fingerprint = repr((
+        MEMO_VERSION,
+        config.version(),
+        config.FUZZY_MATCHING,
+        config.FUZZY_MATCH_THRESHOLD,
+        config.FUZZY_MIN_LENGTH,
+    ))
+    return hashlib.sha256(fingerprint.encode('utf-8')).hexdigest()[:16]
+
+
+class SurfaceFormMemo(BaseService):
+    """In-memory LRU of normalization outcomes, persisted to warm new processes"""
+
+    def __init__(self, lookup_service: SkillLookupService, config: SkillExtractionConfig):
+        super().__init__()
+        self.lookup_service = lookup_service
+        self.max_entries = config.SURFACE_MEMO_SIZE
+        self.config_version = memo_version(config)
+
+        # Raw string -> (outcome, fuzzy key of its cased name), least recently used first
+        self._entries: 'OrderedDict[str, Tuple[SurfaceFormOutcome, str]]' = OrderedDict()
+        self._pending: Dict[str, Tuple[SurfaceFormOutcome, str]] = {}  # not persisted yet
+        self._lock = threading.Lock()
+        self._purged = False
+        self._hits = 0
+        self._misses = 0
+
+        _memos.add(self)
+        if self.enabled:
+            self.warm()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def warm(self) -> int:
+        """Load the most recently stored outcomes of the current config, returning how many"""
+        try:
+            rows = (db.session.query(SkillSurfaceForm.surface, SkillSurfaceForm.name, SkillSurfaceForm.outcome,
+                                     SkillSurfaceForm.skill_id, SkillSurfaceForm.skill_name,
+                                     SkillSurfaceForm.fuzzy, SkillSurfaceForm.match_key)
+                    .filter(SkillSurfaceForm.config_version == self.config_version)
+                    .order_by(SkillSurfaceForm.created_at.desc())
+                    .limit(self.max_entries)
+                    .all())
+        except SQLAlchemyError as e:
+            self.logger.warning(f"Failed to warm the surface-form memo: {e}")
+            return 0
+
+        entries = OrderedDict()
+        # Oldest first, so the most recent are evicted last
+        for row in reversed(rows):
+            outcome = self._from_row(row)
+            if outcome is not None:
+                entries[row.surface] = (outcome, row.match_key)
+
+        with self._lock:
+            entries.update(self._entries)
+            self._entries = entries
+        return len(entries)
+
+    def _from_row(self, row) -> Optional[SurfaceFormOutcome]:
+        if row.outcome == 'noise':
+            return SurfaceFormOutcome(row.name, noise=True)
+        if row.outcome == 'unmatched':
+            return SurfaceFormOutcome(row.name)
+
+        skill = self.lookup_service.find_skill(row.skill_name)
+        # Changed since it was stored: resolve it again on use
+        if skill is None or skill.id != row.skill_id:
+            return None
+        return SurfaceFormOutcome(row.name, skill, fuzzy=row.fuzzy)
+
+    def get_many(self, surfaces: Iterable[str]) -> Dict[str, SurfaceFormOutcome]:
+        """Memoized outcomes of the given raw strings (hits only)"""
+        hits = {}
+        misses = 0
+        with self._lock:
+            for surface in surfaces:
+                entry = self._entries.get(surface)
+                if entry is None:
+                    misses += 1
+                    continue
+                self._entries.move_to_end(surface)
+                hits[surface] = entry[0]
+            self._hits += len(hits)
+            self._misses += misses
+        return hits
+
+    def put(self, surface: str, outcome: SurfaceFormOutcome) -> None:
+        """Memoize the outcome of a raw string; it is stored on the next persist()"""
+        if not self.enabled or not surface:
+            return
+
+        entry = (outcome, fuzzy_key(outcome.name))
+        with self._lock:
+            self._entries[surface] = entry
+            self._entries.move_to_end(surface)
+            if len(surface) <= MAX_SURFACE_LENGTH:
+                self._pending[surface] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def persist(self) -> int:
+        """
+        Store outcomes memoized since the last call, in one transaction
+
+        Returns:
+            int: Number of outcomes stored
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+
+        def _store():
+            if not self._purged:
+                SkillSurfaceForm.query.filter(
+                    SkillSurfaceForm.config_version != self.config_version
+                ).delete(synchronize_session=False)
+            # Replace rows another process stored meanwhile, then insert in one statement
+            surfaces = list(pending)
+            for start in range(0, len(surfaces), PERSIST_CHUNK_SIZE):
+                SkillSurfaceForm.query.filter(
+                    SkillSurfaceForm.surface.in_(surfaces[start:start + PERSIST_CHUNK_SIZE])
+                ).delete(synchronize_session=False)
+
+            now = datetime.now(timezone.utc)
+            db.session.execute(insert(SkillSurfaceForm), [
+                {
+                    'surface': surface,
+                    'config_version': self.config_version,
+                    'name': outcome.name,
+                    'outcome': outcome.outcome,
+                    'skill_id': outcome.skill.id if outcome.skill is not None else None,
+                    'skill_name': outcome.skill.name if outcome.skill is not None else None,
+                    'fuzzy': outcome.fuzzy,
+                    'match_key': match_key,
+                    'created_at': now,
+                }
+                for surface, (outcome, match_key) in pending.items()
+            ])
+
+        success, _, error = self.safe_execute(_store)
+        if not success:
+            self.logger.warning(f"Failed to store surface-form outcomes: {error}")
+            return 0
+        self._purged = True
+        return len(pending)
+
+    def invalidate(self, skill_ids: Iterable[int] = (), keys: Iterable[str] = (), unmatched: bool = False) -> int:
+        """
+        Drop entries pointing at the given skills or with one of the given fuzzy keys
+
+        Args:
+            skill_ids: Skills that changed
+            keys: Fuzzy keys of names that were added or changed
+            unmatched: Also drop every unmatched or fuzzy-matched entry
+                (when the changed names are unknown)
+
+        Returns:
+            int: Number of entries dropped
+        """
+        skill_ids, keys = set(skill_ids), set(keys)
+
+        def _stale(entry: Tuple[SurfaceFormOutcome, str]) -> bool:
+            outcome, match_key = entry
+            # Noise depends on the config only
+            if outcome.noise:
+                return False
+            if match_key in keys or (outcome.skill is not None and outcome.skill.id in skill_ids):
+                return True
+            return unmatched and (outcome.skill is None or outcome.fuzzy)
+
+        with self._lock:
+            stale = [surface for surface, entry in self._entries.items() if _stale(entry)]
+            for surface in stale:
+                del self._entries[surface]
+            for surface in [surface for surface, entry in self._pending.items() if _stale(entry)]:
+                del self._pending[surface]
+        return len(stale)
+
+    def clear_memory(self) -> None:
+        """Drop every entry held by this process"""
+        with self._lock:
+            self._entries.clear()
+            self._pending.clear()
+
+    def clear(self) -> int:
+        """Remove every stored outcome, here and in the database"""
+        self.clear_memory()
+        success, deleted, error = self.safe_execute(
+            lambda: SkillSurfaceForm.query.delete(synchronize_session=False)
+        )
+        if not success:
+            self.logger.error(f"Failed to clear the surface-form memo: {error}")
+            return 0
+
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+        return deleted
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process and the memo sizes"""
+        with self._lock:
+            hits, misses, entries = self._hits, self._misses, len(self._entries)
+
+        try:
+            stored = SkillSurfaceForm.query.filter_by(config_version=self.config_version).count()
+        except SQLAlchemyError:
+            stored = None
+
+        lookups = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / lookups, 3) if lookups else 0.0,
+            'entries': entries,
+            'max_entries': self.max_entries,
+            'stored': stored,
+            'config_version': self.config_version,
+        }
+
+
+# =============================================================================
+# Invalidation on catalog writes
+# =============================================================================
+
+def _touched_names(instances: Sequence[Any], session: Session) -> Tuple[set, set]:
+    """IDs of the skills and fuzzy keys of the names touched by flushed instances"""
+    skill_ids, keys = set(), set()
+    for instance in instances:
+        if isinstance(instance, Skill):
+            skill_id, name = instance.id, instance.name
+        elif isinstance(instance, SkillVariant):
+            skill_id, name = instance.skill_id, instance.variant_name
+        else:
+            continue
+        if instance in session.dirty and not session.is_modified(instance, include_collections=False):
+            continue
+        if skill_id is not None:
+            skill_ids.add(skill_id)
+        if name:
+            keys.add(fuzzy_key(name))
+    return skill_ids, keys
+
+
+@event.listens_for(Session, 'after_flush')
+def _invalidate_surface_forms(session, flush_context):
+    skill_ids, keys = _touched_names((*session.new, *session.dirty, *session.deleted), session)
+    if not skill_ids and not keys:
+        return
+
+    forms = SkillSurfaceForm.__table__
+    session.connection().execute(
+        delete(forms).where(or_(forms.c.skill_id.in_(skill_ids), forms.c.match_key.in_(keys)))
+    )
+    for memo in list(_memos):
+        memo.invalidate(skill_ids, keys)
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _clear_surface_forms(orm_execute_state):
+    """Bulk statements on skills or variants do not say which rows they touched"""
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None or not issubclass(mapper.class_, (Skill, SkillVariant)):
+        return
+
+    orm_execute_state.session.connection().execute(delete(SkillSurfaceForm.__table__))
+    for memo in list(_memos):
+        memo.clear_memory()
@@ -0,0 +1,108 @@
+"""
+Token-frequency prefilter for SkillNER
+
+token_dist.json maps every token that occurs in SkillNER's SKILL_DB to the
+number of skills it appears in. A sentence with no (non stop word) token
+from that map cannot produce a SkillNER match, so dropping it before
+annotation only removes work: benefits, EEO statements and company blurbs
+never reach the matcher.
+
+The vocabulary is held as a sorted array of token hashes with a parallel
+array of counts, which is a fraction of the size of a set of strings.
+"""
+import json
+import re
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+from typing import FrozenSet, Iterable, List, Mapping, Tuple
+
+from spacy.lang.en.stop_words import STOP_WORDS
+
+from configurations.skill_config import SkillExtractionConfig
+
+# Sentence ends and line breaks (bullets, headers) both delimit a segment
+_SEGMENT_RE = re.compile(r'(?<=[.!?;])\s+|\s*\n\s*')
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#&]*")
+
+# Suffixes stripped to approximate the lemmas token_dist.json is keyed by
+_SUFFIXES = (('ies', 'y'), ('es', ''), ('s', ''), ('ing', ''), ('ing', 'e'), ('ed', ''), ('ed', 'e'))
+
+
+def _lemma_candidates(token: str) -> Iterable[str]:
+    yield token
+    # SkillNER tokenizes "c#" and "c++" as "c" followed by symbols
+    if token.rstrip('+#&') != token:
+        yield token.rstrip('+#&')
+    for suffix, replacement in _SUFFIXES:
+        if token.endswith(suffix) and len(token) > len(suffix) + 2:
+            yield token[:-len(suffix)] + replacement
+
+
+class TokenPrefilter:
+    """Drops sentences that contain no token of the skill vocabulary"""
+
+    def __init__(self, token_counts: Mapping[str, int], stop_words: Iterable[str] = (), min_count: int = 1):
+        self.stop_words: FrozenSet[str] = frozenset(word.lower() for word in stop_words)
+        self.min_count = min_count
+
+        entries = sorted({
+            hash(token.lower()): count
+            for token, count in token_counts.items()
+            if count >= min_count and token.lower() not in self.stop_words and not token.isdigit()
+        }.items())
+        self._hashes = array('q', (token_hash for token_hash, _ in entries))
+        self._counts = array('I', (count for _, count in entries))
+
+    @classmethod
+    def from_config(cls, config: SkillExtractionConfig) -> 'TokenPrefilter':
+        """Prefilter over the configured token_dist.json"""
+        # Short skills such as "Go" must not be ignored as stop words
+        stop_words = (STOP_WORDS | config.COMMON_WORDS) - {skill.lower() for skill in config.ALLOWED_SHORT_SKILLS}
+        return _load_prefilter(config.TOKEN_DIST_PATH, frozenset(stop_words), config.TOKEN_PREFILTER_MIN_COUNT)
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def count(self, token: str) -> int:
+        """Number of skills the token occurs in (0 if it is not in the vocabulary)"""
+        token_hash = hash(token)
+        index = bisect_left(self._hashes, token_hash)
+        if index < len(self._hashes) and self._hashes[index] == token_hash:
+            return self._counts[index]
+        return 0
+
+    def is_relevant(self, sentence: str) -> bool:
+        """Whether any token of the sentence may be part of a skill"""
+        for token in _TOKEN_RE.findall(sentence.lower()):
+            if token in self.stop_words or token.isdigit():
+                continue
+            if any(self.count(candidate) for candidate in _lemma_candidates(token)):
+                return True
+        return False
+
+    def split(self, text: str) -> List[str]:
+        """Sentences and lines of a text"""
+        return [segment for segment in _SEGMENT_RE.split(text) if segment and segment.strip()]
+
+    def filter(self, text: str) -> Tuple[str, int]:
+        """
+        Keep only the relevant sentences of a text
+
+        Returns:
+            (kept text with one sentence per line, number of characters dropped)
+        """
+        kept, dropped = [], 0
+        for segment in self.split(text):
+            if self.is_relevant(segment):
+                kept.append(segment)
+            else:
+                dropped += len(segment)
+        return '\n'.join(kept), dropped
+
+
+@lru_cache(maxsize=4)
+def _load_prefilter(path: str, stop_words: FrozenSet[str], min_count: int) -> TokenPrefilter:
+    with open(path, 'r', encoding='utf-8') as f:
+        token_counts = json.load(f)
+    return TokenPrefilter(token_counts, stop_words=stop_words, min_count=min_count)
@@ -108,3 +108,46 @@ def sample_log(app, sample_job):
         # Refresh to ensure object is attached to session
         db.session.refresh(log)
         yield log
+
+
+class KeywordExtractor:
+    """Stand-in for SkillExtractor that 'extracts' known keywords without NLP models"""
+
+    def __init__(self, keywords):
+        self.keywords = keywords
+        self.calls = 0
+
+    def extract_skills_from_text(self, text):
+        from dtos.skill_dtos import ExtractedSkillsResult
+
+        self.calls += 1
+        if not text or not text.strip():
+            return ExtractedSkillsResult(skills=[], total_skills=0, success=False, error="No text provided")
+        lowered = text.lower()
+        skills = [keyword for keyword in self.keywords if keyword.lower() in lowered]
+        return ExtractedSkillsResult(skills=skills, total_skills=len(skills), success=True)
+
+    def extract_skills_from_texts(self, texts):
+        return [self.extract_skills_from_text(text) for text in texts]
+
+    def add_skill(self, name, variants=()):
+        pass
+
+    def remove_skill(self, name):
+        pass
+
+    def reload_vocabulary(self):
+        pass
+
+
+@pytest.fixture
+def skill_service(app):
+    """Fresh SkillService singleton bound to the test database, with a keyword extractor"""
+    import services.skill.skill_service as skill_service_module
+
+    skill_service_module._skill_service_instance = None
+    with app.app_context():
+        service = skill_service_module.get_skill_service()
+        service._extractor = KeywordExtractor(['Python', 'Docker', 'Kubernetes', 'SQL'])
+        yield service
+    skill_service_module._skill_service_instance = None
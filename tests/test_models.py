@@ -1,9 +1,13 @@
 """
 Test models
 """
+import re
+
 import pytest
 from datetime import datetime
-from models import UserData, JobApplication, ApplicationStatus, MasterTemplate, JobLog, Document, db
+from sqlalchemy import event, func, text
+from models import (UserData, JobApplication, ApplicationStatus, MasterTemplate, JobLog, Document, JobSkill,
+                    Skill, SkillVariant, db)
 
 
 class TestUserData:
@@ -111,3 +115,155 @@ class TestMasterTemplate:
                 content="Test LaTeX content"
             )
             assert template.get_content() == "Test LaTeX content"
+
+
+class TestQueryPlans:
+    """Test the hot query paths are served by indexes"""
+
+    # A SCAN without an index is a full table scan (SQLite < 3.36 says "SCAN TABLE")
+    FULL_SCAN = re.compile(r'^SCAN (TABLE )?\w+( AS \w+)?$')
+
+    def _capture_selects(self, run):
+        """Filtered or ordered SELECT statements (with their parameters) executed by run()"""
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            # Full loads (e.g. the skill lookup cache) are meant to read every row
+            normalized = ' '.join(statement.upper().split())
+            if normalized.startswith('SELECT') and (' WHERE ' in normalized or ' ORDER BY ' in normalized):
+                statements.append((statement, parameters))
+
+        event.listen(db.engine, 'before_cursor_execute', _record)
+        try:
+            run()
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', _record)
+        return statements
+
+    def test_main_queries_use_indexes(self, app, sample_job):
+        """Test dashboard, log, job skill and skill name queries never scan a whole table"""
+        from services import JobService, LogService
+
+        with app.app_context():
+            job_id = sample_job.id
+
+            def _run():
+                job_service = JobService()
+                job_service.get_all_jobs()
+                job_service.get_jobs_paginated(status_filter=ApplicationStatus.APPLIED.value)
+                job_service.get_jobs_paginated(country_filter="France")
+                job_service.get_jobs_paginated(job_mode_filter="Remote")
+                LogService().get_logs_for_job(job_id)
+                db.session.expire_all()
+                list(db.session.get(JobApplication, job_id).skills)
+                db.session.query(JobSkill.job_id).filter(JobSkill.skill_id == 1).all()
+                Skill.query.filter(func.lower(Skill.name) == "python").first()
+                SkillVariant.query.filter(SkillVariant.variant_name == "py").first()
+
+            statements = self._capture_selects(_run)
+            assert len(statements) >= 10
+
+            connection = db.session.connection()
+            for statement, parameters in statements:
+                plan = [row[3] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)]
+                scans = [step for step in plan if self.FULL_SCAN.match(step)]
+                assert not scans, f"{' '.join(statement.split())}\n  -> {plan}"
+
+    def test_migration_matches_models(self):
+        """Test the index migration creates every index declared on these tables"""
+        from migrations.add_query_indexes import INDEXES
+
+        tables = {table for _, table, _ in INDEXES}
+        declared = {index.name for table in db.metadata.sorted_tables if table.name in tables
+                    for index in table.indexes}
+        assert declared == {name for name, _, _ in INDEXES}
+
+
+class TestJobSearch:
+    """Test the full-text search index over jobs and log notes"""
+
+    def test_index_follows_writes(self, app, sample_job):
+        """Test inserts, updates and deletes reach the index through the triggers"""
+        from services import JobService, LogService
+
+        with app.app_context():
+            job_service = JobService()
+            assert job_service.search_service.available
+            other = JobApplication(company="Globex", title="Data Engineer", description="Kubernetes and Spark")
+            db.session.add(other)
+            db.session.commit()
+            db.session.add(JobLog(job_id=sample_job.id, note="Recruiter asked about Kubernetes"))
+            db.session.commit()
+
+            # Description matches rank above log note matches
+            assert [job.id for job in job_service.filter_jobs("kube")] == [other.id, sample_job.id]
+            assert [job.id for job in job_service.filter_jobs('"data engineer"')] == [other.id]
+            assert [log.note for log in LogService().search_logs("recruit")] == ["Recruiter asked about Kubernetes"]
+
+            other.description = "Spark only"
+            db.session.commit()
+            assert [job.id for job in job_service.filter_jobs("kube")] == [sample_job.id]
+
+            db.session.delete(other)
+            db.session.commit()
+            assert job_service.filter_jobs("spark") == []
+            db.session.execute(text("INSERT INTO job_search(job_search) VALUES ('integrity-check')"))
+
+    def test_match_expression(self):
+        """Test search box queries become prefix and phrase matches"""
+        from services.search_service import match_expression
+
+        assert match_expression('pyth') == '"pyth"*'
+        assert match_expression('"data engineer" node.js') == '"data engineer" AND "node js"'
+        assert match_expression('"unclosed phr') == '"unclosed phr"'
+        assert match_expression('*** "" ') is None
+        assert match_expression('python C++') is None
+        assert match_expression('"C# developer"') is None
+
+    def test_symbol_terms_match_exactly(self, app):
+        """Test "C++" and "C#" only find jobs mentioning them, not every word starting with C"""
+        from services import JobService
+
+        with app.app_context():
+            jobs = {name: JobApplication(company="Acme", title=f"{name} Developer", description=f"Modern {name}")
+                    for name in ("C++", "C#", "C", "Clojure")}
+            db.session.add_all(jobs.values())
+            db.session.commit()
+
+            job_service = JobService()
+            assert [job.id for job in job_service.filter_jobs("C++")] == [jobs["C++"].id]
+            assert [job.id for job in job_service.filter_jobs("c#")] == [jobs["C#"].id]
+
+
+class TestJobStatistics:
+    """Test dashboard statistics are counted in SQL"""
+
+    def test_counts_without_loading_jobs(self, app):
+        """Test status, mode and country counts and the country list come from aggregates"""
+        from services import JobService
+
+        with app.app_context():
+            rows = [
+                ("Applied", "Remote", "France"),
+                ("Applied", "Hybrid", "Germany"),
+                ("Rejected", "Remote", "France"),
+                ("Collected", "On-site", ""),
+            ]
+            for status, job_mode, country in rows:
+                db.session.add(JobApplication(company="Acme", title="Engineer", description="x" * 1000,
+                                              status=status, job_mode=job_mode, country=country))
+            db.session.commit()
+
+            job_service = JobService()
+            statements = TestQueryPlans()._capture_selects(lambda: (
+                job_service.get_job_statistics(), job_service.get_countries()
+            ))
+            stats = job_service.get_job_statistics()
+
+            assert stats['total_jobs'] == 4
+            assert stats['status_counts'] == {"Applied": 2, "Collected": 1, "Rejected": 1}
+            assert stats['status_percentages']["Applied"] == 50.0
+            assert stats['job_mode_counts'] == {"Remote": 2, "Hybrid": 1, "On-site": 1}
+            assert stats['top_countries'] == [("France", 2), ("Germany", 1)]
+            assert job_service.get_countries() == ["France", "Germany"]
+            assert not any('description' in statement for statement, _ in statements)
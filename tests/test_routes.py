@@ -1,6 +1,9 @@
 """
 Test routes
 """
+import re
+from datetime import datetime
+
 import pytest
 from flask import url_for
 from models import db, JobApplication, ApplicationStatus, JobLog
@@ -22,6 +25,35 @@ class TestMainRoutes:
         assert sample_job.company.encode() in response.data
         assert sample_job.title.encode() in response.data
     
+    def test_dashboard_search_highlights_matches(self, client, sample_job):
+        """Test dashboard search matches word prefixes and highlights them"""
+        response = client.get('/?search=develop')
+        assert response.status_code == 200
+        assert b'<mark>development</mark>' in response.data
+
+        response = client.get('/?search=%22software+manager%22')
+        assert sample_job.title.encode() not in response.data
+
+    def test_dashboard_paginates(self, client, app):
+        """Test dashboard shows one page of jobs with cursor links keeping the filters"""
+        with app.app_context():
+            for i in range(30):
+                db.session.add(JobApplication(company=f"Company {i:02d}", title="Engineer",
+                                              status=ApplicationStatus.APPLIED.value, country="France"))
+            db.session.commit()
+        app.config['DASHBOARD_PER_PAGE'] = 24
+
+        response = client.get('/?status=Applied')
+        assert response.status_code == 200
+        assert response.data.count(b'data-job-id=') == 24
+        assert b'24 of 30 jobs' in response.data
+        next_url = re.search(rb'href="(/\?cursor=[^"]+)" aria-label="Next"', response.data).group(1)
+        assert b'status=Applied' in next_url
+
+        response = client.get(next_url.decode().replace('&amp;', '&'))
+        assert response.data.count(b'data-job-id=') == 6
+        assert b'aria-label="Previous"' in response.data
+
     def test_user_data_get(self, client):
         """Test user data page loads"""
         response = client.get('/user')
@@ -143,3 +175,152 @@ class TestCategoryRoutes:
 
         assert response.status_code == 302  # Redirect status
         # Additional assertions can be added to verify deletion
+
+
+class TestHealthRoutes:
+    """Test health check routes"""
+
+    def test_live(self, client):
+        """Test liveness probe always answers"""
+        response = client.get('/health/live')
+        assert response.status_code == 200
+        assert response.get_json()['status'] == 'ok'
+
+    def test_ready_without_models(self, client):
+        """Test readiness probe reports not ready until the NLP models are loaded"""
+        response = client.get('/health/ready')
+        data = response.get_json()
+        assert response.status_code == 503
+        assert data['status'] == 'not_ready'
+        assert data['checks']['model'] is False
+        assert data['checks']['database'] is True
+
+
+class TestSkillApiRoutes:
+    """Test skill admin API routes"""
+
+    def test_pipeline_metrics(self, client, skill_service):
+        """Test the pipeline metrics endpoint reports recorded stages"""
+        from services.skill.pipeline_metrics import pipeline_metrics
+
+        pipeline_metrics.reset()
+        response = client.post('/admin/skills/api/skills/extract', json={'text': 'SQL and Kubernetes'})
+        assert response.status_code == 200
+        assert 'normalize' in response.get_json()['stage_timings']
+
+        data = client.get('/admin/skills/api/skills/pipeline-metrics').get_json()
+        assert data['runs']['success'] == 1
+        assert data['stages']['total']['count'] == 1
+        assert data['dominant_stage'] is not None
+
+    def test_batch_extract_json_array(self, client, skill_service):
+        """Test a JSON array batch streams one result line per document in order"""
+        import json
+
+        response = client.post('/admin/skills/api/skills/extract/batch',
+                               json=['Python and SQL', {'id': 'job-7', 'text': 'Docker'}, {'text': 5}])
+        assert response.mimetype == 'application/x-ndjson'
+
+        lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        assert [line['index'] for line in lines] == [0, 1, 2]
+        assert lines[0]['unmatched_skills'] == ['Python', 'SQL']
+        assert lines[1]['id'] == 'job-7'
+        assert lines[2]['success'] is False
+
+    def test_batch_extract_ndjson_limit(self, app, client, skill_service):
+        """Test an NDJSON upload is cut off with an error line past the maximum batch size"""
+        import json
+
+        app.config['SKILL_BATCH_MAX_DOCUMENTS'] = 2
+        app.config['SKILL_BATCH_CHUNK_SIZE'] = 1
+        body = '{"text": "Python"}\nnot json\n{"text": "SQL"}\n'
+        response = client.post('/admin/skills/api/skills/extract/batch', data=body,
+                               content_type='application/x-ndjson')
+
+        lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        assert len(lines) == 3
+        assert lines[0]['extracted_skills'] == ['Python']
+        assert 'invalid JSON' in lines[1]['error']
+        assert 'exceeds 2 documents' in lines[2]['error']
+
+        too_many = client.post('/admin/skills/api/skills/extract/batch', json=['a', 'b', 'c'])
+        assert too_many.status_code == 413
+
+
+class TestJobApiRoutes:
+    """Test the job listing API"""
+
+    def _walk(self, client, params, cursor_field, cursor=None):
+        """IDs of every page reached by following cursor_field from cursor"""
+        pages = []
+        while True:
+            response = client.get('/job/api/jobs', query_string={**params, 'cursor': cursor or ''})
+            assert response.status_code == 200
+            data = response.get_json()
+            pages.append([job['id'] for job in data['jobs']])
+            cursor = data[cursor_field]
+            if cursor is None:
+                return pages, data
+
+    def test_cursor_pages_cover_every_job_once(self, client, app):
+        """Test next and prev cursors walk all jobs, including ties on last_update"""
+        with app.app_context():
+            same_time = datetime(2024, 1, 1)
+            for i in range(23):
+                job = JobApplication(company=f"Company {i}", title="Python Engineer",
+                                     description="python" if i % 2 else "python python python")
+                db.session.add(job)
+            db.session.commit()
+            # Ties on last_update are ordered by id
+            JobApplication.query.filter(JobApplication.id <= 10).update({'last_update': same_time})
+            db.session.commit()
+            expected = [job.id for job in JobApplication.query.order_by(
+                JobApplication.last_update.desc(), JobApplication.id.desc())]
+
+        for params in ({'per_page': 5, 'count': 'exact'}, {'per_page': 5, 'search': 'pyth'}):
+            pages, last = self._walk(client, params, 'next_cursor')
+            forward = [job_id for page in pages for job_id in page]
+            assert len(pages) == 5 and sorted(forward) == sorted(expected)
+            if 'search' not in params:
+                assert forward == expected
+                assert last['total'] == 23
+
+            # Back from the last page to the first
+            backward, first = self._walk(client, params, 'prev_cursor', cursor=last['prev_cursor'])
+            assert [job_id for page in reversed(backward) for job_id in page] == forward[:-len(pages[-1])]
+            assert first['prev_cursor'] is None
+
+    def test_cursor_pages_include_jobs_without_last_update(self, client, app):
+        """Test jobs with a NULL last_update come last and are paged across page boundaries"""
+        with app.app_context():
+            for i in range(12):
+                db.session.add(JobApplication(company=f"Company {i}", title="Python Engineer", description="python"))
+            db.session.commit()
+            JobApplication.query.filter(JobApplication.id.between(4, 9)).update({'last_update': None})
+            db.session.commit()
+            dated = [job.id for job in JobApplication.query.filter(JobApplication.last_update.isnot(None))
+                     .order_by(JobApplication.last_update.desc(), JobApplication.id.desc())]
+            expected = dated + [9, 8, 7, 6, 5, 4]
+
+        # Equal search ranks leave the (last_update, id) order to break the ties
+        for params in ({'per_page': 5}, {'per_page': 5, 'search': 'python'}):
+            pages, last = self._walk(client, params, 'next_cursor')
+            assert [job_id for page in pages for job_id in page] == expected
+            assert pages[-1] == [5, 4]
+
+            backward, first = self._walk(client, params, 'prev_cursor', cursor=last['prev_cursor'])
+            assert [job_id for page in reversed(backward) for job_id in page] == expected[:-2]
+            assert first['prev_cursor'] is None
+
+    def test_invalid_parameters(self, client, sample_job):
+        """Test bad page sizes and counts are rejected and bad cursors restart at the first page"""
+        assert client.get('/job/api/jobs?per_page=0').status_code == 400
+        assert client.get('/job/api/jobs?count=maybe').status_code == 400
+        from utils.pagination import encode_cursor
+
+        for cursor in ('not-a-cursor', encode_cursor('next', [5, 1]), encode_cursor('next', ['yesterday', 1])):
+            response = client.get('/job/api/jobs', query_string={'cursor': cursor})
+            assert response.status_code == 200
+            data = response.get_json()
+            assert [job['id'] for job in data['jobs']] == [sample_job.id]
+            assert data['prev_cursor'] is None
@@ -0,0 +1,1038 @@
+"""
+Test skill services
+"""
+import pytest
+from models import db, JobApplication, JobSkill, Skill, SkillVariant
+
+
+class TestSkillReextraction:
+    """Test bulk skill re-extraction"""
+
+    def _make_jobs(self, descriptions):
+        jobs = [JobApplication(company=f"Company {i}", title="Engineer", description=description)
+                for i, description in enumerate(descriptions)]
+        db.session.add_all(jobs)
+        db.session.commit()
+        return [job.id for job in jobs]
+
+    def test_reextract_syncs_links(self, app, runner, skill_service, tmp_path):
+        """Test reextract adds new links and removes stale ones"""
+        with app.app_context():
+            job_ids = self._make_jobs(["Python and Docker", "SQL only", None])
+            stale = Skill(name="Cobol")
+            db.session.add(stale)
+            db.session.flush()
+            db.session.add(JobSkill(job_id=job_ids[1], skill_id=stale.id))
+            db.session.commit()
+
+            checkpoint = tmp_path / "checkpoint.json"
+            result = runner.invoke(args=['skills', 'reextract', '--batch-size', '2',
+                                         '--checkpoint', str(checkpoint)])
+
+            assert result.exit_code == 0, result.output
+            assert 'jobs/s' in result.output
+            assert not checkpoint.exists()
+
+            linked = {(js.job_id, js.skills.name) for js in JobSkill.query.all()}
+            assert linked == {(job_ids[0], 'Python'), (job_ids[0], 'Docker'), (job_ids[1], 'SQL')}
+
+    def test_reextract_resumes_from_checkpoint(self, app, skill_service, tmp_path):
+        """Test a run only processes jobs after the checkpointed ID"""
+        from services.skill.skill_reextraction_service import SkillReextractionService
+
+        with app.app_context():
+            job_ids = self._make_jobs(["Python", "Docker", "Kubernetes"])
+            checkpoint = tmp_path / "checkpoint.json"
+            service = SkillReextractionService(str(checkpoint), batch_size=1)
+            service._save_checkpoint({
+                'last_job_id': job_ids[0], 'jobs_processed': 1, 'jobs_failed': 0,
+                'links_added': 1, 'links_removed': 0, 'skills_created': 1,
+            })
+
+            stats = service.run()
+
+            assert stats['jobs_processed'] == 3
+            assert stats['last_job_id'] == job_ids[-1]
+            assert JobSkill.query.filter_by(job_id=job_ids[0]).count() == 0
+            assert JobSkill.query.filter_by(job_id=job_ids[2]).count() == 1
+
+    def test_reextract_sets_extraction_status(self, app, skill_service, tmp_path, monkeypatch):
+        """Test re-extracted jobs become done and jobs whose extraction fails become failed"""
+        from dtos.skill_dtos import ExtractedSkillsResult
+        from services.skill.skill_reextraction_service import SkillReextractionService
+
+        extract = skill_service.extractor.extract_skills_from_texts
+        monkeypatch.setattr(skill_service.extractor, 'extract_skills_from_texts', lambda texts: [
+            ExtractedSkillsResult(skills=[], total_skills=0, success=False, error="Model crashed")
+            if 'Fortran' in text else result
+            for text, result in zip(texts, extract(texts))
+        ])
+
+        with app.app_context():
+            job_ids = self._make_jobs(["Python", "Docker", "Fortran", None])
+            statuses = ['pending', 'failed', 'done', None]
+            for job_id, status in zip(job_ids, statuses):
+                JobApplication.query.filter_by(id=job_id).update({'skill_extraction_status': status})
+            db.session.commit()
+            last_updates = [db.session.get(JobApplication, job_id).last_update for job_id in job_ids]
+
+            stats = SkillReextractionService(str(tmp_path / "checkpoint.json")).run()
+
+            assert stats['jobs_failed'] == 1
+            db.session.expire_all()
+            jobs = [db.session.get(JobApplication, job_id) for job_id in job_ids]
+            assert [job.skill_extraction_status for job in jobs] == ['done', 'done', 'failed', 'done']
+            assert [job.last_update for job in jobs] == last_updates
+
+
+class TestSkillLookupUpdates:
+    """Test skill writes update the lookup incrementally"""
+
+    @pytest.fixture
+    def no_rebuild(self, skill_service, monkeypatch):
+        def _fail():
+            raise AssertionError("lookup was rebuilt")
+        monkeypatch.setattr(skill_service.lookup_service, '_build_lookup', _fail)
+        return skill_service
+
+    def test_create_skills_in_bulk(self, app, no_rebuild):
+        """Test new skills are created together and found without a rebuild"""
+        with app.app_context():
+            existing = Skill(name="Python")
+            db.session.add(existing)
+            db.session.commit()
+
+            success, skills, error = no_rebuild.create_skills(["Python", "Terraform", "terraform", " "])
+
+            assert success and error is None
+            assert skills["Python"].id == existing.id
+            assert skills["Terraform"].id == skills["terraform"].id
+            assert Skill.query.count() == 2
+            assert no_rebuild.normalize_skill_name("TERRAFORM").id == skills["Terraform"].id
+
+    def test_rename_and_delete(self, app, no_rebuild):
+        """Test renames and deletes move or drop the lookup entries"""
+        with app.app_context():
+            _, skill, _ = no_rebuild.create_skill("Postgres")
+            db.session.add(SkillVariant(skill_id=skill.id, variant_name="psql"))
+            db.session.commit()
+            no_rebuild.apply_variant_change(skill, added="psql")
+            assert no_rebuild.normalize_skill_name("PSQL").id == skill.id
+
+            no_rebuild.update_skill(skill.id, name="PostgreSQL")
+            assert no_rebuild.normalize_skill_name("Postgres") is None
+            assert no_rebuild.normalize_skill_name("postgresql").id == skill.id
+
+            no_rebuild.delete_skill(skill.id)
+            assert no_rebuild.normalize_skill_name("PostgreSQL") is None
+            assert no_rebuild.normalize_skill_name("psql") is None
+
+    def test_deltas_use_reverse_index(self, app, no_rebuild):
+        """Test per-skill updates never scan the lookup and keep the reverse index in step"""
+        class NoScanDict(dict):
+            def _scan(self, *args):
+                raise AssertionError("lookup was scanned")
+            items = values = keys = __iter__ = _scan
+
+        lookup_service = no_rebuild.lookup_service
+        with app.app_context():
+            _, python, _ = no_rebuild.create_skill("Python")
+            _, postgres, _ = no_rebuild.create_skill("Postgres")
+            db.session.add(SkillVariant(skill_id=postgres.id, variant_name="PSQL"))
+            db.session.commit()
+            lookup_service._skill_lookup = NoScanDict(lookup_service._skill_lookup)
+
+            no_rebuild.apply_variant_change(postgres, added="PSQL")
+            no_rebuild.update_skill(postgres.id, name="PostgreSQL")
+            no_rebuild.set_blacklist(python.id, True)
+            assert lookup_service.records_for([postgres.id, python.id, 999]) == {
+                postgres.id: no_rebuild.normalize_skill_name("psql"),
+                python.id: no_rebuild.normalize_skill_name("python"),
+            }
+            assert no_rebuild.normalize_skill_name("python").is_blacklisted
+            lookup_service.reload_skills([python.id], lookup_service.version)
+
+            expected = {}
+            for key, record in dict.items(lookup_service._skill_lookup):
+                expected.setdefault(record.id, set()).add(key)
+            assert lookup_service._keys_by_skill == expected
+            assert expected[postgres.id] == {"postgresql", "PostgreSQL", "psql", "PSQL"}
+
+
+    def test_lookup_holds_records(self, app, skill_service):
+        """Test the lookup returns immutable records and results carry ids"""
+        import dataclasses
+        from dtos.skill_dtos import SkillRecord
+        from models import SkillCategory
+
+        with app.app_context():
+            _, skill, _ = skill_service.create_skill("Python")
+            record = skill_service.normalize_skill_name("python")
+            assert isinstance(record, SkillRecord) and record.id == skill.id
+            with pytest.raises(dataclasses.FrozenInstanceError):
+                record.name = "Java"
+
+            # Categories changed outside SkillService are read at categorization time
+            category = SkillCategory(name="Languages")
+            db.session.add(category)
+            db.session.flush()
+            skill.category_id = category.id
+            db.session.commit()
+
+            result = skill_service.process_job_description("Python")
+            assert result.skill_ids == [skill.id]
+            assert [s.name for s in result.categorized_skills["Languages"]] == ["Python"]
+            assert skill_service.get_skills_by_ids(result.skill_ids) == [skill]
+
+
+class TestSkillCatalogVersion:
+    """Test cross-process cache invalidation through the catalog version"""
+
+    def test_writes_bump_version(self, app):
+        """Test catalog writes bump the version and log the touched skills"""
+        from models import SkillCatalogChange, SkillCatalogVersion, SkillCategory
+
+        with app.app_context():
+            assert SkillCatalogVersion.current() == 0
+
+            skill = Skill(name="Python")
+            db.session.add(skill)
+            db.session.commit()
+            assert SkillCatalogVersion.current() == 1
+            assert SkillCatalogChange.skill_ids_between(0, 1) == {skill.id}
+
+            db.session.add(SkillCategory(name="Languages"))
+            db.session.commit()
+            assert SkillCatalogVersion.current() == 2
+            assert SkillCatalogChange.skill_ids_between(1, 2) == set()
+
+            Skill.query.filter_by(id=skill.id).update({'is_blacklisted': True})
+            db.session.commit()
+            assert SkillCatalogChange.skill_ids_between(2, SkillCatalogVersion.current()) is None
+
+    def test_sync_applies_other_writers_changes(self, app, skill_service):
+        """Test edits made behind the service's back reach its lookup on sync"""
+        with app.app_context():
+            assert skill_service.sync_catalog() is False
+
+            # As another worker would: straight to the database, not through this service
+            skill = Skill(name="Postgres")
+            db.session.add(skill)
+            db.session.commit()
+            assert skill_service.normalize_skill_name("postgres") is None
+
+            assert skill_service.sync_catalog() is True
+            assert skill_service.normalize_skill_name("postgres").id == skill.id
+
+            skill.name = "PostgreSQL"
+            db.session.add(SkillVariant(skill_id=skill.id, variant_name="psql"))
+            db.session.commit()
+            skill_service.sync_catalog()
+            assert skill_service.normalize_skill_name("postgres") is None
+            assert skill_service.normalize_skill_name("psql").name == "PostgreSQL"
+            assert skill_service.sync_catalog() is False
+
+    def test_lookup_snapshot_follows_version(self, app, tmp_path, monkeypatch):
+        """Test a new lookup restores its rows from disk until the catalog changes"""
+        from services.skill.lookup_snapshot import SkillLookupSnapshot
+        from services.skill.skill_lookup_service import SkillLookupService
+
+        # The test database is in memory, which is never snapshotted
+        monkeypatch.setattr(SkillLookupSnapshot, '_database', staticmethod(lambda: 'sqlite:///jobs.db'))
+        with app.app_context():
+            skill = Skill(name="PostgreSQL")
+            db.session.add(skill)
+            db.session.flush()
+            db.session.add(SkillVariant(skill_id=skill.id, variant_name="psql"))
+            db.session.commit()
+
+            built = SkillLookupService(str(tmp_path))
+            assert built.source == 'database+saved'
+
+            def _fail(skill_ids=None):
+                raise AssertionError("catalog was read")
+            with monkeypatch.context() as patch:
+                patch.setattr(SkillLookupService, '_load_records', staticmethod(_fail))
+                restored = SkillLookupService(str(tmp_path))
+            assert restored.source == 'restored'
+            assert restored.lookup_dict == built.lookup_dict
+            assert restored.version == built.version
+
+            skill.is_blacklisted = True
+            db.session.commit()
+            rebuilt = SkillLookupService(str(tmp_path))
+            assert rebuilt.source == 'database+saved'
+            assert rebuilt.find_skill("psql").is_blacklisted
+
+
+class TestFuzzyIndex:
+    """Test fuzzy matching of names with no exact lookup entry"""
+
+    def test_matches_near_duplicates(self):
+        """Test spacing, punctuation and version variants match; unrelated names do not"""
+        from services.skill.fuzzy_index import TrigramIndex
+
+        index = TrigramIndex(["postgresql", "node.js", "javascript", "kubernetes"], threshold=0.75)
+
+        assert index.best_match("Postgres SQL")[0] == "postgresql"
+        assert index.best_match("PostgreSQL 14") == ("postgresql", 1.0)
+        assert index.best_match("Node JS") == ("node.js", 1.0)
+        assert index.best_match("Java") is None
+        assert index.best_match("Go") is None
+
+    def test_incremental_updates(self):
+        """Test names sharing a key stay matchable until the last is removed"""
+        from services.skill.fuzzy_index import TrigramIndex
+
+        index = TrigramIndex(["node.js", "nodejs"])
+        index.remove("node.js")
+        assert index.best_match("Node JS") == ("nodejs", 1.0)
+
+        index.remove("nodejs")
+        assert index.best_match("Node JS") is None
+        assert len(index) == 0
+
+        index.add("terraform")
+        assert index.best_match("Terraform 1.5") == ("terraform", 1.0)
+
+    def test_pipeline_reports_fuzzy_matches(self, app, skill_service):
+        """Test fuzzy matches normalize to the canonical skill and are counted"""
+        from dtos.skill_dtos import ExtractedSkillsResult
+
+        with app.app_context():
+            success, skills, _ = skill_service.create_skills(["PostgreSQL", "Node.js"])
+            assert success
+
+            result = skill_service.process_extracted_skills(ExtractedSkillsResult(
+                skills=["Postgres SQL", "Node JS", "PostgreSQL", "Cobol"], total_skills=4, success=True
+            ))
+
+            assert result.skill_ids == [skills["PostgreSQL"].id, skills["Node.js"].id]
+            assert result.fuzzy_matches == {"Postgres SQL": "PostgreSQL", "Node JS": "Node.js"}
+            assert result.unmatched_skills == ["Cobol"]
+            assert result.counters['fuzzy_matched'] == 2
+            assert 'fuzzy_match' in result.stage_timings
+
+            skill_service.delete_skill(skills["Node.js"].id)
+            assert skill_service.lookup_service.find_similar("Node JS") is None
+
+
+class TestSurfaceFormMemo:
+    """Test the memo of raw skill strings to normalization outcomes"""
+
+    RAW = ["python", "Cobol", "years of experience", "Postgres SQL"]
+
+    def _process(self, skill_service):
+        from dtos.skill_dtos import ExtractedSkillsResult
+        return skill_service.process_extracted_skills(
+            ExtractedSkillsResult(skills=list(self.RAW), total_skills=len(self.RAW), success=True)
+        )
+
+    def test_outcomes_are_memoized_and_persisted(self, app, skill_service):
+        """Test repeated strings resolve from the memo and warm a new process"""
+        from models import SkillSurfaceForm
+        from services.skill.surface_memo import SurfaceFormMemo
+
+        with app.app_context():
+            _, skills, _ = skill_service.create_skills(["Python", "PostgreSQL"])
+
+            first = self._process(skill_service)
+            second = self._process(skill_service)
+
+            assert first.counters['memo_hits'] == 0
+            assert second.counters['memo_hits'] == len(self.RAW)
+            assert second.skill_ids == first.skill_ids == [skills["Python"].id, skills["PostgreSQL"].id]
+            assert second.unmatched_skills == ["Cobol"]
+            assert second.fuzzy_matches == {"Postgres SQL": "PostgreSQL"}
+
+            stored = {row.surface: row.outcome for row in SkillSurfaceForm.query.all()}
+            assert stored == {"python": "skill", "Cobol": "unmatched",
+                              "years of experience": "noise", "Postgres SQL": "skill"}
+
+            warmed = SurfaceFormMemo(skill_service.lookup_service, skill_service.config)
+            assert warmed.get_many(self.RAW)["Postgres SQL"].skill.id == skills["PostgreSQL"].id
+
+    def test_catalog_writes_invalidate_selectively(self, app, skill_service):
+        """Test new names and changed skills drop only their own outcomes"""
+        from models import SkillSurfaceForm
+
+        with app.app_context():
+            _, skills, _ = skill_service.create_skills(["Python", "PostgreSQL"])
+            self._process(skill_service)
+
+            _, created, _ = skill_service.create_skills(["COBOL"])
+            skill_service.update_skill(skills["Python"].id, is_blacklisted=True)
+
+            assert {row.surface for row in SkillSurfaceForm.query.all()} == {"years of experience", "Postgres SQL"}
+            memoized = skill_service.surface_memo.get_many(self.RAW)
+            assert set(memoized) == {"years of experience", "Postgres SQL"}
+
+            result = self._process(skill_service)
+            assert created["COBOL"].id in result.skill_ids
+            assert result.counters['memo_hits'] == 2
+
+
+class TestSkillExtractionStatus:
+    """Test skill extraction state tracking"""
+
+    def test_create_job_extracts_inline_without_workers(self, app, client, skill_service):
+        """Test jobs are extracted in the request when no worker pool is configured"""
+        from services import JobService
+
+        with app.app_context():
+            success, job, _ = JobService().create_job("Acme", "Engineer", description="Python and SQL")
+            assert success
+
+            response = client.get(f'/job/{job.id}/skills/status')
+            assert response.status_code == 200
+            data = response.get_json()
+            assert data['status'] == 'done'
+            assert data['skills_count'] == 2
+
+    def test_stale_result_is_ignored(self, app, skill_service):
+        """Test a worker result is dropped if the description changed meanwhile"""
+        from services import JobService
+
+        with app.app_context():
+            job = JobApplication(company="Acme", title="Engineer", description="Docker",
+                                 skill_extraction_status='pending')
+            db.session.add(job)
+            db.session.commit()
+
+            result = skill_service.extractor.extract_skills_from_text("Python")
+            success, _ = JobService().apply_extraction_result(job.id, "Python", {"Python": result})
+
+            assert not success
+            assert JobSkill.query.filter_by(job_id=job.id).count() == 0
+            assert db.session.get(JobApplication, job.id).skill_extraction_status == 'pending'
+
+    def test_edited_job_is_extracted_in_background(self, app, client, skill_service, monkeypatch):
+        """Test a worker result for an edit with HTML special characters matches the stored description"""
+        from services import JobService
+        from services.skill.extraction_executor import extraction_executor
+
+        queued = []
+        monkeypatch.setattr(extraction_executor, '_pool', object())
+        monkeypatch.setattr(extraction_executor, 'submit', lambda *args: queued.append(args) or True)
+
+        with app.app_context():
+            job = JobApplication(company="Acme", title="Engineer", description="Docker")
+            db.session.add(job)
+            db.session.commit()
+
+            response = client.post(f'/job/{job.id}/edit', data={
+                'company': "Acme & Sons",
+                'title': "Engineer",
+                'description': "We're hiring Python & SQL devs",
+            })
+            assert response.status_code == 302
+
+            stored = db.session.get(JobApplication, job.id)
+            assert stored.description == "We&#x27;re hiring Python &amp; SQL devs"
+            assert stored.skill_extraction_status == 'pending'
+
+            # Run the queued extraction as the worker pool and writer thread would
+            [(job_id, description, texts)] = queued
+            results = {text: skill_service.extractor.extract_skills_from_text(text) for text in texts}
+            success, _ = JobService().apply_extraction_result(job_id, description, results)
+
+            assert success
+            db.session.expire_all()
+            assert db.session.get(JobApplication, job.id).skill_extraction_status == 'done'
+            assert JobSkill.query.filter_by(job_id=job.id).count() == 2
+
+    def test_status_unknown_job(self, client):
+        """Test the status endpoint for a missing job"""
+        response = client.get('/job/9999/skills/status')
+        assert response.status_code == 404
+
+    def test_cli_commands_skip_warmup_and_workers(self, monkeypatch):
+        """Test only serving the app loads the NLP models and starts the worker pool"""
+        import click
+        from app import create_app
+        from config import TestingConfig, config
+        from services.skill import skill_service as skill_service_module
+        from services.skill.extraction_executor import extraction_executor
+
+        class WarmupConfig(TestingConfig):
+            SKILL_MODEL_WARMUP = True
+
+        started = []
+        monkeypatch.setitem(config, 'warmup', WarmupConfig)
+        monkeypatch.setattr(skill_service_module, 'start_skill_warmup', lambda app: started.append('warmup'))
+        monkeypatch.setattr(extraction_executor, 'init_app', lambda app: started.append('workers'))
+
+        with click.Context(click.Command('skills')):
+            create_app('warmup')
+        assert started == []
+
+        with click.Context(click.Command('run')):
+            create_app('warmup')
+        assert started == ['workers', 'warmup']
+
+
+class TestJobSkillSync:
+    """Test set-based syncing of a job's skill links"""
+
+    def test_reextraction_replaces_links(self, app, skill_service):
+        """Test a changed description adds new links and drops stale ones in one statement each"""
+        from sqlalchemy import event
+        from services import JobService
+
+        with app.app_context():
+            job = JobApplication(company="Acme", title="Engineer", description="Python and Docker")
+            db.session.add(job)
+            db.session.commit()
+            job_service = JobService()
+            assert job_service.extract_job_skills(job.id, job.description)[0]
+
+            statements = []
+
+            def _record(conn, cursor, statement, *args):
+                statements.append(statement)
+
+            event.listen(db.engine, 'before_cursor_execute', _record)
+            try:
+                success, _ = job_service.extract_job_skills(job.id, "Python, SQL and Kubernetes")
+            finally:
+                event.remove(db.engine, 'before_cursor_execute', _record)
+            assert success
+
+            linked = {js.skills.name for js in JobSkill.query.filter_by(job_id=job.id)}
+            assert linked == {"Python", "SQL", "Kubernetes"}
+            assert sum(statement.startswith('INSERT INTO job_skill') for statement in statements) == 1
+            assert sum(statement.startswith('DELETE FROM job_skill') for statement in statements) == 1
+
+    def test_links_are_unique(self, app, skill_service):
+        """Test duplicate links are rejected, and skipped by the bulk insert"""
+        from sqlalchemy.exc import IntegrityError
+        from services import JobService
+
+        with app.app_context():
+            job = JobApplication(company="Acme", title="Engineer")
+            skill = Skill(name="Python")
+            db.session.add_all([job, skill])
+            db.session.flush()
+            db.session.add(JobSkill(job_id=job.id, skill_id=skill.id))
+            db.session.commit()
+
+            db.session.execute(JobSkill.insert_ignoring_duplicates(), [{'job_id': job.id, 'skill_id': skill.id}])
+            assert JobSkill.query.filter_by(job_id=job.id).count() == 1
+
+            db.session.add(JobSkill(job_id=job.id, skill_id=skill.id))
+            with pytest.raises(IntegrityError):
+                db.session.commit()
+            db.session.rollback()
+
+            assert JobService().sync_job_skills(job.id, [])[1] == (0, 1)
+
+
+class TestExtractionCache:
+    """Test the persistent extraction result cache"""
+
+    def test_unchanged_text_skips_extractor(self, app, skill_service):
+        """Test a repeated description is served from the cache"""
+        with app.app_context():
+            first = skill_service.process_job_description("Python and Docker")
+            # Same text after cleaning
+            second = skill_service.process_job_description("Python  and <b>Docker</b>")
+
+            assert skill_service.extractor.calls == 1
+            assert second.extracted_skills == first.extracted_skills
+            stats = skill_service.extraction_cache.stats()
+            assert (stats['hits'], stats['misses'], stats['size']) == (1, 1, 1)
+
+    def test_config_version_change_misses(self, app, skill_service):
+        """Test results cached under another config version are not reused"""
+        with app.app_context():
+            skill_service.process_job_description("Python")
+            skill_service.extraction_cache.config_version = "changed"
+            skill_service.process_job_description("Python")
+
+            assert skill_service.extractor.calls == 2
+            assert skill_service.extraction_cache.stats()['size'] == 1
+
+    def test_edited_section_is_reextracted_alone(self, app, skill_service):
+        """Test only the changed '####' section of a description reaches the extractor"""
+        with app.app_context():
+            original = "#### Requirements\nPython and SQL\n#### Nice to have\nDocker"
+            skill_service.process_job_description(original)
+            assert skill_service.extractor.calls == 2
+
+            edited = skill_service.process_job_description(original.replace("Docker", "Kubernetes"))
+            assert skill_service.extractor.calls == 3
+            assert edited.extracted_skills == ['Python', 'SQL', 'Kubernetes']
+
+    def test_lru_eviction(self, app, skill_service):
+        """Test the least recently used entry is evicted past the maximum size"""
+        with app.app_context():
+            app.config['SKILL_EXTRACTION_CACHE_SIZE'] = 2
+            cache = skill_service.extraction_cache
+            for text in ("Python", "Docker"):
+                skill_service.extract_skills(text)
+            skill_service.extract_skills("Python")  # Docker is now least recently used
+            skill_service.extract_skills("SQL")
+
+            assert cache.stats()['size'] == 2
+            assert cache.get("Python") is not None
+            assert cache.get("Docker") is None
+
+    def test_lookup_reads_sections_in_one_query(self, app, skill_service):
+        """Test section lookups run one SELECT and leave the caller's session uncommitted"""
+        from sqlalchemy import event
+
+        with app.app_context():
+            sections = ["Python", "Docker", "SQL"]
+            skill_service.extract_skills_batch(sections)
+            db.session.add(Skill(name="Pending"))
+
+            statements = []
+
+            def _record(conn, cursor, statement, *args):
+                # The pending skill is flushed by the first query; only cache statements count
+                if 'skill_extraction_cache' in statement or statement.startswith('COMMIT'):
+                    statements.append(statement)
+
+            event.listen(db.engine, 'before_cursor_execute', _record)
+            try:
+                hits = skill_service.lookup_sections(sections + ["Kubernetes"])
+            finally:
+                event.remove(db.engine, 'before_cursor_execute', _record)
+
+            assert sorted(hits) == sorted(sections)
+            assert len(statements) == 1 and statements[0].startswith('SELECT')
+            db.session.rollback()
+            assert Skill.query.filter_by(name="Pending").count() == 0
+
+
+class TestCatalogBackend:
+    """Test the catalog phrase matcher extractor backend"""
+
+    def _extractor(self, terms=None):
+        from configurations.skill_config import SkillExtractionConfig
+        from services.skill.extractor_backends import CatalogPhraseBackend
+        from services.skill.skill_extractor import SkillExtractor
+
+        config = SkillExtractionConfig()
+        return SkillExtractor(config, backend=CatalogPhraseBackend(config, terms))
+
+    def test_matches_names_and_variants(self):
+        """Test variants resolve to the canonical name and short names need exact case"""
+        extractor = self._extractor([
+            ('Python', []), ('Go', []), ('Machine Learning', ['ML']),
+            ('Kubernetes', ['k8s']), ('Spring', []), ('Spring Boot', []),
+        ])
+        result = extractor.extract_skills_from_text(
+            "We use python, K8s and Spring Boot. Ready to go? Go experience and ML a plus."
+        )
+
+        assert result.success
+        assert result.skills == ['Python', 'Kubernetes', 'Spring Boot', 'Go', 'Machine Learning']
+
+    def test_incremental_vocabulary_updates(self):
+        """Test skills can be added, renamed and removed without a rebuild"""
+        extractor = self._extractor([('Python', [])])
+        extractor.add_skill('Docker', ['docker compose'])
+        extractor.remove_skill('Python')
+
+        assert extractor.extract_skills_from_text("Python with Docker Compose").skills == ['Docker']
+
+    def test_batch_matches_each_text(self):
+        """Test a piped batch gives the same results as texts extracted one by one"""
+        extractor = self._extractor([('Python', []), ('Docker', [])])
+        results = extractor.extract_skills_from_texts(["Docker", "   ", "Python and docker"])
+
+        assert [result.skills for result in results] == [['Docker'], [], ['Python', 'Docker']]
+        assert not results[1].success
+        assert results[2].stage_timings['match'] >= 0
+
+    def test_loads_catalog_from_database(self, app):
+        """Test the backend reads skills and variants from the tables"""
+        from models import SkillVariant
+
+        with app.app_context():
+            skill = Skill(name='PostgreSQL')
+            db.session.add(skill)
+            db.session.flush()
+            db.session.add(SkillVariant(skill_id=skill.id, variant_name='Postgres'))
+            db.session.commit()
+
+            extractor = self._extractor()
+            assert extractor.extract_skills_from_text("Postgres experience").skills == ['PostgreSQL']
+
+
+class TestNlpSnapshot:
+    """Test saving and restoring phrase matchers"""
+
+    def _matchers(self, nlp):
+        from spacy.matcher import PhraseMatcher
+
+        matcher = PhraseMatcher(nlp.vocab, attr='LOWER')
+        matcher.add('skill_1', [nlp.make_doc('machine learning'), nlp.make_doc('ML')])
+        matcher.add('skill_2', [nlp.make_doc('docker')])
+        return {'full_matcher': matcher}
+
+    def test_round_trip(self, tmp_path):
+        """Test restored matchers find the same matches in a fresh vocab"""
+        import spacy
+        from services.skill.nlp_snapshot import SkillNerSnapshot
+
+        skills_db = {'skill_1': {'skill_len': 2}, 'skill_2': {'skill_len': 1}}
+        saved = SkillNerSnapshot(str(tmp_path), spacy.blank('en'), skills_db)
+        assert saved.save(self._matchers(saved.nlp))
+
+        nlp = spacy.blank('en')
+        restored = SkillNerSnapshot(str(tmp_path), nlp, skills_db).load()
+        matcher = restored['full_matcher']
+        doc = nlp.make_doc("Docker and Machine Learning")
+        assert [(matcher.vocab.strings[m], s, e) for m, s, e in matcher(doc)] == [
+            ('skill_2', 0, 1), ('skill_1', 2, 4)
+        ]
+
+    def test_stale_snapshot_is_ignored(self, tmp_path):
+        """Test a changed skill database invalidates the snapshot"""
+        import spacy
+        from services.skill.nlp_snapshot import SkillNerSnapshot
+
+        nlp = spacy.blank('en')
+        SkillNerSnapshot(str(tmp_path), nlp, {'skill_1': {}}).save(self._matchers(nlp))
+
+        assert SkillNerSnapshot(str(tmp_path), nlp, {'skill_1': {}, 'skill_3': {}}).load() is None
+
+
+class TestCompactSkillDB:
+    """Test the memory-mapped copy of SkillNER's skill database"""
+
+    SKILLS_DB = {
+        'KS1': {'skill_name': 'Machine Learning', 'skill_type': 'Hard Skill', 'skill_len': 2,
+                'high_surfce_forms': {'full': 'machine learning', 'abv': 'ml'},
+                'low_surface_forms': ['machine learn'], 'match_on_tokens': True},
+        'KS0': {'skill_name': 'Docker', 'skill_type': 'Hard Skill', 'skill_len': 1,
+                'high_surfce_forms': {'full': 'docker'}, 'low_surface_forms': [], 'match_on_tokens': False},
+    }
+
+    def test_round_trip(self, tmp_path):
+        """Test records read back equal to the source dict"""
+        from services.skill.compact_skill_db import CompactSkillDB
+
+        path = str(tmp_path / 'skill_db.bin')
+        CompactSkillDB.build(path, self.SKILLS_DB)
+        compact = CompactSkillDB(path)
+
+        assert len(compact) == 2
+        assert list(compact) == ['KS1', 'KS0']
+        assert 'KS0' in compact and 'KS2' not in compact
+        assert {key: compact[key].to_dict() for key in compact} == self.SKILLS_DB
+        assert compact['KS1']['high_surfce_forms']['abv'] == 'ml'
+        with pytest.raises(KeyError):
+            compact['KS2']
+        compact.close()
+
+    def test_rebuilds_for_changed_source(self, tmp_path):
+        """Test a compact copy built from another skill database is replaced"""
+        from services.skill.compact_skill_db import CompactSkillDB, skill_db_fingerprint
+
+        path = str(tmp_path / 'skill_db.bin')
+        CompactSkillDB.open_or_build(path, {'KS0': self.SKILLS_DB['KS0']}).close()
+
+        compact = CompactSkillDB.open_or_build(path, self.SKILLS_DB)
+        assert len(compact) == 2
+        # Snapshots keyed by the dict stay valid once SkillNER reads the compact copy
+        assert skill_db_fingerprint(compact) == skill_db_fingerprint(self.SKILLS_DB)
+        compact.close()
+
+    def test_source_file_fingerprint_skips_the_dict(self, tmp_path, monkeypatch):
+        """Test a copy keyed on its source file reopens without reading or serializing the dict"""
+        import os
+        import srsly
+        from collections.abc import Mapping
+        from services.skill.compact_skill_db import CompactSkillDB, skill_db_fingerprint
+
+        class Untouchable(Mapping):
+            def __getitem__(self, key):
+                raise AssertionError("SKILL_DB was read")
+            __iter__ = __len__ = __getitem__
+
+        source = tmp_path / 'skill_db_relax_20.json'
+        source.write_text(srsly.json_dumps(self.SKILLS_DB))
+        path = str(tmp_path / 'skill_db.bin')
+        source_hash = skill_db_fingerprint(self.SKILLS_DB, str(source))
+        CompactSkillDB.open_or_build(path, self.SKILLS_DB, source_hash).close()
+
+        monkeypatch.setattr(srsly, 'json_dumps', Untouchable().__getitem__)
+        untouchable = Untouchable()
+        assert skill_db_fingerprint(untouchable, str(source)) == source_hash
+        compact = CompactSkillDB.open_or_build(path, untouchable, skill_db_fingerprint(untouchable, str(source)))
+        assert len(compact) == 2
+        compact.close()
+
+        # A rewritten source file gets another fingerprint
+        os.utime(source, ns=(0, 0))
+        assert skill_db_fingerprint(self.SKILLS_DB, str(source)) != source_hash
+
+
+class TestPrunedModel:
+    """Test deriving a spaCy model with pruned, memory-mapped vectors"""
+
+    WORDS = ('the', 'python', 'Python', 'cat', 'kitten')
+
+    @pytest.fixture
+    def source_model(self, tmp_path):
+        import numpy
+        import spacy
+        from spacy.vectors import Vectors
+
+        nlp = spacy.blank('en')
+        nlp.add_pipe('sentencizer')
+        data = numpy.array([[1, 0, 0], [0, 0, 1], [0, 0, 1], [0, 1, 0], [0, 0.9, 0.1]], dtype='float32')
+        keys = [nlp.vocab.strings.add(word) for word in self.WORDS]
+        nlp.vocab.vectors = Vectors(strings=nlp.vocab.strings, data=data, keys=keys, name='test_vectors')
+        nlp.to_disk(tmp_path / 'source')
+        return str(tmp_path / 'source')
+
+    def test_prunes_to_vocabulary(self, source_model, tmp_path):
+        """Test kept words keep their vectors and others map to the nearest kept row"""
+        import numpy
+        from services.skill.pruned_model import build_pruned_model, is_pruned_model, load_model
+
+        output = str(tmp_path / 'pruned')
+        stats = build_pruned_model(source_model, output, {'cat', 'python'}, keep_top=1)
+        assert stats['rows_after'] == 4 and stats['remapped_keys'] == 1
+        assert stats['removed_components'] == ['sentencizer']
+        assert is_pruned_model(output) and not is_pruned_model(source_model)
+
+        nlp = load_model(output)
+        assert isinstance(nlp.vocab.vectors.data, numpy.memmap)
+        assert nlp.pipe_names == []
+        assert list(nlp.vocab['Python'].vector) == [0, 0, 1]
+        assert list(nlp.vocab['kitten'].vector) == list(nlp.vocab['cat'].vector)
+
+    def test_collect_vocabulary(self, tmp_path):
+        """Test vocabulary comes from token_dist.json and skill names"""
+        import json
+        from services.skill.pruned_model import collect_vocabulary
+
+        token_dist = tmp_path / 'token_dist.json'
+        token_dist.write_text(json.dumps({'Learning': 3}))
+        assert collect_vocabulary(str(token_dist), ['Machine Learning', 'CI/CD']) == {'learning', 'machine', 'ci', 'cd'}
+
+
+class TestExtractionSidecar:
+    """Test forwarding extraction to a sidecar over a Unix socket"""
+
+    @pytest.fixture
+    def sidecar(self, tmp_path):
+        import threading
+        from services.skill.extraction_sidecar import ExtractionSidecarServer
+        from tests.conftest import KeywordExtractor
+
+        server = ExtractionSidecarServer(str(tmp_path / 'skills.sock'), KeywordExtractor(['Python', 'SQL']))
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+        server.server_close()
+
+    def test_client_round_trip(self, sidecar):
+        """Test a batch of texts is extracted by the sidecar's extractor"""
+        from services.skill.extraction_sidecar import SidecarExtractorClient
+
+        client = SidecarExtractorClient(sidecar.socket_path)
+        results = client.extract_skills_from_texts(["Python and SQL", "   "])
+
+        assert client.ping()
+        assert results[0].skills == ['Python', 'SQL']
+        assert not results[1].success
+        assert sidecar.extractor.calls == 2
+
+    def test_skill_service_client_mode(self, app, sidecar):
+        """Test SkillService forwards extraction when a sidecar is configured"""
+        import services.skill.skill_service as skill_service_module
+
+        app.config['SKILL_EXTRACTION_SIDECAR'] = sidecar.socket_path
+        skill_service_module._skill_service_instance = None
+        try:
+            with app.app_context():
+                service = skill_service_module.get_skill_service()
+                result = service.process_job_description("Python developer")
+
+                assert result.success
+                assert result.unmatched_skills == ['Python']
+                assert skill_service_module.get_skill_readiness()['model'] is True
+        finally:
+            skill_service_module._skill_service_instance = None
+
+    def test_unreachable_sidecar_fails_extraction(self, tmp_path):
+        """Test a missing sidecar yields a failed result instead of raising"""
+        from services.skill.extraction_sidecar import SidecarExtractorClient
+
+        client = SidecarExtractorClient(str(tmp_path / 'missing.sock'), timeout=1)
+        result = client.extract_skills_from_text("Python")
+
+        assert not result.success
+        assert 'unavailable' in result.error
+        assert not client.ping()
+
+    def test_fixed_vocabulary_is_not_reloaded(self, tmp_path):
+        """Test skill edits send no reload to a sidecar whose backend ignores the catalog"""
+        import threading
+        from services.skill.extraction_sidecar import ExtractionSidecarServer, SidecarExtractorClient
+        from tests.conftest import KeywordExtractor
+
+        reloads = []
+        server = ExtractionSidecarServer(str(tmp_path / 'skills.sock'), KeywordExtractor(['Python']),
+                                         reload_vocabulary=lambda: reloads.append(True))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            client = SidecarExtractorClient(server.socket_path)
+            client.add_skill('COBOL')
+            client.remove_skill('COBOL')
+            assert not client.follows_catalog
+            assert reloads == []
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_unreachable_sidecar_keeps_skill_writes(self, app, tmp_path):
+        """Test skill writes succeed and are committed when the sidecar is down"""
+        import services.skill.skill_service as skill_service_module
+        from services.skill.extraction_sidecar import SidecarExtractorClient
+
+        app.config['SKILL_EXTRACTION_SIDECAR'] = str(tmp_path / 'missing.sock')
+        skill_service_module._skill_service_instance = None
+        try:
+            with app.app_context():
+                service = skill_service_module.get_skill_service()
+                service._extractor = SidecarExtractorClient(service.sidecar_path, timeout=1)
+
+                success, skill, error = service.create_skill("COBOL")
+                assert success and error is None
+
+                success, created, error = service.create_skills(["Fortran", "Ada"])
+                assert success and set(created) == {"Fortran", "Ada"}
+
+                success, _, error = service.delete_skill(skill.id)
+                assert success and error is None
+                assert {s.name for s in Skill.query.all()} == {"Fortran", "Ada"}
+        finally:
+            skill_service_module._skill_service_instance = None
+
+
+class TestPipelineMetrics:
+    """Test per-stage timing and size histograms"""
+
+    def test_histogram_buckets_and_quantiles(self):
+        """Test observations land in cumulative buckets"""
+        from services.skill.pipeline_metrics import Histogram
+
+        histogram = Histogram((1, 10, 100))
+        for value in (0.5, 5, 5, 50, 500):
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+        assert snapshot['buckets'] == {'1': 1, '10': 3, '100': 4, '+Inf': 5}
+        assert (snapshot['count'], snapshot['min'], snapshot['max']) == (5, 0.5, 500)
+        assert snapshot['p50'] == 10
+
+    def test_processed_result_records_stages(self, app, skill_service):
+        """Test a processed description carries and records its stage timings"""
+        from services.skill.pipeline_metrics import pipeline_metrics
+
+        pipeline_metrics.reset()
+        with app.app_context():
+            result = skill_service.process_job_description("Python and Docker")
+
+        assert {'normalize', 'categorize', 'cache_lookup'} <= set(result.stage_timings)
+        assert result.counters['extracted'] == 2
+        assert result.counters['unmatched'] == 2
+
+        metrics = pipeline_metrics.snapshot()
+        assert metrics['runs'] == {'success': 1, 'failed': 0}
+        assert metrics['stages']['normalize']['count'] == 1
+        assert metrics['counters']['extracted']['sum'] == 2
+
+
+class TestTokenPrefilter:
+    """Test the token_dist.json sentence prefilter"""
+
+    DESCRIPTION = (
+        "#### Requirements\n"
+        "- 3+ years of Python and SQL\n"
+        "- Experience with project management\n"
+        "#### Benefits\n"
+        "Thanks!!\n"
+        "We are who we are.\n"
+    )
+
+    def test_drops_sentences_without_vocabulary_tokens(self):
+        """Test sentences made only of stop words or unknown tokens are dropped"""
+        from services.skill.token_prefilter import TokenPrefilter
+
+        prefilter = TokenPrefilter({'python': 3, 'sql': 51, 'manage': 12, 'the': 41}, stop_words={'the'})
+        kept, dropped = prefilter.filter("Python and SQL. Thanks!! The end.\nManaging teams")
+
+        assert kept == "Python and SQL.\nManaging teams"
+        assert dropped == len("Thanks!!") + len("The end.")
+        assert prefilter.count('sql') == 51
+        assert prefilter.count('the') == 0
+
+    def test_recall_matches_unfiltered_extraction(self):
+        """Test the shipped token_dist.json keeps every skill the unfiltered path finds"""
+        from configurations.skill_config import SkillExtractionConfig
+        from services.skill.extractor_backends import ExtractorBackend
+        from services.skill.skill_extractor import SkillExtractor
+
+        class SkillDbBackend(ExtractorBackend):
+            uses_skill_db = True
+
+            def find_candidates(self, cleaned_text):
+                lowered = cleaned_text.lower()
+                return [skill for skill in ('Python', 'SQL', 'Project Management') if skill.lower() in lowered]
+
+        results = {}
+        for enabled in (False, True):
+            config = type('PrefilterConfig', (SkillExtractionConfig,), {'TOKEN_PREFILTER': enabled})()
+            results[enabled] = SkillExtractor(config, backend=SkillDbBackend(config)).extract_skills_from_text(
+                self.DESCRIPTION
+            )
+
+        assert results[True].skills == results[False].skills == ['Python', 'SQL', 'Project Management']
+        assert results[True].prefilter_dropped_chars == len("Thanks!!") + len("We are who we are.")
+        assert results[False].prefilter_dropped_chars == 0
+
+
+class TestSectionTargeting:
+    """Test the requirements-section extraction scope"""
+
+    DESCRIPTION = (
+        "Acme builds logistics software with Kubernetes.\n"
+        "#### About Us\nWe run Docker workshops for the community.\n"
+        "#### Requirements\n- Python\n- SQL\n"
+        "#### Tooling\n- Git\n- Docker\n"
+        "#### Benefits\nFree Kubernetes training budget.\n"
+    )
+
+    def test_classifier_selects_skill_sections(self):
+        """Test boilerplate and prose are skipped once a skills section exists"""
+        from configurations.skill_config import SkillExtractionConfig
+        from services.skill.section_targeting import SectionClassifier
+        from utils.text_processing import TextProcessor
+
+        classifier = SectionClassifier.from_config(SkillExtractionConfig())
+        selected = classifier.select(TextProcessor.split_sections(self.DESCRIPTION))
+
+        assert selected == ["#### Requirements\n- Python\n- SQL", "#### Tooling\n- Git\n- Docker"]
+        assert classifier.select(["#### Benefits\nHealth"]) == ["#### Benefits\nHealth"]
+
+    def test_requirements_scope_per_call(self, app, skill_service):
+        """Test the scope can be chosen per call and only targeted sections are annotated"""
+        with app.app_context():
+            targeted = skill_service.process_job_description(self.DESCRIPTION, scope='requirements')
+            assert skill_service.extractor.calls == 2
+            assert targeted.extracted_skills == ['Python', 'SQL', 'Docker']
+
+            full = skill_service.process_job_description(self.DESCRIPTION)
+            assert full.extracted_skills == ['Kubernetes', 'Docker', 'Python', 'SQL']
+
+            invalid = skill_service.process_job_description(self.DESCRIPTION, scope='everything')
+            assert not invalid.success
@@ -4,6 +4,8 @@ Test utility functions
 import pytest
 from unittest.mock import Mock, patch
 from utils.latex import validate_latex_content
+from utils.text_processing import NoiseFilter, TextProcessor
+from configurations.skill_config import SkillExtractionConfig
 
 
 class TestLatex:
@@ -47,3 +49,45 @@ class TestLatex:
         \\end{document}
         """
         assert validate_latex_content(content) is False
+
+
+class TestNoiseFilter:
+    """Test the compiled skill noise filter"""
+
+    def test_filter_drops_noise(self):
+        """Test batch filtering keeps real skills in order"""
+        noise_filter = NoiseFilter.from_config(SkillExtractionConfig())
+        skills = ['Python', 'years of experience', '2024', 'R', 'ab', '',
+                  'hands on experience with Java', 'the and of', 'Machine Learning']
+        assert noise_filter.filter(skills) == ['Python', 'R', 'Machine Learning']
+
+    def test_pattern_needs_word_boundary(self):
+        """Test noise patterns only match whole words"""
+        noise_filter = NoiseFilter(['phd'], common_words=[])
+        assert noise_filter.is_noise('PhD in Physics')
+        assert not noise_filter.is_noise('phdtools')
+
+    def test_shared_instance(self):
+        """Test the same patterns reuse one compiled filter"""
+        config = SkillExtractionConfig()
+        assert NoiseFilter.from_config(config) is NoiseFilter.for_patterns(
+            list(config.NOISE_PATTERNS), set(config.COMMON_WORDS))
+        assert TextProcessor.is_noise_skill('full time', config.NOISE_PATTERNS, config.COMMON_WORDS)
+
+
+class TestSplitSections:
+    """Test splitting descriptions at '####' section headers"""
+
+    def test_splits_at_headers(self):
+        """Test each header starts a section and leading text is kept"""
+        text = "Intro line\n#### Requirements\n- Python\n\n#### Benefits\nHealth plan\n"
+
+        assert TextProcessor.split_sections(text) == [
+            "Intro line", "#### Requirements\n- Python", "#### Benefits\nHealth plan"
+        ]
+
+    def test_text_without_headers(self):
+        """Test text without headers is a single section"""
+        assert TextProcessor.split_sections("Python and SQL") == ["Python and SQL"]
+        assert TextProcessor.split_sections("   ") == ["   "]
+        assert TextProcessor.split_sections("") == []
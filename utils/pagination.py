@@ -0,0 +1,42 @@
+"""
+Opaque cursors for keyset pagination
+
+A cursor records the sort key of the row a page starts after (or ends
+before) and which way to read. It is URL-safe base64 of a small JSON
+document: clients pass it back unchanged, and a malformed cursor raises
+ValueError.
+"""
+import base64
+import binascii
+import json
+from typing import Any, List, Tuple
+
+NEXT = 'next'
+PREV = 'prev'
+
+
+def encode_cursor(direction: str, key: List[Any]) -> str:
+    """Cursor reading in direction ('next' or 'prev') from the row with this sort key"""
+    payload = json.dumps({'d': direction, 'k': key}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str, key_length: int) -> Tuple[str, List[Any]]:
+    """
+    Direction and sort key of a cursor
+
+    Raises:
+        ValueError: If the cursor is malformed or its key has another length
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (binascii.Error, UnicodeError, json.JSONDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {e}") from e
+
+    if not isinstance(payload, dict) or payload.get('d') not in (NEXT, PREV):
+        raise ValueError("Invalid cursor direction")
+    key = payload.get('k')
+    if not isinstance(key, list) or len(key) != key_length:
+        raise ValueError("Cursor does not match this listing")
+    return payload['d'], key
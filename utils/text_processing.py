@@ -1,5 +1,6 @@
 import re
-from typing import Set, List
+from functools import lru_cache
+from typing import FrozenSet, Iterable, List, Optional, Pattern, Set, Tuple
 
 from configurations.skill_config import SkillExtractionConfig
 
@@ -22,35 +23,96 @@ class TextProcessor:
         text = re.sub(r'[^\w\s\-\+\#\.\,\(\)]', ' ', text)
         
         return text
+
+    # Section headers emitted by the scraper's _enhance_headers
+    SECTION_HEADER_RE: Pattern[str] = re.compile(r'^[ \t]*#### ', re.MULTILINE)
+
+    @staticmethod
+    def split_sections(text: str) -> List[str]:
+        """Split a description into its '#### ' sections, each keeping its header line"""
+        if not text:
+            return []
+
+        starts = [match.start() for match in TextProcessor.SECTION_HEADER_RE.finditer(text)]
+        if not starts or starts[0] != 0:
+            starts.insert(0, 0)
+        bounds = zip(starts, starts[1:] + [len(text)])
+
+        sections = [text[start:end].strip() for start, end in bounds]
+        return [section for section in sections if section] or [text]
     
     @staticmethod
     def is_noise_skill(skill: str, noise_patterns: List[str], common_words: Set[str]) -> bool:
         """Check if a skill is likely noise/not a real skill"""
-        skill_lower = skill.lower().strip() if skill else ""  
-        if not skill_lower:  
+        return NoiseFilter.for_patterns(noise_patterns, common_words).is_noise(skill)
+
+
+class NoiseFilter:
+    """
+    Noise check compiled once from a set of noise patterns
+
+    All patterns are matched by a single word-bounded alternation instead of
+    one regex search per pattern, so checking a skill costs one scan of the
+    skill regardless of how many patterns are configured.
+    """
+
+    def __init__(self, noise_patterns: Iterable[str], common_words: Iterable[str],
+                 allowed_short_skills: Iterable[str] = SkillExtractionConfig.ALLOWED_SHORT_SKILLS):
+        patterns = tuple(noise_patterns)
+        self.noise_set: FrozenSet[str] = frozenset(patterns)
+        self.common_words: FrozenSet[str] = frozenset(common_words)
+        self.allowed_short_skills: FrozenSet[str] = frozenset(allowed_short_skills)
+
+        # Longest first so overlapping patterns prefer the longer match
+        alternation = '|'.join(re.escape(p) for p in sorted(self.noise_set, key=len, reverse=True))
+        self._pattern_re: Optional[Pattern[str]] = (
+            re.compile(rf"\b(?:{alternation})\b") if alternation else None
+        )
+
+    @classmethod
+    def from_config(cls, config: SkillExtractionConfig) -> 'NoiseFilter':
+        """Build the filter for an extraction config"""
+        return cls.for_patterns(config.NOISE_PATTERNS, config.COMMON_WORDS, config.ALLOWED_SHORT_SKILLS)
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _cached(noise_patterns: Tuple[str, ...], common_words: FrozenSet[str],
+                allowed_short_skills: FrozenSet[str]) -> 'NoiseFilter':
+        return NoiseFilter(noise_patterns, common_words, allowed_short_skills)
+
+    @classmethod
+    def for_patterns(cls, noise_patterns: Iterable[str], common_words: Iterable[str],
+                     allowed_short_skills: Iterable[str] = SkillExtractionConfig.ALLOWED_SHORT_SKILLS) -> 'NoiseFilter':
+        """Get a shared filter for these patterns, compiling it on first use"""
+        return cls._cached(tuple(noise_patterns), frozenset(common_words), frozenset(allowed_short_skills))
+
+    def is_noise(self, skill: str) -> bool:
+        """Check if a skill is likely noise/not a real skill"""
+        skill_lower = skill.lower().strip() if skill else ""
+        if not skill_lower:
             return True
-        
+
         # Check minimum length
-        if len(skill_lower) <= 2 and skill not in SkillExtractionConfig.ALLOWED_SHORT_SKILLS:
+        if len(skill_lower) <= 2 and skill not in self.allowed_short_skills:
             return True
-            
+
         # Check if it's just numbers
         if skill_lower.isdigit():
             return True
-        
-        # Check for exact matches with noise patterns
-        noise_set = set(noise_patterns) 
-        if skill_lower in noise_set:
+
+        # Check for exact matches, then patterns within the skill
+        if skill_lower in self.noise_set:
             return True
-        
-        # Check for patterns within the skill
-        for pattern in noise_patterns:
-            if re.search(rf"\b{re.escape(pattern)}\b", skill_lower):  
-                return True
-        
+        if self._pattern_re is not None and self._pattern_re.search(skill_lower):
+            return True
+
         # Check for skills with too many common words
         skill_words = set(skill_lower.split())
-        if len(skill_words.intersection(common_words)) > len(skill_words) / 2:
+        if len(skill_words & self.common_words) > len(skill_words) / 2:
             return True
-        
-        return False
\ No newline at end of file
+
+        return False
+
+    def filter(self, skills: Iterable[str]) -> List[str]:
+        """Return the skills that are not noise, in their original order"""
+        return [skill for skill in skills if not self.is_noise(skill)]